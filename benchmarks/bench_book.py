@@ -0,0 +1,74 @@
+"""
+Cost of holding and valuing a book of positions as option objects
+versus an `OptionBook`. \n
+Both compute the book value and the net delta of a mixed book of
+Black-Scholes, Black-76 and binary options.
+Cached intermediates of the option objects are discarded before every run,
+as after a market move.
+
+Usage: python benchmarks/bench_book.py [n_positions]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from blackscholes import InstrumentType, OptionBook
+
+
+def make_book(n: int, seed: int = 0) -> OptionBook:
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    return OptionBook(
+        kind=rng.integers(0, len(InstrumentType), n),
+        S=S,
+        K=S * rng.uniform(0.8, 1.25, n),
+        T=rng.uniform(0.1, 3.0, n),
+        r=rng.uniform(0.0, 0.05, n),
+        sigma=rng.uniform(0.1, 0.6, n),
+        q=rng.uniform(0.0, 0.03, n),
+        quantity=rng.integers(-10, 11, n),
+    )
+
+
+def bytes_per_position(make) -> float:
+    gc.collect()
+    tracemalloc.start()
+    held = make()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(held)
+
+
+def main(n_positions: int = 100_000):
+    book = make_book(n_positions)
+    options = [book.option(i) for i in range(len(book))]
+    quantity = book["quantity"].tolist()
+
+    def objects():
+        value = sum(weight * option.price() for weight, option in zip(quantity, options))
+        delta = sum(weight * option.delta() for weight, option in zip(quantity, options))
+        return value, delta
+
+    def columns():
+        return book.total_greeks(["price", "delta"])
+
+    print(f"{'':<16}{'ms':>10}{'bytes/position':>16}")
+    for name, func, make in [
+        ("objects", objects, lambda: [book.option(i) for i in range(len(book))]),
+        ("OptionBook", columns, lambda: make_book(n_positions)),
+    ]:
+        best = float("inf")
+        for _ in range(3):
+            for option in options:
+                option._clear_cache()
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<16}{best * 1e3:>10.1f}{bytes_per_position(make):>16.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,56 @@
+"""
+Throughput and peak resident memory of `price_chunked` on memory-mapped `.npy` columns. \n
+A dataset of n_rows Black-Scholes options is written to a temporary directory
+(5 float64 columns and 1 bool column, about 41 bytes per option), then priced
+with a range of chunk sizes, with and without releasing processed pages.
+Every run writes price, delta, gamma and vega to memory-mapped outputs.
+
+Usage: python benchmarks/bench_chunked.py [n_rows]
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from blackscholes import BlackScholesVectorized, create_output_memmaps, price_chunked
+
+
+def write_dataset(directory: str, n: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, make in [
+        ("S", lambda: rng.uniform(50.0, 150.0, n)),
+        ("K", lambda: rng.uniform(40.0, 180.0, n)),
+        ("T", lambda: rng.uniform(0.1, 3.0, n)),
+        ("sigma", lambda: rng.uniform(0.1, 0.6, n)),
+        ("q", lambda: rng.uniform(0.0, 0.05, n)),
+        ("is_call", lambda: rng.random(n) < 0.5),
+    ]:
+        path = os.path.join(directory, f"{name}.npy")
+        np.save(path, make())
+        columns[name] = path
+    return columns
+
+
+def main(n_rows: int = 5_000_000):
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_dataset(directory, n_rows)
+        output_directory = os.path.join(directory, "out")
+        os.mkdir(output_directory)
+        print(f"{n_rows:,} options, {sum(os.path.getsize(path) for path in paths.values()) / 1e6:,.0f} MB of inputs")
+        print(f"{'chunk size':>12}{'release':>9}{'M rows/s':>10}{'peak RSS MB':>13}")
+        for chunk_size in [4_096, 16_384, 65_536, 262_144, 1_048_576]:
+            for release_pages in [True, False]:
+                inputs = {name: np.load(path, mmap_mode="r") for name, path in paths.items()}
+                inputs["r"] = 0.01
+                outputs = create_output_memmaps(output_directory, ["price", "delta", "gamma", "vega"], n_rows)
+                stats = price_chunked(BlackScholesVectorized, inputs, outputs, chunk_size=chunk_size, release_pages=release_pages)
+                for output in outputs.values():
+                    output.flush()
+                del inputs, outputs
+                print(f"{chunk_size:>12,}{str(release_pages):>9}{stats.rows_per_second / 1e6:>10.2f}{stats.peak_rss_bytes / 1e6:>13.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,75 @@
+"""
+Throughput and peak memory of the vectorized engines with float64 and float32 inputs. \n
+n options are priced with their price, delta, gamma and vega by
+`BlackScholesVectorized` and `Black76Vectorized`. Peak memory is the largest
+amount allocated by NumPy during the call (inputs excluded), measured with tracemalloc.
+The maximum absolute error of the float32 price, relative to S, is reported as well.
+
+Usage: python benchmarks/bench_float32.py [n_options ...]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from blackscholes import Black76Vectorized, BlackScholesVectorized
+
+NAMES = ["price", "delta", "gamma", "vega"]
+
+
+def make_inputs(n: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    return dict(
+        S=S,
+        K=S * rng.uniform(0.8, 1.25, n),
+        T=rng.uniform(0.1, 3.0, n),
+        r=rng.uniform(0.0, 0.05, n),
+        sigma=rng.uniform(0.1, 0.6, n),
+        is_call=rng.random(n) < 0.5,
+    )
+
+
+def seconds(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_bytes(func) -> int:
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(*sizes: int):
+    print(f"{'engine':>22}{'options':>12}{'dtype':>9}{'M options/s':>13}{'peak MB':>10}{'max error / S':>15}")
+    for n in sizes or (100_000, 1_000_000, 10_000_000):
+        inputs = make_inputs(n)
+        for engine in [BlackScholesVectorized, Black76Vectorized]:
+            engine_inputs = dict(inputs)
+            if engine is Black76Vectorized:
+                engine_inputs["F"] = engine_inputs.pop("S")
+            expected = None
+            for dtype in [np.float64, np.float32]:
+                typed = {name: value.astype(dtype) if value.dtype.kind == "f" else value for name, value in engine_inputs.items()}
+
+                def run():
+                    return engine(**typed, dtype=dtype).get_greeks(NAMES)
+
+                elapsed = seconds(run)
+                peak = peak_bytes(run)
+                price = run()["price"].astype(np.float64)
+                expected = price if expected is None else expected
+                error = np.max(np.abs(price - expected) / inputs["S"])
+                print(f"{engine.__name__:>22}{n:>12,}{np.dtype(dtype).name:>9}{n / elapsed / 1e6:>13.2f}{peak / 1e6:>10.0f}{error:>15.1e}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
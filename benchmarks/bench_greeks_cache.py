@@ -0,0 +1,41 @@
+"""
+Time `get_all_greeks`, the fused `all_greeks` and a `get_greeks`
+selection on the scalar option classes.
+
+Every call constructs a fresh option, so the timings include
+computing the cached intermediates (d1, d2, PDF, CDF and discount factors) once.
+
+Usage: python benchmarks/bench_greeks_cache.py
+"""
+import timeit
+
+from blackscholes import (
+    BinaryCall,
+    Black76Call,
+    Black76Put,
+    BlackScholesCall,
+    BlackScholesPut,
+)
+
+HEDGING_GREEKS = ("delta", "gamma", "vanna", "charm")
+
+CASES = [
+    ("BlackScholesCall.get_all_greeks", lambda: BlackScholesCall(55.0, 50.0, 1.0, 0.0025, 0.15, 0.01).get_all_greeks()),
+    ("BlackScholesPut.get_all_greeks", lambda: BlackScholesPut(55.0, 50.0, 1.0, 0.0025, 0.15, 0.01).get_all_greeks()),
+    ("BlackScholesCall.all_greeks", lambda: BlackScholesCall(55.0, 50.0, 1.0, 0.0025, 0.15, 0.01).all_greeks()),
+    ("BlackScholesCall.get_greeks (4)", lambda: BlackScholesCall(55.0, 50.0, 1.0, 0.0025, 0.15, 0.01).get_greeks(HEDGING_GREEKS)),
+    ("Black76Call.get_all_greeks", lambda: Black76Call(55.0, 50.0, 1.0, 0.0025, 0.15).get_all_greeks()),
+    ("Black76Put.get_all_greeks", lambda: Black76Put(55.0, 50.0, 1.0, 0.0025, 0.15).get_all_greeks()),
+    ("BinaryCall.get_core_greeks", lambda: BinaryCall(55.0, 50.0, 1.0, 0.0025, 0.15).get_core_greeks()),
+]
+
+
+def main(number: int = 20_000, repeat: int = 5):
+    print(f"{'benchmark':<36}{'us/call':>10}")
+    for name, func in CASES:
+        best = min(timeit.repeat(func, number=number, repeat=repeat))
+        print(f"{name:<36}{best / number * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
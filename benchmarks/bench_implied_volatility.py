@@ -0,0 +1,77 @@
+"""
+Latency of the built-in implied volatility solvers against
+scipy's brentq wrapped around BlackScholesCall(...).price().
+
+Usage: python benchmarks/bench_implied_volatility.py [n_quotes]
+"""
+import sys
+import time
+
+import numpy as np
+from scipy.optimize import brentq
+
+from blackscholes import (
+    BlackScholesCall,
+    BlackScholesCallVectorized,
+    IncrementalImpliedVolatility,
+    implied_volatility,
+    implied_volatility_vectorized,
+)
+
+
+def make_quotes(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    K = S * rng.uniform(0.8, 1.25, n)
+    T = rng.uniform(0.1, 3.0, n)
+    r = rng.uniform(0.0, 0.05, n)
+    sigma = rng.uniform(0.1, 0.6, n)
+    q = rng.uniform(0.0, 0.03, n)
+    price = BlackScholesCallVectorized(S, K, T, r, sigma, q).price()
+    return price, S, K, T, r, q
+
+
+def brentq_implied_volatility(price, S, K, T, r, q):
+    return brentq(lambda sigma: BlackScholesCall(S, K, T, r, sigma, q).price() - price, 1e-4, 5.0, xtol=1e-12)
+
+
+def main(n_quotes: int = 5_000, n_chain: int = 40_000):
+    quotes = list(zip(*make_quotes(n_quotes)))
+    chain = make_quotes(n_chain)
+
+    def solver():
+        return [implied_volatility(*quote) for quote in quotes]
+
+    def scipy_brentq():
+        return [brentq_implied_volatility(*quote) for quote in quotes]
+
+    print(f"{'benchmark':<20}{'us/quote':>12}{'iterations':>12}")
+    iterations = np.mean([result.iterations for result in solver()])
+    for name, func, n_iter in [("implied_volatility", solver, f"{iterations:.2f}"), ("scipy brentq", scipy_brentq, "-")]:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20}{1e6 * elapsed / n_quotes:>12.2f}{n_iter:>12}")
+
+    start = time.perf_counter()
+    result = implied_volatility_vectorized(*chain)
+    elapsed = time.perf_counter() - start
+    print(f"{'vectorized':<20}{1e6 * elapsed / n_chain:>12.2f}{result.iterations.mean():>12.2f}")
+    print(f"{n_chain:,} quote chain solved in {1e3 * elapsed:.1f} ms")
+
+    # Ticks where a fraction of the quotes moved slightly
+    price, S, K, T, r, q = chain
+    rng = np.random.default_rng(1)
+    for moved_fraction in (0.05, 0.2, 1.0):
+        incremental = IncrementalImpliedVolatility(K, T, r, q)
+        incremental.update(price, S)
+        moved = rng.random(n_chain) < moved_fraction
+        new_price = np.where(moved, price * (1.0 + rng.normal(0.0, 1e-3, n_chain)), price)
+        start = time.perf_counter()
+        incremental.update(new_price, S)
+        elapsed = time.perf_counter() - start
+        print(f"tick with {moved_fraction:.0%} of quotes moved solved in {1e3 * elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
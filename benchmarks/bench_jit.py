@@ -0,0 +1,76 @@
+"""
+Price and core Greeks (delta, gamma, vega, theta, rho) of n options
+with three backends:
+- math: a scalar `BlackScholesCall` / `BlackScholesPut` object per option.
+Timed on at most 20,000 options and scaled to n, because it is linear in n.
+- numpy: `BlackScholesVectorized`.
+- numba: `BlackScholesNumba`, which fuses the formulas into one parallel loop.
+Only timed when numba is installed. The first call, which compiles the kernel, is not timed.
+
+Usage: python benchmarks/bench_jit.py [n_options ...]
+"""
+import sys
+import time
+
+import numpy as np
+
+from blackscholes import BlackScholesCall, BlackScholesNumba, BlackScholesPut, BlackScholesVectorized
+from blackscholes.jit import NUMBA_AVAILABLE
+
+NAMES = ["price", "delta", "gamma", "vega", "theta", "rho"]
+MAX_SCALAR_OPTIONS = 20_000
+
+
+def make_inputs(n: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    return dict(
+        S=S,
+        K=S * rng.uniform(0.8, 1.25, n),
+        T=rng.uniform(0.1, 3.0, n),
+        r=rng.uniform(0.0, 0.05, n),
+        sigma=rng.uniform(0.1, 0.6, n),
+        q=rng.uniform(0.0, 0.05, n),
+        is_call=rng.random(n) < 0.5,
+    )
+
+
+def seconds(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scalar(inputs: dict) -> list:
+    rows = zip(*(inputs[name].tolist() for name in ["S", "K", "T", "r", "sigma", "q", "is_call"]))
+    return [
+        (BlackScholesCall if is_call else BlackScholesPut)(S, K, T, r, sigma, q).get_greeks(NAMES)
+        for S, K, T, r, sigma, q, is_call in rows
+    ]
+
+
+def main(*sizes: int):
+    sizes = sizes or (1_000, 100_000, 10_000_000)
+    if NUMBA_AVAILABLE:
+        BlackScholesNumba(**make_inputs(10)).get_greeks(NAMES)
+    print(f"{'options':>12}{'math ms':>12}{'numpy ms':>12}{'numba ms':>12}{'numba vs numpy':>16}")
+    for n in sizes:
+        inputs = make_inputs(n)
+        repeat = 5 if n <= 100_000 else 1
+        sample = {name: value[:MAX_SCALAR_OPTIONS] for name, value in inputs.items()}
+        math_ms = seconds(lambda: scalar(sample), repeat) * n / min(n, MAX_SCALAR_OPTIONS) * 1e3
+        numpy_ms = seconds(lambda: BlackScholesVectorized(**inputs).get_greeks(NAMES), repeat) * 1e3
+        if NUMBA_AVAILABLE:
+            numba_ms = seconds(lambda: BlackScholesNumba(**inputs).get_greeks(NAMES), repeat) * 1e3
+            print(f"{n:>12,}{math_ms:>12.1f}{numpy_ms:>12.1f}{numba_ms:>12.1f}{numpy_ms / numba_ms:>15.2f}x")
+        else:
+            print(f"{n:>12,}{math_ms:>12.1f}{numpy_ms:>12.1f}{'n/a':>12}{'n/a':>16}")
+    if not NUMBA_AVAILABLE:
+        print("numba is not installed: pip install blackscholes[numba]")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""
+Accuracy and speed of the standard normal CDF tiers against `scipy.stats.norm.cdf`. \n
+Speed is measured on n values drawn from N(0, 2), accuracy on a grid from -40 to 40:
+- math: `StandardNormalMixin._cdf` (`math.erfc`) per value.
+Timed on at most 100,000 values and scaled to n, because it is linear in n.
+- full: `VectorizedStandardNormalMixin._cdf(x, "full")`, Cody's rational approximations.
+- fast: `VectorizedStandardNormalMixin._cdf(x, "fast")`, Abramowitz & Stegun 26.2.17.
+Prints the speedup of the fast tier over the full tier, which is not asserted in the tests
+because wall-clock timings are not reliable on shared machines.
+Also prices n options with `BlackScholesVectorized` with both accuracy tiers.
+
+Usage: python benchmarks/bench_normal.py [n_values]
+"""
+import sys
+import time
+
+import numpy as np
+from scipy.stats import norm
+
+from blackscholes import BlackScholesVectorized
+from blackscholes.base import StandardNormalMixin
+from blackscholes.vectorized import VectorizedStandardNormalMixin
+
+MAX_SCALAR_VALUES = 100_000
+
+
+def seconds(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n: int = 1_000_000):
+    rng = np.random.default_rng(0)
+    x = rng.normal(0.0, 2.0, n)
+    grid = np.linspace(-40.0, 40.0, 800_001)
+    expected = norm.cdf(grid)
+    # Below -37 the CDF underflows to 0
+    tail = (grid > -37.0) & (grid < -5.0)
+    scalar = x[:MAX_SCALAR_VALUES].tolist()
+    tiers = {
+        "scipy": (lambda: norm.cdf(x), expected),
+        "math": (lambda: [StandardNormalMixin._cdf(value) for value in scalar], np.array([StandardNormalMixin._cdf(value) for value in grid.tolist()])),
+        "full": (lambda: VectorizedStandardNormalMixin._cdf(x, "full"), VectorizedStandardNormalMixin._cdf(grid, "full")),
+        "fast": (lambda: VectorizedStandardNormalMixin._cdf(x, "fast"), VectorizedStandardNormalMixin._cdf(grid, "fast")),
+    }
+    print(f"CDF of {n:,} values")
+    print(f"{'tier':>6}{'ms':>10}{'max abs error':>15}{'rel error -37<x<-5':>20}")
+    timings = {}
+    for name, (func, values) in tiers.items():
+        elapsed = timings[name] = seconds(func) * (n / len(scalar) if name == "math" else 1.0)
+        abs_error = np.max(np.abs(values - expected))
+        rel_error = np.max(np.abs(values[tail] - expected[tail]) / expected[tail])
+        print(f"{name:>6}{elapsed * 1e3:>10.1f}{abs_error:>15.2e}{rel_error:>20.2e}")
+    print(f"fast tier speedup over full tier: {timings['full'] / timings['fast']:.1f}x")
+
+    S = rng.uniform(50.0, 150.0, n)
+    inputs = dict(S=S, K=S * rng.uniform(0.8, 1.25, n), T=rng.uniform(0.1, 3.0, n), r=0.01, sigma=rng.uniform(0.1, 0.6, n))
+    print(f"\nPrice and delta of {n:,} options")
+    prices = {}
+    for accuracy in ["full", "fast"]:
+        elapsed = seconds(lambda: BlackScholesVectorized(**inputs, accuracy=accuracy).get_greeks(["price", "delta"]))
+        prices[accuracy] = BlackScholesVectorized(**inputs, accuracy=accuracy).price()
+        print(f"{accuracy:>6}{elapsed * 1e3:>10.1f} ms")
+    print(f"max abs price difference: {np.max(np.abs(prices['fast'] - prices['full'])):.2e}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
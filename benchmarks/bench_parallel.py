@@ -0,0 +1,63 @@
+"""
+Scaling of `ParallelPricer` from 1 to max_workers worker processes and threads. \n
+Prices n_options Black-Scholes options (price, delta, gamma and vega) in a single process
+with `BlackScholesVectorized` and with a warm pool of every size for both backends.
+Threads share the arrays of the process, processes copy them through shared memory.
+Speedup is relative to the single process and efficiency is speedup / workers.
+Efficiency above ~1 worker per physical core is limited by memory bandwidth
+and by copying inputs and outputs through shared memory.
+
+Usage: python benchmarks/bench_parallel.py [n_options] [max_workers]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from blackscholes import BlackScholesVectorized, ParallelPricer
+
+NAMES = ["price", "delta", "gamma", "vega"]
+
+
+def make_inputs(n: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    return dict(
+        S=S,
+        K=S * rng.uniform(0.8, 1.25, n),
+        T=rng.uniform(0.1, 3.0, n),
+        r=0.01,
+        sigma=rng.uniform(0.1, 0.6, n),
+        q=rng.uniform(0.0, 0.05, n),
+        is_call=rng.random(n) < 0.5,
+    )
+
+
+def seconds(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_options: int = 4_000_000, max_workers: int = len(os.sched_getaffinity(0))):
+    inputs = make_inputs(n_options)
+    print(f"{n_options:,} options, {len(os.sched_getaffinity(0))} CPUs available")
+    single = seconds(lambda: BlackScholesVectorized(**inputs).get_greeks(NAMES))
+    print(f"{'backend':>8}{'workers':>8}{'seconds':>10}{'speedup':>10}{'efficiency':>12}")
+    print(f"{'single':>8}{1:>8}{single:>10.3f}{1.0:>10.2f}{1.0:>12.0%}")
+    for backend in ["process", "thread"]:
+        for workers in range(1, max_workers + 1):
+            with ParallelPricer(workers=workers, backend=backend) as pricer:
+                # Start the worker processes before timing
+                pricer.price(BlackScholesVectorized, make_inputs(workers))
+                elapsed = seconds(lambda: pricer.price(BlackScholesVectorized, inputs, NAMES))
+            speedup = single / elapsed
+            print(f"{backend:>8}{workers:>8}{elapsed:>10.3f}{speedup:>10.2f}{speedup / workers:>12.0%}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,78 @@
+"""
+Full revaluation of a Black-Scholes book over 21 spot shocks x 11 vol shocks x 3 time steps (693 scenarios). \n
+Compares `ScenarioGrid`, which shares intermediates that do not depend on a shocked input across scenarios,
+with repricing the book once per scenario, with one `BlackScholesVectorized` call on inputs broadcast
+to (positions, spot, vol, time), and with one `BlackScholesCall` object per position and scenario
+(timed on a sample of positions and scaled to the book).
+
+Usage: python benchmarks/bench_scenarios.py [n_positions]
+"""
+import sys
+import time
+
+import numpy as np
+
+from blackscholes import BlackScholesCall, BlackScholesVectorized, InstrumentType, OptionBook, ScenarioGrid
+
+
+def make_book(n: int, seed: int = 0) -> OptionBook:
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    return OptionBook(
+        kind=InstrumentType.BLACK_SCHOLES_CALL, S=S, K=S * rng.uniform(0.8, 1.25, n), T=rng.uniform(0.1, 3.0, n),
+        r=0.01, sigma=rng.uniform(0.1, 0.6, n), q=rng.uniform(0.0, 0.05, n),
+    )
+
+
+def best_of(func, repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(n_positions: int = 10_000):
+    book = make_book(n_positions)
+    grid = ScenarioGrid(np.linspace(-0.1, 0.1, 21), np.linspace(-0.05, 0.05, 11), [0.0, 1 / 365, 7 / 365])
+    scenarios = grid.scenarios()
+    S, K, T, r, sigma, q = (book[name] for name in ("S", "K", "T", "r", "sigma", "q"))
+
+    def per_scenario():
+        for spot, vol, step in zip(scenarios["spot"], scenarios["vol"], scenarios["time"]):
+            BlackScholesVectorized(S * (1.0 + spot), K, T - step, r, sigma + vol, q).price()
+
+    def broadcast():
+        shape = (n_positions, *grid.shape)
+        BlackScholesVectorized(
+            np.broadcast_to((S[:, None] * (1.0 + grid.spot_shocks))[:, :, None, None], shape),
+            K[:, None, None, None],
+            np.broadcast_to((T[:, None] - grid.time_steps)[:, None, None, :], shape),
+            r[:, None, None, None],
+            np.broadcast_to((sigma[:, None] + grid.vol_shocks)[:, None, :, None], shape),
+            q[:, None, None, None],
+        ).price()
+
+    sample = 20
+    start = time.perf_counter()
+    for i in range(sample):
+        for spot, vol, step in zip(scenarios["spot"], scenarios["vol"], scenarios["time"]):
+            BlackScholesCall(S=S[i] * (1.0 + spot), K=K[i], T=T[i] - step, r=r[i], sigma=sigma[i] + vol, q=q[i]).price()
+    scalar = (time.perf_counter() - start) * n_positions / sample
+
+    values = n_positions * len(grid)
+    print(f"{n_positions:,} positions x {len(grid)} scenarios = {values / 1e6:.1f}M values")
+    print(f"{'method':>26}{'seconds':>10}{'M values/s':>12}")
+    for name, seconds in [
+        ("ScenarioGrid.values", best_of(lambda: grid.values(book))),
+        ("ScenarioGrid.pnl", best_of(lambda: grid.pnl(book))),
+        ("broadcast inputs", best_of(broadcast)),
+        ("book per scenario", best_of(per_scenario)),
+        ("BlackScholesCall objects", scalar),
+    ]:
+        print(f"{name:>26}{seconds:>10.3f}{values / seconds / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,97 @@
+"""
+SPAN-style risk arrays and pre-trade margin checks for a book of Black-Scholes and Black-76 options
+on 200 underlyings. \n
+Times `span_risk_arrays` for the whole book, `SpanMargin.add`, and `SpanMargin.check` for a single order,
+compared to 16 scalar option objects per position (timed on a sample of positions and scaled to the book).
+
+Usage: python benchmarks/bench_span.py [n_positions]
+"""
+import sys
+import time
+
+import numpy as np
+
+from blackscholes import (
+    SPAN_SCENARIOS,
+    Black76Call,
+    Black76Put,
+    BlackScholesCall,
+    BlackScholesPut,
+    InstrumentType,
+    OptionBook,
+    SpanMargin,
+    span_risk_arrays,
+)
+
+_SCALAR_CLASSES = {
+    InstrumentType.BLACK_SCHOLES_CALL: BlackScholesCall,
+    InstrumentType.BLACK_SCHOLES_PUT: BlackScholesPut,
+    InstrumentType.BLACK_76_CALL: Black76Call,
+    InstrumentType.BLACK_76_PUT: Black76Put,
+}
+
+
+def make_book(n: int, seed: int = 0) -> OptionBook:
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    return OptionBook(
+        kind=rng.integers(0, 4, n), S=S, K=S * rng.uniform(0.8, 1.25, n), T=rng.uniform(0.05, 2.0, n),
+        r=0.01, sigma=rng.uniform(0.1, 0.6, n), quantity=rng.integers(-10, 11, n).astype(float),
+    )
+
+
+def scalar_risk_array(book: OptionBook, index: int, price_scan: float, vol_scan: float) -> list:
+    """Risk array of one position with one option object per scenario."""
+    row = book.positions[index]
+    option_cls = _SCALAR_CLASSES[InstrumentType(row["kind"])]
+    S, K, T, r, sigma = (row[name].item() for name in ("S", "K", "T", "r", "sigma"))
+    underlying = "F" if option_cls in (Black76Call, Black76Put) else "S"
+    current = option_cls(**{underlying: S}, K=K, T=T, r=r, sigma=sigma).price()
+    return [
+        -row["quantity"] * (0.35 if abs(price) == 3.0 else 1.0) * (
+            option_cls(**{underlying: S * (1.0 + price * price_scan)}, K=K, T=T, r=r, sigma=sigma + vol * vol_scan).price() - current
+        )
+        for price, vol in SPAN_SCENARIOS
+    ]
+
+
+def main(n_positions: int = 100_000):
+    book = make_book(n_positions)
+    rng = np.random.default_rng(1)
+    underlying = rng.integers(0, 200, n_positions)
+    price_scan = {name: 0.04 + 0.0004 * name for name in range(200)}
+    vol_scan = {name: 0.03 for name in range(200)}
+    scans = np.array([price_scan[name] for name in range(200)])[underlying]
+
+    start = time.perf_counter()
+    span_risk_arrays(book, scans, 0.03)
+    vectorized = time.perf_counter() - start
+    margin = SpanMargin(price_scan, vol_scan)
+    start = time.perf_counter()
+    margin.add(book, underlying)
+    add = time.perf_counter() - start
+    order = make_book(1, seed=2)
+    checks = []
+    for _ in range(20):
+        start = time.perf_counter()
+        margin.check(order, 7)
+        checks.append(time.perf_counter() - start)
+    sample = 200
+    start = time.perf_counter()
+    for i in range(sample):
+        scalar_risk_array(book, i, scans[i], 0.03)
+    scalar = (time.perf_counter() - start) * n_positions / sample
+
+    print(f"{n_positions:,} positions on 200 underlyings, 16 scenarios each")
+    print(f"{'method':>36}{'seconds':>10}")
+    for name, seconds in [
+        ("span_risk_arrays", vectorized),
+        ("SpanMargin.add", add),
+        ("SpanMargin.check (1 order, median)", float(np.median(checks))),
+        ("scalar option objects", scalar),
+    ]:
+        print(f"{name:>36}{seconds:>10.4f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""
+Throughput of `stream_quotes` for a range of batch sizes against
+a scalar implied volatility solve and option object per quote. \n
+Every quote is solved for its implied volatility at the mid price,
+and delta, gamma, vega and theta are evaluated at that volatility.
+
+Usage: python benchmarks/bench_streaming.py [n_quotes]
+"""
+import sys
+import time
+
+import numpy as np
+
+from blackscholes import (
+    BlackScholesCall,
+    BlackScholesPut,
+    BlackScholesVectorized,
+    Quote,
+    implied_volatility,
+    stream_quotes,
+)
+
+GREEKS = ["delta", "gamma", "vega", "theta"]
+
+
+def make_quotes(n: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    K = S * rng.uniform(0.8, 1.25, n)
+    T = rng.uniform(0.1, 3.0, n)
+    sigma = rng.uniform(0.1, 0.6, n)
+    is_call = rng.random(n) < 0.5
+    price = BlackScholesVectorized(S, K, T, 0.01, sigma, is_call=is_call).price()
+    return [
+        Quote(*row)
+        for row in zip(S.tolist(), K.tolist(), T.tolist(), [0.01] * n, (price - 0.01).tolist(), (price + 0.01).tolist(), is_call.tolist())
+    ]
+
+
+def per_quote(quotes: list) -> list:
+    results = []
+    for quote in quotes:
+        mid = 0.5 * (quote.bid + quote.ask)
+        sigma = implied_volatility(mid, quote.S, quote.K, quote.T, quote.r, quote.q, quote.is_call).sigma
+        option = (BlackScholesCall if quote.is_call else BlackScholesPut)(quote.S, quote.K, quote.T, quote.r, sigma, quote.q)
+        results.append({name: getattr(option, name)() for name in GREEKS})
+    return results
+
+
+def quotes_per_second(func, quotes: list) -> float:
+    start = time.perf_counter()
+    func(quotes)
+    return len(quotes) / (time.perf_counter() - start)
+
+
+def main(n_quotes: int = 20_000):
+    quotes = make_quotes(n_quotes)
+    print(f"{n_quotes:,} quotes, thousands of quotes per second")
+    print(f"{'per quote':<20}{quotes_per_second(per_quote, quotes) / 1e3:>8.0f}")
+    for batch_size in [1, 16, 64, 256, 1_024, 4_096]:
+        rate = quotes_per_second(lambda quotes: list(stream_quotes(quotes, GREEKS, batch_size=batch_size)), quotes)
+        print(f"{f'batch size {batch_size:,}':<20}{rate / 1e3:>8.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,123 @@
+"""
+Cost of evaluating option structures. \n
+Every preset structure is timed three ways:
+- object legs: one option object per leg, as the presets used to be built.
+- unshared legs: one `BlackScholesVectorized` book with every parameter broadcast to the legs,
+so expiry terms are computed per leg.
+- shared legs: the structure itself, whose legs share expiry terms (exp(-q*T), exp(-r*T), sqrt(T))
+and, for legs with the same strike, d1 and d2.
+A custom structure with many legs is timed the same way. The object loop is
+expensive there, so only run large leg counts when you have a few seconds to spare.
+
+Usage: python benchmarks/bench_structures.py [n_legs]
+"""
+import sys
+import time
+
+import numpy as np
+
+from blackscholes import (
+    BlackScholesBearSpread,
+    BlackScholesBullSpread,
+    BlackScholesButterflyLong,
+    BlackScholesButterflyShort,
+    BlackScholesCalendarCallSpread,
+    BlackScholesCalendarPutSpread,
+    BlackScholesCall,
+    BlackScholesIronButterflyLong,
+    BlackScholesIronButterflyShort,
+    BlackScholesIronCondorLong,
+    BlackScholesIronCondorShort,
+    BlackScholesStraddleLong,
+    BlackScholesStraddleShort,
+    BlackScholesStrangleLong,
+    BlackScholesStrangleShort,
+    BlackScholesStructure,
+    BlackScholesVectorized,
+)
+
+S, r, sigma = 55.0, 0.0025, 0.15
+
+PRESETS = {
+    "straddle long": lambda: BlackScholesStraddleLong(S, 50.0, 1.0, r, sigma),
+    "straddle short": lambda: BlackScholesStraddleShort(S, 50.0, 1.0, r, sigma),
+    "strangle long": lambda: BlackScholesStrangleLong(S, 40.0, 50.0, 1.0, r, sigma),
+    "strangle short": lambda: BlackScholesStrangleShort(S, 40.0, 50.0, 1.0, r, sigma),
+    "butterfly long": lambda: BlackScholesButterflyLong(S, 40.0, 50.0, 60.0, 1.0, r, sigma),
+    "butterfly short": lambda: BlackScholesButterflyShort(S, 40.0, 50.0, 60.0, 1.0, r, sigma),
+    "iron condor long": lambda: BlackScholesIronCondorLong(S, 20.0, 25.0, 45.0, 50.0, 1.0, r, sigma),
+    "iron condor short": lambda: BlackScholesIronCondorShort(S, 20.0, 25.0, 45.0, 50.0, 1.0, r, sigma),
+    "iron butterfly long": lambda: BlackScholesIronButterflyLong(S, 45.0, 50.0, 55.0, 1.0, r, sigma),
+    "iron butterfly short": lambda: BlackScholesIronButterflyShort(S, 45.0, 50.0, 55.0, 1.0, r, sigma),
+    "bull spread": lambda: BlackScholesBullSpread(S, 40.0, 50.0, 1.0, r, sigma),
+    "bear spread": lambda: BlackScholesBearSpread(S, 50.0, 40.0, 1.0, r, sigma),
+    "calendar call spread": lambda: BlackScholesCalendarCallSpread(S, 40.0, 50.0, 1.0, 0.5, r, sigma),
+    "calendar put spread": lambda: BlackScholesCalendarPutSpread(S, 40.0, 50.0, 1.0, 0.5, r, sigma),
+}
+
+
+def make_legs(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    quantity = rng.integers(-5, 6, n).astype(float)
+    K = rng.uniform(40.0, 70.0, n)
+    T = rng.choice([0.25, 0.5, 1.0, 2.0], n)
+    is_call = rng.random(n) < 0.5
+    return quantity, K, T, is_call
+
+
+def microseconds(func, number: int, repeat: int = 7) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def compare(name: str, make_structure, method: str, number: int) -> None:
+    structure = make_structure()
+    quantity = structure.quantity.tolist()
+    legs = [structure.leg(i) for i in range(len(structure))]
+    rows = [(type(leg), leg.S, leg.K, leg.T, leg.r, leg.sigma, leg.q) for leg in legs]
+    book = [np.array([row[i] for row in rows]) for i in range(1, 7)]
+    is_call = np.array([isinstance(leg, BlackScholesCall) for leg in legs])
+    names = list(legs[0].get_all_greeks()) if method == "get_all_greeks" else [method]
+
+    def object_legs():
+        options = [option_cls(*params) for option_cls, *params in rows]
+        return {
+            name: sum(weight * getattr(option, name)() for weight, option in zip(quantity, options))
+            for name in names
+        }
+
+    def unshared_legs():
+        greeks = BlackScholesVectorized(*book, is_call=is_call).get_greeks(names)
+        return {name: structure.quantity @ value for name, value in greeks.items()}
+
+    def shared_legs():
+        return getattr(make_structure(), method)()
+
+    times = [microseconds(func, number) for func in (object_legs, unshared_legs, shared_legs)]
+    print(
+        f"{name:<24}"
+        + "".join(f"{value:>11.1f}" for value in times)
+        + f"{times[0] / times[2]:>11.2f}x{times[1] / times[2]:>11.2f}x"
+    )
+
+
+def main(n_legs: int = 1_000):
+    quantity, K, T, is_call = make_legs(n_legs)
+    structures = dict(PRESETS)
+    structures[f"custom ({n_legs:,} legs)"] = lambda: BlackScholesStructure(
+        S, quantity, K, T, r, sigma, is_call=is_call
+    )
+    for method in ["price", "get_all_greeks"]:
+        print(f"\n{method}, us per structure (construction included)")
+        print(f"{'structure':<24}{'object':>11}{'unshared':>11}{'shared':>11}{'vs object':>12}{'vs unshared':>12}")
+        for name, make_structure in structures.items():
+            compare(name, make_structure, method, number=5 if name.startswith("custom") else 200)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""
+Cost of re-marking live option objects after a market move. \n
+Compares constructing new objects with the same inputs against `update`,
+which changes the inputs in place. Both are followed by a price and a delta,
+as a hedger would do on every tick.
+
+Usage: python benchmarks/bench_update.py [n_objects]
+"""
+import sys
+import time
+
+import numpy as np
+
+from blackscholes import BlackScholesCall, BlackScholesIronCondorLong
+
+r, sigma, T = 0.0025, 0.15, 1.0
+
+
+def seconds(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_objects: int = 50_000):
+    rng = np.random.default_rng(0)
+    K = rng.uniform(40.0, 70.0, n_objects).tolist()
+    S = rng.uniform(50.0, 60.0, n_objects).tolist()
+    calls = [BlackScholesCall(S_i, K_i, T, r, sigma) for S_i, K_i in zip(S, K)]
+    condors = [BlackScholesIronCondorLong(S_i, 20.0, 25.0, 45.0, 50.0, T, r, sigma) for S_i in S[: n_objects // 10]]
+
+    def construct_calls():
+        for S_i, K_i in zip(S, K):
+            option = BlackScholesCall(S_i, K_i, T, r, sigma)
+            option.price(), option.delta()
+
+    def update_calls():
+        for option, S_i in zip(calls, S):
+            option.update(S=S_i)
+            option.price(), option.delta()
+
+    def update_call_vols():
+        for option in calls:
+            option.update(sigma=0.16)
+            option.price(), option.delta()
+
+    def construct_condors():
+        for S_i in S[: n_objects // 10]:
+            condor = BlackScholesIronCondorLong(S_i, 20.0, 25.0, 45.0, 50.0, T, r, sigma)
+            condor.price(), condor.delta()
+
+    def update_condors():
+        for condor, S_i in zip(condors, S):
+            condor.update(S=S_i)
+            condor.price(), condor.delta()
+
+    print(f"{'case':<40}{'ms':>10}")
+    for name, func in [
+        (f"construct {n_objects:,} calls", construct_calls),
+        (f"update S of {n_objects:,} calls", update_calls),
+        (f"update sigma of {n_objects:,} calls", update_call_vols),
+        (f"construct {n_objects // 10:,} iron condors", construct_condors),
+        (f"update S of {n_objects // 10:,} iron condors", update_condors),
+    ]:
+        print(f"{name:<40}{seconds(func) * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""
+Throughput of the vectorized Black-Scholes and Black-76 engines against
+a Python loop that constructs one option object per row.
+
+Usage: python benchmarks/bench_vectorized.py [n_rows]
+"""
+import sys
+import time
+
+import numpy as np
+
+from blackscholes import Black76Call, Black76CallVectorized, BlackScholesCall, BlackScholesCallVectorized
+
+
+def make_book(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(50.0, 150.0, n)
+    K = S * rng.uniform(0.8, 1.25, n)
+    T = rng.uniform(0.1, 3.0, n)
+    r = rng.uniform(0.0, 0.05, n)
+    sigma = rng.uniform(0.1, 0.6, n)
+    q = rng.uniform(0.0, 0.03, n)
+    return S, K, T, r, sigma, q
+
+
+def rows_per_second(func, n_rows: int, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return n_rows / best
+
+
+def main(n_rows: int = 200_000):
+    book = make_book(n_rows)
+    # The object loop is much slower, so it runs on a smaller slice.
+    n_loop = min(n_rows, 20_000)
+    loop_book = [column[:n_loop] for column in book]
+
+    def loop_price():
+        return [BlackScholesCall(*row).price() for row in zip(*loop_book)]
+
+    def loop_all_greeks():
+        return [BlackScholesCall(*row).get_all_greeks() for row in zip(*loop_book)]
+
+    def loop_black_76_all_greeks():
+        return [Black76Call(*row[:5]).get_all_greeks() for row in zip(*loop_book)]
+
+    def vectorized_black_76_all_greeks():
+        return Black76CallVectorized(*book[:5]).all_greeks()
+
+    def vectorized_price():
+        return BlackScholesCallVectorized(*book).price()
+
+    def vectorized_all_greeks():
+        return BlackScholesCallVectorized(*book).get_all_greeks()
+
+    print(f"{'benchmark':<28}{'rows/sec':>16}")
+    for name, func, n in [
+        ("object loop price", loop_price, n_loop),
+        ("vectorized price", vectorized_price, n_rows),
+        ("object loop all greeks", loop_all_greeks, n_loop),
+        ("vectorized all greeks", vectorized_all_greeks, n_rows),
+        ("object loop black-76 greeks", loop_black_76_all_greeks, n_loop),
+        ("vectorized black-76 greeks", vectorized_black_76_all_greeks, n_rows),
+    ]:
+        print(f"{name:<28}{rows_per_second(func, n):>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -1,5 +1,6 @@
 from .call import BlackScholesCall, Black76Call, BinaryCall
 from .put import BlackScholesPut, Black76Put, BinaryPut
+from .structure import BlackScholesStructure
 from .straddle import BlackScholesStraddleLong, BlackScholesStraddleShort
 from .strangle import BlackScholesStrangleLong, BlackScholesStrangleShort
 from .butterfly import BlackScholesButterflyLong, BlackScholesButterflyShort
@@ -10,6 +11,34 @@ from .iron_butterfly import (
     BlackScholesIronButterflyLong,
     BlackScholesIronButterflyShort,
 )
+from .vectorized import (
+    BlackScholesVectorized,
+    BlackScholesCallVectorized,
+    BlackScholesPutVectorized,
+    Black76Vectorized,
+    Black76CallVectorized,
+    Black76PutVectorized,
+    BinaryVectorized,
+    BinaryCallVectorized,
+    BinaryPutVectorized,
+    InputError,
+    validate_inputs,
+)
+from .jit import Black76Numba, BlackScholesNumba
+from .book import InstrumentType, OptionBook
+from .chunked import ChunkedPricingStats, create_output_memmaps, price_chunked
+from .parallel import ParallelPricer, price_parallel
+from .implied_volatility import (
+    IncrementalImpliedVolatility,
+    ImpliedVolatilityResult,
+    ImpliedVolatilityResultVectorized,
+    ImpliedVolatilityStatus,
+    implied_volatility,
+    implied_volatility_vectorized,
+)
+from .streaming import PricedQuote, Quote, astream_quotes, price_quotes, stream_quotes
+from .scenarios import MIN_SHOCKED_SIGMA, ScenarioGrid
+from .span import SPAN_SCENARIOS, SpanMargin, span_risk_arrays
 
 __all__ = [
     "BlackScholesCall",
@@ -18,6 +47,7 @@ __all__ = [
     "BlackScholesPut",
     "Black76Put",
     "BinaryPut",
+    "BlackScholesStructure",
     "BlackScholesStraddleLong",
     "BlackScholesStraddleShort",
     "BlackScholesStrangleLong",
@@ -32,4 +62,40 @@ __all__ = [
     "BlackScholesCalendarPutSpread",
     "BlackScholesIronButterflyLong",
     "BlackScholesIronButterflyShort",
+    "BlackScholesVectorized",
+    "BlackScholesCallVectorized",
+    "BlackScholesPutVectorized",
+    "Black76Vectorized",
+    "Black76CallVectorized",
+    "Black76PutVectorized",
+    "BinaryVectorized",
+    "BinaryCallVectorized",
+    "BinaryPutVectorized",
+    "InputError",
+    "validate_inputs",
+    "BlackScholesNumba",
+    "Black76Numba",
+    "InstrumentType",
+    "OptionBook",
+    "price_chunked",
+    "create_output_memmaps",
+    "ChunkedPricingStats",
+    "ParallelPricer",
+    "price_parallel",
+    "implied_volatility",
+    "ImpliedVolatilityResult",
+    "ImpliedVolatilityStatus",
+    "implied_volatility_vectorized",
+    "ImpliedVolatilityResultVectorized",
+    "IncrementalImpliedVolatility",
+    "Quote",
+    "PricedQuote",
+    "price_quotes",
+    "stream_quotes",
+    "astream_quotes",
+    "ScenarioGrid",
+    "MIN_SHOCKED_SIGMA",
+    "SPAN_SCENARIOS",
+    "SpanMargin",
+    "span_risk_arrays",
 ]
@@ -1,25 +1,389 @@
 from abc import ABC, abstractmethod
-from math import erf, exp, log, pi, sqrt
-from typing import Dict
+from functools import lru_cache, partial
+from math import erfc, exp, log, pi, sqrt
+from types import MemberDescriptorType
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+_INV_SQRT_2 = 0.7071067811865475244008443621048
+_INV_SQRT_2PI = 0.398942280401432677939946059934
+_SQRT_PI_2 = sqrt(0.5 * pi)
+# Above this, erfc(z) underflows and erfc(z) * exp(z**2) uses its asymptotic series
+_ERFCX_ASYMPTOTIC = 26.0
 
 
 class StandardNormalMixin:
     """
-    Fast PDF and CDF calculations for standard normal distribution.
+    Fast PDF and CDF calculations for standard normal distribution. \n
+    The CDF uses `math.erfc`, which keeps full double precision in both tails.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def _pdf(x: float) -> float:
         """PDF of standard normal distribution."""
-        return exp(-(x**2) / 2.0) / sqrt(2.0 * pi)
+        return exp(-0.5 * x * x) * _INV_SQRT_2PI
 
     @staticmethod
-    def _cdf(x):
+    def _cdf(x: float) -> float:
         """CDF of standard normal distribution."""
-        return (1.0 + erf(x / sqrt(2.0))) / 2.0
+        return 0.5 * erfc(-x * _INV_SQRT_2)
+
+    @staticmethod
+    def _mills_ratio(x: float) -> float:
+        """
+        Mills ratio CDF(-x) / PDF(x) for x >= 0, with full relative precision
+        where CDF(-x) and PDF(x) are too small to divide (or underflow).
+        """
+        z = x * _INV_SQRT_2
+        if z > _ERFCX_ASYMPTOTIC:
+            # erfc(z) * exp(z**2) = (1 - 1/(2z^2) + 1*3/(2z^2)^2 - ...) / (z * sqrt(pi))
+            term = total = 1.0
+            for n in range(1, 9):
+                term *= -(2 * n - 1) / (2.0 * z * z)
+                total += term
+            return _SQRT_PI_2 * total / (z * sqrt(pi))
+        # exp(z**2) in two factors, as z_high**2 is exact, so rounding in z**2 is not amplified
+        z_high = int(z * 16.0) / 16.0
+        return _SQRT_PI_2 * erfc(z) * exp(z_high * z_high) * exp((z - z_high) * (z + z_high))
+
+
+class BlackScholesGreeks(NamedTuple):
+    """All Greeks of the Black-Scholes-Merton model, as returned by `all_greeks`."""
+
+    delta: float
+    spot_delta: float
+    gamma: float
+    vega: float
+    theta: float
+    epsilon: float
+    rho: float
+    lambda_greek: float
+    vanna: float
+    charm: float
+    vomma: float
+    veta: float
+    phi: float
+    speed: float
+    zomma: float
+    color: float
+    ultima: float
+    dual_delta: float
+    dual_gamma: float
+    alpha: float
+
+
+def _black_scholes_greeks(
+    S, K, T, r, sigma, q, sign, sqrt_T, sigma_sqrt_T, d1, d2,
+    pdf_d1, pdf_d2, cdf_sign_d1, cdf_sign_d2, discount_q, discount_r, price,
+) -> BlackScholesGreeks:
+    """
+    Fused evaluation of all Black-Scholes-Merton Greeks from one set of intermediates. \n
+    Only uses arithmetic, so it works on floats and NumPy arrays alike.
+
+    :param sign: 1 for calls and -1 for puts \n
+    :param cdf_sign_d1: CDF of sign * d1 \n
+    :param cdf_sign_d2: CDF of sign * d2 \n
+    :param price: Option price as returned by `price`, so that lambda_greek matches `lambda_greek`
+    """
+    delta = sign * discount_q * cdf_sign_d1
+    gamma = discount_q * pdf_d1 / (S * sigma_sqrt_T)
+    vega = S * discount_q * pdf_d1 * sqrt_T
+    theta = (
+        -discount_q * S * pdf_d1 * sigma / (2.0 * sqrt_T)
+        - sign * r * K * discount_r * cdf_sign_d2
+        + sign * q * S * discount_q * cdf_sign_d1
+    )
+    d1d2 = d1 * d2
+    carry_term = (2.0 * (r - q) * T - d2 * sigma_sqrt_T) / sigma_sqrt_T
+    dual_gamma = discount_r * pdf_d2 / (K * sigma_sqrt_T)
+    # Positional construction is noticeably faster than keywords for NamedTuples
+    return BlackScholesGreeks(
+        delta,  # delta
+        delta / discount_r,  # spot_delta
+        gamma,  # gamma
+        vega,  # vega
+        theta,  # theta
+        -sign * S * T * discount_q * cdf_sign_d1,  # epsilon
+        sign * K * T * discount_r * cdf_sign_d2,  # rho
+        delta * S / price,  # lambda_greek
+        -discount_q * pdf_d1 * d2 / sigma,  # vanna
+        sign * q * discount_q * cdf_sign_d1 - discount_q * pdf_d1 * carry_term / (2.0 * T),  # charm
+        vega * d1d2 / sigma,  # vomma
+        -S * discount_q * pdf_d1 * sqrt_T * (q + (r - q) * d1 / sigma_sqrt_T - (1.0 + d1d2) / (2.0 * T)),  # veta
+        dual_gamma,  # phi
+        -gamma / S * (d1 / sigma_sqrt_T + 1.0),  # speed
+        gamma * (d1d2 - 1.0) / sigma,  # zomma
+        -discount_q * pdf_d1 / (2.0 * S * T * sigma_sqrt_T) * (2.0 * q * T + 1.0 + carry_term * d1),  # color
+        -vega / sigma**2 * (d1d2 * (1.0 - d1d2) + d1 * d1 + d2 * d2),  # ultima
+        discount_r * cdf_sign_d2,  # dual_delta
+        dual_gamma,  # dual_gamma
+        abs(theta) / (gamma + 1e-9),  # alpha
+    )
+
+
+def _tail_safe_price(sign, d1, d2, forward, strike, pdf_d1, cdf_sign_d1, cdf_sign_d2, mills_ratio) -> float:
+    """
+    Undiscounted price sign * (forward * CDF(sign * d1) - strike * CDF(sign * d2)) of a call (sign=1) or put (sign=-1). \n
+    Out of the money, the two terms nearly cancel, and rounding in d1 and d2 is amplified
+    into the relative error of the price. Since forward * PDF(d1) = strike * PDF(d2), the price is then
+    forward * PDF(d1) times the difference of the Mills ratios of -sign * d1 and -sign * d2,
+    which keeps the relative precision of tiny prices in the far wings.
+
+    :param forward: Forward value of the asset, ex. S * exp(-q * T) \n
+    :param strike: Forward value of the strike, ex. K * exp(-r * T) \n
+    :param mills_ratio: `StandardNormalMixin._mills_ratio`
+    """
+    if sign * d1 <= 0.0 and sign * d2 <= 0.0:
+        return sign * forward * pdf_d1 * (mills_ratio(-sign * d1) - mills_ratio(-sign * d2))
+    return sign * (forward * cdf_sign_d1 - strike * cdf_sign_d2)
+
+
+class Black76Greeks(NamedTuple):
+    """All Greeks of the Black-76 model, as returned by `all_greeks`."""
+
+    delta: float
+    gamma: float
+    vega: float
+    theta: float
+    rho: float
+    vanna: float
+    charm: float
+    vomma: float
+    veta: float
+    speed: float
+    zomma: float
+    color: float
+    ultima: float
+    alpha: float
+
+
+def _black_76_greeks(
+    F, K, T, r, sigma, sign, sqrt_T, sigma_sqrt_T, d1, d2,
+    pdf_d1, cdf_sign_d1, cdf_sign_d2, discount_r, price,
+) -> Black76Greeks:
+    """
+    Fused evaluation of all Black-76 Greeks from one set of intermediates. \n
+    Only uses arithmetic, so it works on floats and NumPy arrays alike.
+
+    :param sign: 1 for calls and -1 for puts \n
+    :param cdf_sign_d1: CDF of sign * d1 \n
+    :param cdf_sign_d2: CDF of sign * d2 \n
+    :param price: Option price as returned by `price`, so that theta and rho match `theta` and `rho`
+    """
+    delta = sign * discount_r * cdf_sign_d1
+    gamma = discount_r * pdf_d1 / (F * sigma_sqrt_T)
+    vega = F * discount_r * pdf_d1 * sqrt_T
+    theta = -F * discount_r * pdf_d1 * sigma / (2.0 * sqrt_T) + r * price
+    d1d2 = d1 * d2
+    return Black76Greeks(
+        delta,  # delta
+        gamma,  # gamma
+        vega,  # vega
+        theta,  # theta
+        -T * price,  # rho
+        -discount_r * pdf_d1 * d2 / sigma,  # vanna
+        r * delta + discount_r * pdf_d1 * d2 / (2.0 * T),  # charm
+        vega * d1d2 / sigma,  # vomma
+        -vega * (r - (1.0 + d1d2) / (2.0 * T)),  # veta
+        -gamma / F * (d1 / sigma_sqrt_T + 1.0),  # speed
+        gamma * (d1d2 - 1.0) / sigma,  # zomma
+        -gamma / (2.0 * T) * (2.0 * r * T + 1.0 - d1d2),  # color
+        -vega / sigma**2 * (d1d2 * (1.0 - d1d2) + d1 * d1 + d2 * d2),  # ultima
+        abs(theta) / (gamma + 1e-9),  # alpha
+    )
+
+
+class _cached:
+    """
+    Intermediate value that is computed on first access and then stored on the
+    instance, so that repeated reads are plain attribute lookups. \n
+    Stored values are discarded by `CachedIntermediatesMixin` when an input
+    they depend on changes. Without `depends_on`, the value depends on every input.
+    """
+
+    def __init__(self, func: Callable, depends_on: Optional[Tuple[str, ...]] = None):
+        self.func = func
+        self.depends_on = depends_on
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+
+def _cached_on(*depends_on: str) -> Callable[[Callable], _cached]:
+    """
+    `_cached` intermediate that only depends on the given inputs and intermediates.
+
+    :param depends_on: Names of inputs (ex. "T") and cached intermediates (ex. "_sqrt_T")
+    """
+    return lambda func: _cached(func, depends_on)
+
+
+def _set_instance_dict_item(instance, value, name: str) -> None:
+    instance.__dict__[name] = value
+
+
+class CachedIntermediatesMixin:
+    """
+    Caches intermediate values (d1, d2, PDF, CDF and discount factors)
+    that are shared between the price and Greeks of an option. \n
+    When one of the attributes in `_inputs` is reassigned or updated with `update`,
+    only the intermediates that depend on it are discarded. \n
+    Inputs may be stored in `__slots__`. Intermediates are always stored in the instance `__dict__`.
+    """
+
+    __slots__ = ()
+    _inputs: Tuple[str, ...] = ()
+    _cached_names: Tuple[str, ...] = ()
+    # Cached intermediates that depend (directly or through other intermediates) on each input
+    _dependents: Dict[str, Tuple[str, ...]] = {}
+    # Checks that `update` applies to new input values, as {name: (check, error message)}
+    _input_checks: Dict[str, Tuple[Callable, str]] = {}
+    # Functions that assign each input without going through `__setattr__`
+    _input_setters: Dict[str, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cached = {
+            name: attr
+            for klass in reversed(cls.__mro__)
+            for name, attr in vars(klass).items()
+            if isinstance(attr, _cached)
+        }
+        cls._cached_names = tuple(cached)
+
+        def inputs_of(name: str) -> set:
+            depends_on = cached[name].depends_on
+            if depends_on is None:
+                return set(cls._inputs)
+            return set().union(*(inputs_of(dep) if dep in cached else {dep} for dep in depends_on))
+
+        inputs = {name: inputs_of(name) for name in cached}
+        cls._dependents = {
+            input_name: tuple(name for name in cached if input_name in inputs[name]) for input_name in cls._inputs
+        }
+        # Inputs in slots are set with their slot descriptor, which is cheaper than object.__setattr__
+        cls._input_setters = {
+            name: getattr(cls, name).__set__
+            if isinstance(getattr(cls, name, None), MemberDescriptorType)
+            else partial(_set_instance_dict_item, name=name)
+            for name in cls._inputs
+        }
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        dependents = self._dependents.get(name)
+        if dependents is not None:
+            instance_dict = self.__dict__
+            for cached_name in dependents:
+                instance_dict.pop(cached_name, None)
+
+    def update(self, **inputs) -> None:
+        """
+        Change inputs in place, ex. `option.update(S=56.0, sigma=0.16)`. \n
+        Only the new values are validated, and only the intermediates
+        that depend on the changed inputs are computed again.
+        This is much cheaper than constructing a new object on every market move.
+
+        :param inputs: New values of inputs (ex. S, K, T, r, sigma or q)
+        """
+        inputs = self._checked_inputs(inputs)
+        self._set_inputs(**inputs)
+        instance_dict = self.__dict__
+        dependents = self._dependents
+        for name in inputs:
+            for cached_name in dependents[name]:
+                if cached_name in instance_dict:
+                    del instance_dict[cached_name]
+
+    def _checked_inputs(self, inputs: Dict[str, float]) -> Dict[str, float]:
+        """Validate new input values for `update`."""
+        checks = self._input_checks
+        for name, value in inputs.items():
+            if name not in self._dependents:
+                raise ValueError(f"Unknown input '{name}' for {type(self).__name__}. Choose from {list(self._inputs)}.")
+            if name in checks:
+                check, message = checks[name]
+                if not check(value):
+                    raise ValueError(f"{message} Got '{value}'")
+        return inputs
+
+    def _set_inputs(self, **inputs) -> None:
+        """Assign inputs without going through `__setattr__` (used on construction)."""
+        setters = self._input_setters
+        for name, value in inputs.items():
+            setters[name](self, value)
+
+    def _clear_cache(self) -> None:
+        """Discard all cached intermediates."""
+        instance_dict = self.__dict__
+        for name in self._cached_names:
+            instance_dict.pop(name, None)
+
+    def _share_cache(self, source: "CachedIntermediatesMixin", names: Iterable[str]) -> None:
+        """
+        Reuse intermediates of `source` instead of computing them again. \n
+        They are computed on `source` if needed. The caller guarantees that
+        the intermediates only depend on inputs that both instances have in common.
+        """
+        self.__dict__.update({name: getattr(source, name) for name in names})
+
 
+# Checks on Black-Scholes and binary option inputs, used by `update`
+_BLACK_SCHOLES_INPUT_CHECKS = {
+    "S": (lambda S: S > 0.0, "Asset price (S) needs to be larger than 0."),
+    "K": (lambda K: K > 0.0, "Strike price (K) needs to be larger than 0."),
+    "T": (lambda T: T > 0.0, "Time to maturity (T) needs to be larger than 0."),
+    "sigma": (lambda sigma: sigma > 0.0, "Volatility (sigma) needs to be larger than 0."),
+    "q": (lambda q: q >= 0.0, "Annual dividend yield (q) cannot be negative."),
+}
 
-class BlackScholesBase(ABC, StandardNormalMixin):
+
+class GreekPlan:
+    """
+    Evaluation plan for a selection of Greeks on one option class. \n
+    Greek names are validated and resolved to methods once, when the plan is compiled.
+    Evaluation reads d1, d2, PDF, CDF and discount factors from the option's
+    intermediate cache, so only the intermediates that the selection needs
+    are computed, and each of them exactly once.
+
+    :param option_cls: Option class to evaluate (ex. BlackScholesCall) \n
+    :param names: Names of the Greeks (or "price") to evaluate
+    """
+
+    def __init__(self, option_cls: type, names: Tuple[str, ...]):
+        unknown = [name for name in names if name not in option_cls._greek_names]
+        if unknown:
+            raise ValueError(
+                f"Unknown Greek(s) {unknown} for {option_cls.__name__}. "
+                f"Choose from {sorted(option_cls._greek_names)}."
+            )
+        self.option_cls = option_cls
+        self.names = names
+        self._steps = tuple((name, getattr(option_cls, name)) for name in names)
+
+    def __call__(self, option) -> Dict[str, float]:
+        """Evaluate the selected Greeks for `option`."""
+        return {name: method(option) for name, method in self._steps}
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile(option_cls: type, names: Tuple[str, ...]) -> "GreekPlan":
+        """
+        Compiled plans are cached per option class and selection. \n
+        Selections keep their order, so the cache is bounded for callers that build many different ones.
+        """
+        return GreekPlan(option_cls, names)
+
+
+class BlackScholesBase(ABC, CachedIntermediatesMixin, StandardNormalMixin):
     """
     Base functionality to calculate (European) prices
     and Greeks with the Black-Scholes-Merton formula.
@@ -32,6 +396,15 @@ class BlackScholesBase(ABC, StandardNormalMixin):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    # Inputs are stored in slots. The `__dict__` for cached intermediates
+    # is only created once the first intermediate is computed.
+    __slots__ = ("S", "K", "T", "r", "sigma", "q", "__dict__")
+    _inputs = ("S", "K", "T", "r", "sigma", "q")
+    _input_checks = _BLACK_SCHOLES_INPUT_CHECKS
+    # 1 for calls and -1 for puts. Set by subclasses that support `all_greeks`.
+    _sign: float
+    _greek_names = frozenset(BlackScholesGreeks._fields) | {"price", "in_the_money"}
+
     def __init__(self, S: float, K: float, T: float, r: float, sigma: float, q: float):
         # Parameter checks
         assert S > 0.0, f"Asset price (S) needs to be larger than 0. Got '{S}'"
@@ -41,7 +414,7 @@ class BlackScholesBase(ABC, StandardNormalMixin):
             sigma > 0.0
         ), f"Volatility (sigma) needs to be larger than 0. Got '{sigma}'"
         assert q >= 0.0, f"Annual dividend yield (q) cannot be negative. Got '{q}'"
-        self.S, self.K, self.T, self.r, self.sigma, self.q = S, K, T, r, sigma, q
+        self._set_inputs(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
 
     @abstractmethod
     def price(self) -> float:
@@ -77,27 +450,19 @@ class BlackScholesBase(ABC, StandardNormalMixin):
         """
         Rate of change in delta with respect to the underlying asset price (2nd derivative).
         """
-        return (
-            exp(-self.q * self.T)
-            * self._pdf(self._d1)
-            / (self.S * self.sigma * sqrt(self.T))
-        )
+        return self._discount_q * self._pdf_d1 / (self.S * self._sigma_sqrt_T)
 
     def dual_gamma(self) -> float:
         """
         Rate of change in delta with respect to the strike price (2nd derivative).
         """
-        return (
-            exp(-self.r * self.T)
-            * self._pdf(self._d2)
-            / (self.K * self.sigma * sqrt(self.T))
-        )
+        return self._discount_r * self._pdf_d2 / (self.K * self._sigma_sqrt_T)
 
     def vega(self) -> float:
         """
         Rate of change in option price with respect to the volatility of the asset.
         """
-        return self.S * self._pdf(self._d1) * sqrt(self.T)
+        return self.S * self._discount_q * self._pdf_d1 * self._sqrt_T
 
     @abstractmethod
     def theta(self) -> float:
@@ -128,7 +493,7 @@ class BlackScholesBase(ABC, StandardNormalMixin):
 
     def vanna(self) -> float:
         """Sensitivity of delta with respect to change in volatility."""
-        return -self._pdf(self._d1) * self._d2 / self.sigma
+        return -self._discount_q * self._pdf_d1 * self._d2 / self.sigma
 
     @abstractmethod
     def charm(self) -> float:
@@ -143,12 +508,12 @@ class BlackScholesBase(ABC, StandardNormalMixin):
         """Rate of change in `vega` with respect to time."""
         return (
             -self.S
-            * exp(-self.q * self.T)
-            * self._pdf(self._d1)
-            * sqrt(self.T)
+            * self._discount_q
+            * self._pdf_d1
+            * self._sqrt_T
             * (
                 self.q
-                + (self.r - self.q) * self._d1 / (self.sigma * sqrt(self.T))
+                + (self.r - self.q) * self._d1 / self._sigma_sqrt_T
                 - (1.0 + self._d1 * self._d2) / (2.0 * self.T)
             )
         )
@@ -159,22 +524,13 @@ class BlackScholesBase(ABC, StandardNormalMixin):
         Breeden-Litzenberger uses quoted option prices
         to estimate risk-neutral probabilities.
         """
-        sigma2 = self.sigma**2
-        exp_factor = (
-            -1.0
-            / (2.0 * sigma2 * self.T)
-            * (log(self.K / self.S) - ((self.r - self.q) - 0.5 * sigma2) * self.T) ** 2
-        )
-        return (
-            exp(-self.r * self.T)
-            * (1.0 / self.K)
-            * (1.0 / sqrt(2.0 * pi * sigma2 * self.T))
-            * exp(exp_factor)
-        )
+        # The exponent of the Breeden-Litzenberger density reduces to -d2**2 / 2,
+        # so phi shares its intermediates with dual gamma.
+        return self._discount_r * self._pdf_d2 / (self.K * self._sigma_sqrt_T)
 
     def speed(self) -> float:
         """Rate of change in Gamma with respect to change in the underlying price."""
-        return -self.gamma() / self.S * (self._d1 / (self.sigma * sqrt(self.T)) + 1.0)
+        return -self.gamma() / self.S * (self._d1 / self._sigma_sqrt_T + 1.0)
 
     def zomma(self) -> float:
         """Rate of change of gamma with respect to changes in volatility."""
@@ -183,17 +539,14 @@ class BlackScholesBase(ABC, StandardNormalMixin):
     def color(self) -> float:
         """Rate of change of gamma over time."""
         return (
-            -exp(-self.q * self.T)
-            * self._pdf(self._d1)
-            / (2.0 * self.S * self.T * self.sigma * sqrt(self.T))
+            -self._discount_q
+            * self._pdf_d1
+            / (2.0 * self.S * self.T * self._sigma_sqrt_T)
             * (
                 2.0 * self.q * self.T
                 + 1.0
-                + (
-                    2.0 * (self.r - self.q) * self.T
-                    - self._d2 * self.sigma * sqrt(self.T)
-                )
-                / (self.sigma * sqrt(self.T))
+                + (2.0 * (self.r - self.q) * self.T - self._d2 * self._sigma_sqrt_T)
+                / self._sigma_sqrt_T
                 * self._d1
             )
         )
@@ -241,43 +594,104 @@ class BlackScholesBase(ABC, StandardNormalMixin):
     def get_all_greeks(self) -> Dict[str, float]:
         """Retrieve all Greeks for the Black-Scholes-Merton model
         implemented as a dictionary."""
-        return {
-            "delta": self.delta(),
-            "spot_delta": self.spot_delta(),
-            "gamma": self.gamma(),
-            "vega": self.vega(),
-            "theta": self.theta(),
-            "epsilon": self.epsilon(),
-            "rho": self.rho(),
-            "lambda_greek": self.lambda_greek(),
-            "vanna": self.vanna(),
-            "charm": self.charm(),
-            "vomma": self.vomma(),
-            "veta": self.veta(),
-            "phi": self.phi(),
-            "speed": self.speed(),
-            "zomma": self.zomma(),
-            "color": self.color(),
-            "ultima": self.ultima(),
-            "dual_delta": self.dual_delta(),
-            "dual_gamma": self.dual_gamma(),
-            "alpha": self.alpha(),
-        }
+        return self.all_greeks()._asdict()
+
+    def get_greeks(self, names: Iterable[str]) -> Dict[str, float]:
+        """
+        Retrieve a selection of Greeks as a dictionary. \n
+        Shared intermediates are computed once and
+        only when one of the selected Greeks needs them.
 
-    @property
+        :param names: Names of the Greeks to evaluate. "price" is also accepted.
+        Ex. ["delta", "gamma", "vanna", "charm"]
+        """
+        return GreekPlan.compile(type(self), tuple(names))(self)
+
+    def all_greeks(self) -> BlackScholesGreeks:
+        """
+        Evaluate all Greeks in a single pass over shared intermediates. \n
+        Faster than calling every Greek method separately,
+        since no Greek is computed more than once.
+        Requires `_sign` (1 for calls, -1 for puts) on the subclass.
+        """
+        if self._sign > 0:
+            cdf_sign_d1, cdf_sign_d2 = self._cdf_d1, self._cdf_d2
+        else:
+            cdf_sign_d1, cdf_sign_d2 = self._cdf_neg_d1, self._cdf_neg_d2
+        return _black_scholes_greeks(
+            self.S, self.K, self.T, self.r, self.sigma, self.q, self._sign,
+            self._sqrt_T, self._sigma_sqrt_T, self._d1, self._d2,
+            self._pdf_d1, self._pdf_d2, cdf_sign_d1, cdf_sign_d2,
+            self._discount_q, self._discount_r, self._price(),
+        )
+
+    @_cached_on("T")
+    def _sqrt_T(self) -> float:
+        return sqrt(self.T)
+
+    @_cached_on("sigma", "_sqrt_T")
+    def _sigma_sqrt_T(self) -> float:
+        return self.sigma * self._sqrt_T
+
+    @_cached_on("q", "T")
+    def _discount_q(self) -> float:
+        """Discount factor for the dividend yield."""
+        return exp(-self.q * self.T)
+
+    @_cached_on("r", "T")
+    def _discount_r(self) -> float:
+        """Discount factor for the risk-free rate."""
+        return exp(-self.r * self.T)
+
+    @_cached_on("S", "K", "T", "r", "sigma", "q")
     def _d1(self) -> float:
         """1st probability factor that acts as a multiplication factor for stock prices."""
-        return (1.0 / (self.sigma * sqrt(self.T))) * (
+        return (
             log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T
-        )
+        ) / self._sigma_sqrt_T
 
-    @property
+    @_cached_on("_d1", "_sigma_sqrt_T")
     def _d2(self) -> float:
         """2nd probability parameter that acts as a multiplication factor for discounting."""
-        return self._d1 - self.sigma * sqrt(self.T)
+        return self._d1 - self._sigma_sqrt_T
+
+    @_cached_on("_d1")
+    def _pdf_d1(self) -> float:
+        return self._pdf(self._d1)
+
+    @_cached_on("_d2")
+    def _pdf_d2(self) -> float:
+        return self._pdf(self._d2)
+
+    @_cached_on("_d1")
+    def _cdf_d1(self) -> float:
+        return self._cdf(self._d1)
+
+    @_cached_on("_d1")
+    def _cdf_neg_d1(self) -> float:
+        return self._cdf(-self._d1)
+
+    @_cached_on("_d2")
+    def _cdf_d2(self) -> float:
+        return self._cdf(self._d2)
+
+    @_cached_on("_d2")
+    def _cdf_neg_d2(self) -> float:
+        return self._cdf(-self._d2)
+
+    def _price(self) -> float:
+        """Fair value of the option with `_sign`, see `_tail_safe_price`."""
+        if self._sign > 0:
+            cdf_sign_d1, cdf_sign_d2 = self._cdf_d1, self._cdf_d2
+        else:
+            cdf_sign_d1, cdf_sign_d2 = self._cdf_neg_d1, self._cdf_neg_d2
+        return _tail_safe_price(
+            self._sign, self._d1, self._d2, self.S * self._discount_q, self.K * self._discount_r,
+            self._pdf_d1, cdf_sign_d1, cdf_sign_d2, self._mills_ratio,
+        )
 
 
-class Black76Base(ABC, StandardNormalMixin):
+class Black76Base(ABC, CachedIntermediatesMixin, StandardNormalMixin):
     """
     Base functionality to calculate (European) prices
     and Greeks with the Black-76 formula. \n
@@ -291,13 +705,24 @@ class Black76Base(ABC, StandardNormalMixin):
     :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
     """
 
+    # Inputs are stored in slots. The `__dict__` for cached intermediates
+    # is only created once the first intermediate is computed.
+    __slots__ = ("F", "K", "T", "r", "sigma", "__dict__")
+    _inputs = ("F", "K", "T", "r", "sigma")
+    _input_checks = {
+        name: (lambda param: param >= 0.0, "Some parameters cannot be negative.") for name in ("F", "K", "T", "sigma")
+    }
+    # 1 for calls and -1 for puts
+    _sign: float
+    _greek_names = frozenset(Black76Greeks._fields) | {"price"}
+
     def __init__(self, F: float, K: float, T: float, r: float, sigma: float):
         # Some parameters must be positive
         for param in [F, K, T, sigma]:
             assert (
                 param >= 0.0
             ), f"Some parameters cannot be negative. Got '{param}' as an argument."
-        self.F, self.K, self.T, self.r, self.sigma = F, K, T, r, sigma
+        self._set_inputs(F=F, K=K, T=T, r=r, sigma=sigma)
 
     @abstractmethod
     def price(self):
@@ -314,17 +739,13 @@ class Black76Base(ABC, StandardNormalMixin):
         """
         Rate of change in delta with respect to the underlying stock price (2nd derivative).
         """
-        return (
-            exp(-self.r * self.T)
-            * self._pdf(self._d1)
-            / (self.F * self.sigma * sqrt(self.T))
-        )
+        return self._discount_r * self._pdf_d1 / (self.F * self._sigma_sqrt_T)
 
     def vega(self) -> float:
         """Rate of change in option price with respect to the volatility
         of underlying futures contract.
         """
-        return self.F * exp(-self.r * self.T) * self._pdf(self._d1) * sqrt(self.T)
+        return self.F * self._discount_r * self._pdf_d1 * self._sqrt_T
 
     @abstractmethod
     def theta(self) -> float:
@@ -343,12 +764,39 @@ class Black76Base(ABC, StandardNormalMixin):
 
     def vanna(self) -> float:
         """Sensitivity of delta with respect to change in volatility."""
-        return self.vega() / self.F * (1 - self._d1 / (self.sigma * sqrt(self.T)))
+        return self.vega() / self.F * (1 - self._d1 / self._sigma_sqrt_T)
+
+    def charm(self) -> float:
+        """Rate of change of delta over time (also known as delta decay)."""
+        return self.r * self.delta() + self._discount_r * self._pdf_d1 * self._d2 / (2 * self.T)
 
     def vomma(self) -> float:
         """2nd order sensitivity to volatility."""
         return self.vega() * self._d1 * self._d2 / self.sigma
 
+    def veta(self) -> float:
+        """Rate of change in `vega` with respect to time."""
+        return -self.vega() * (self.r - (1 + self._d1 * self._d2) / (2 * self.T))
+
+    def speed(self) -> float:
+        """Rate of change in Gamma with respect to change in the futures price."""
+        return -self.gamma() / self.F * (self._d1 / self._sigma_sqrt_T + 1)
+
+    def zomma(self) -> float:
+        """Rate of change of gamma with respect to changes in volatility."""
+        return self.gamma() * (self._d1 * self._d2 - 1) / self.sigma
+
+    def color(self) -> float:
+        """Rate of change of gamma over time."""
+        return -self.gamma() / (2 * self.T) * (2 * self.r * self.T + 1 - self._d1 * self._d2)
+
+    def ultima(self) -> float:
+        """Sensitivity of vomma with respect to change in volatility. \n
+        3rd order derivative of option value to volatility.
+        """
+        d1d2 = self._d1 * self._d2
+        return -self.vega() / self.sigma**2 * (d1d2 * (1 - d1d2) + self._d1**2 + self._d2**2)
+
     def alpha(self) -> float:
         """Theta to gamma ratio. Also called "gamma rent".
         More info: "Dynamic Hedging" by Nassim Taleb, p. 178-181.
@@ -374,36 +822,98 @@ class Black76Base(ABC, StandardNormalMixin):
 
     def get_all_greeks(self) -> Dict[str, float]:
         """Retrieve all Greeks for the Black76 model implemented as a dictionary."""
-        return {
-            "delta": self.delta(),
-            "gamma": self.gamma(),
-            "vega": self.vega(),
-            "theta": self.theta(),
-            "rho": self.rho(),
-            "vanna": self.vanna(),
-            "vomma": self.vomma(),
-            "alpha": self.alpha(),
-        }
+        return self.all_greeks()._asdict()
+
+    def all_greeks(self) -> Black76Greeks:
+        """
+        Evaluate all Greeks in a single pass over shared intermediates. \n
+        Faster than calling every Greek method separately,
+        since no Greek is computed more than once.
+        """
+        if self._sign > 0:
+            cdf_sign_d1, cdf_sign_d2 = self._cdf_d1, self._cdf_d2
+        else:
+            cdf_sign_d1, cdf_sign_d2 = self._cdf_neg_d1, self._cdf_neg_d2
+        return _black_76_greeks(
+            self.F, self.K, self.T, self.r, self.sigma, self._sign,
+            self._sqrt_T, self._sigma_sqrt_T, self._d1, self._d2,
+            self._pdf_d1, cdf_sign_d1, cdf_sign_d2, self._discount_r, self._price(),
+        )
+
+    def get_greeks(self, names: Iterable[str]) -> Dict[str, float]:
+        """
+        Retrieve a selection of Greeks as a dictionary. \n
+        Shared intermediates are computed once and
+        only when one of the selected Greeks needs them.
+
+        :param names: Names of the Greeks to evaluate. "price" is also accepted.
+        Ex. ["delta", "gamma", "vanna"]
+        """
+        return GreekPlan.compile(type(self), tuple(names))(self)
+
+    @_cached_on("T")
+    def _sqrt_T(self) -> float:
+        return sqrt(self.T)
 
-    @property
+    @_cached_on("sigma", "_sqrt_T")
+    def _sigma_sqrt_T(self) -> float:
+        return self.sigma * self._sqrt_T
+
+    @_cached_on("r", "T")
+    def _discount_r(self) -> float:
+        """Discount factor for the risk-free rate."""
+        return exp(-self.r * self.T)
+
+    @_cached_on("F", "K", "T", "sigma")
     def _d1(self) -> float:
         """1st probability factor that acts as a multiplication factor for futures contracts."""
-        return (log(self.F / self.K) + 0.5 * self.sigma**2 * self.T) / (
-            self.sigma * sqrt(self.T)
-        )
+        return (log(self.F / self.K) + 0.5 * self.sigma**2 * self.T) / self._sigma_sqrt_T
 
-    @property
+    @_cached_on("_d1", "_sigma_sqrt_T")
     def _d2(self) -> float:
         """2nd probability parameter that acts as a multiplication factor for discounting."""
-        return self._d1 - self.sigma * sqrt(self.T)
+        return self._d1 - self._sigma_sqrt_T
+
+    @_cached_on("_d1")
+    def _pdf_d1(self) -> float:
+        return self._pdf(self._d1)
+
+    @_cached_on("_d1")
+    def _cdf_d1(self) -> float:
+        return self._cdf(self._d1)
+
+    @_cached_on("_d1")
+    def _cdf_neg_d1(self) -> float:
+        return self._cdf(-self._d1)
+
+    @_cached_on("_d2")
+    def _cdf_d2(self) -> float:
+        return self._cdf(self._d2)
+
+    @_cached_on("_d2")
+    def _cdf_neg_d2(self) -> float:
+        return self._cdf(-self._d2)
+
+    def _price(self) -> float:
+        """Fair value of the option with `_sign`, see `_tail_safe_price`."""
+        if self._sign > 0:
+            cdf_sign_d1, cdf_sign_d2 = self._cdf_d1, self._cdf_d2
+        else:
+            cdf_sign_d1, cdf_sign_d2 = self._cdf_neg_d1, self._cdf_neg_d2
+        return self._discount_r * _tail_safe_price(
+            self._sign, self._d1, self._d2, self.F, self.K, self._pdf_d1, cdf_sign_d1, cdf_sign_d2, self._mills_ratio,
+        )
 
 
 class BlackScholesStructureBase(ABC):
     """
     Option structure base class. \n
     `_calc_attr` should be implemented for every option structure.
+    `BlackScholesStructure` implements it for any set of weighted legs.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def _calc_attr(self, attribute_name: str) -> float:
         """
@@ -585,7 +1095,7 @@ class BlackScholesStructureBase(ABC):
         }
 
 
-class BinaryBase(ABC, StandardNormalMixin):
+class BinaryBase(ABC, CachedIntermediatesMixin, StandardNormalMixin):
     """
     Base class for (European) binary options.
     Also called a digital or exotic option.
@@ -595,16 +1105,26 @@ class BinaryBase(ABC, StandardNormalMixin):
     :param T: Time till expiration in years (1/12 indicates 1 month) \n
     :param r: Risk-free interest rate (0.05 indicates 5%) \n
     :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
-    Assumes dividend yield is 0%.
+    :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
-    def __init__(self, S: float, K: float, T: float, r: float, sigma: float):
+
+    # Inputs are stored in slots. The `__dict__` for cached intermediates
+    # is only created once the first intermediate is computed.
+    __slots__ = ("S", "K", "T", "r", "sigma", "q", "__dict__")
+    _inputs = ("S", "K", "T", "r", "sigma", "q")
+    _input_checks = _BLACK_SCHOLES_INPUT_CHECKS
+    # 1 for calls and -1 for puts. Only gamma uses it. Subclasses for puts override it.
+    _sign = 1.0
+
+    def __init__(self, S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0):
         assert S > 0.0, f"Asset price (S) needs to be larger than 0. Got '{S}'"
         assert K > 0.0, f"Strike price (K) needs to be larger than 0. Got '{K}'"
         assert T > 0.0, f"Time to maturity (T) needs to be larger than 0. Got '{T}'"
         assert (
             sigma > 0.0
         ), f"Volatility (sigma) needs to be larger than 0. Got '{sigma}'"
-        self.S, self.K, self.T, self.r, self.sigma = S, K, T, r, sigma
+        assert q >= 0.0, f"Annual dividend yield (q) cannot be negative. Got '{q}'"
+        self._set_inputs(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
 
     @abstractmethod
     def price(self) -> float:
@@ -616,31 +1136,61 @@ class BinaryBase(ABC, StandardNormalMixin):
         """Undiscounted fair value for binary option."""
         ...
     
-    @property
+    @_cached_on("T")
+    def _sqrt_T(self) -> float:
+        return sqrt(self.T)
+
+    @_cached_on("sigma", "_sqrt_T")
+    def _sigma_sqrt_T(self) -> float:
+        return self.sigma * self._sqrt_T
+
+    @_cached_on("r", "T")
+    def _discount_r(self) -> float:
+        """Discount factor for the risk-free rate."""
+        return exp(-self.r * self.T)
+
+    @_cached_on("S", "K", "T", "r", "sigma", "q")
     def _d1(self) -> float:
         """1st probability factor that acts as a multiplication factor for stock prices."""
-        return (1.0 / (self.sigma * sqrt(self.T))) * (
-            log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T
-        )
+        return (
+            log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T
+        ) / self._sigma_sqrt_T
 
-    @property
+    @_cached_on("_d1", "_sigma_sqrt_T")
     def _d2(self) -> float:
         """2nd probability parameter that acts as a multiplication factor for discounting."""
-        return self._d1 - self.sigma * sqrt(self.T)
+        return self._d1 - self._sigma_sqrt_T
+
+    @_cached_on("_d2")
+    def _pdf_d2(self) -> float:
+        return self._pdf(self._d2)
+
+    @_cached_on("_discount_r", "_pdf_d2")
+    def _discount_pdf_d2(self) -> float:
+        """Discounted density of d2, the sensitivity of the price to d2 without its sign."""
+        return self._discount_r * self._pdf_d2
+
+    @_cached_on("_d2")
+    def _cdf_d2(self) -> float:
+        return self._cdf(self._d2)
+
+    @_cached_on("_d2")
+    def _cdf_neg_d2(self) -> float:
+        return self._cdf(-self._d2)
     
     @abstractmethod
     def delta(self) -> float:
         """Rate of change in structure price
         with respect to the asset price (1st derivative).
-        Note that this is the forward delta.
         """
         ...
 
     def gamma(self) -> float:
         """Rate of change in delta
         with respect to the underlying price (2nd derivative).
+        The gamma of the put is the negative of the gamma of the call.
         """
-        return (self._pdf(self._d1) * (self._d1 / (self.T * self.sigma * self.S) - 1 / self.S**2)) / (self.S * self.sigma * sqrt(self.T))
+        return -self._sign * self._discount_pdf_d2 * self._d1 / (self.S * self._sigma_sqrt_T) ** 2
 
     @abstractmethod
     def vega(self) -> float:
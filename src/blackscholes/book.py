@@ -0,0 +1,295 @@
+from enum import IntEnum
+from typing import Dict, Iterable, Union
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from .call import BinaryCall, Black76Call, BlackScholesCall
+from .put import BinaryPut, Black76Put, BlackScholesPut
+from .vectorized import Black76Vectorized, BinaryVectorized, BlackScholesVectorized, _raise_on_errors, validate_inputs
+
+
+class InstrumentType(IntEnum):
+    """Kind of option in an `OptionBook`."""
+
+    BLACK_SCHOLES_CALL = 0
+    BLACK_SCHOLES_PUT = 1
+    # Black-76 rows read the futures price F from the `S` column and ignore `q`.
+    BLACK_76_CALL = 2
+    BLACK_76_PUT = 3
+    BINARY_CALL = 4
+    BINARY_PUT = 5
+
+
+# Vectorized engine and (call, put) instrument types per option family
+_FAMILIES = (
+    (BlackScholesVectorized, InstrumentType.BLACK_SCHOLES_CALL, InstrumentType.BLACK_SCHOLES_PUT),
+    (Black76Vectorized, InstrumentType.BLACK_76_CALL, InstrumentType.BLACK_76_PUT),
+    (BinaryVectorized, InstrumentType.BINARY_CALL, InstrumentType.BINARY_PUT),
+)
+# Scalar option class per instrument type
+_OPTION_CLASSES = {
+    InstrumentType.BLACK_SCHOLES_CALL: BlackScholesCall,
+    InstrumentType.BLACK_SCHOLES_PUT: BlackScholesPut,
+    InstrumentType.BLACK_76_CALL: Black76Call,
+    InstrumentType.BLACK_76_PUT: Black76Put,
+    InstrumentType.BINARY_CALL: BinaryCall,
+    InstrumentType.BINARY_PUT: BinaryPut,
+}
+# Columns that identify a contract. Positions with the same contract are netted.
+_CONTRACT_COLUMNS = ("kind", "S", "K", "T", "r", "sigma", "q")
+
+
+def _position_errors(positions: np.ndarray) -> np.ndarray:
+    """`InputError` flags per position. `q` is not checked for Black-76 options, which ignore it."""
+    black_76 = np.isin(positions["kind"], [InstrumentType.BLACK_76_CALL, InstrumentType.BLACK_76_PUT])
+    return validate_inputs(
+        positions["S"], positions["K"], positions["T"], positions["r"], positions["sigma"],
+        np.where(black_76, 0.0, positions["q"]),
+    )
+
+
+class OptionBook:
+    """
+    Positions in Black-Scholes, Black-76 and binary options, stored column-wise
+    in one NumPy structured array. \n
+    Prices and Greeks are computed per option family with `BlackScholesVectorized`,
+    `Black76Vectorized` and `BinaryVectorized`, so rows are never converted into option objects.
+    Values are per option. Use `total_greeks` for the quantity-weighted sum over the book. \n
+    Ex. `book[book["kind"] == InstrumentType.BINARY_CALL]` selects all binary calls.
+
+    :param kind: `InstrumentType` per position \n
+    :param S: Price of underlying asset (futures price for Black-76 options) \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield). Ignored for Black-76 options. \n
+    :param quantity: Number of options per position. Negative quantities are short positions. \n
+    :param invalid: "raise" to raise a ValueError when positions with invalid inputs are added,
+    or "nan" to keep them and return NaN for their prices and Greeks (see `errors`)
+    """
+
+    dtype = np.dtype(
+        [
+            ("kind", np.int8),
+            ("S", np.float64),
+            ("K", np.float64),
+            ("T", np.float64),
+            ("r", np.float64),
+            ("sigma", np.float64),
+            ("q", np.float64),
+            ("quantity", np.float64),
+        ]
+    )
+
+    def __init__(
+        self,
+        kind: ArrayLike = (),
+        S: ArrayLike = (),
+        K: ArrayLike = (),
+        T: ArrayLike = (),
+        r: ArrayLike = (),
+        sigma: ArrayLike = (),
+        q: ArrayLike = 0.0,
+        quantity: ArrayLike = 1.0,
+        invalid: str = "raise",
+    ):
+        assert invalid in ("raise", "nan"), f"invalid needs to be 'raise' or 'nan'. Got '{invalid}'"
+        self._invalid = invalid
+        self._positions = np.empty(0, dtype=self.dtype)
+        self._size = 0
+        self.append(kind=kind, S=S, K=K, T=T, r=r, sigma=sigma, q=q, quantity=quantity)
+
+    @classmethod
+    def from_records(cls, positions: np.ndarray, invalid: str = "raise") -> "OptionBook":
+        """
+        Book that holds a copy of existing positions.
+
+        :param positions: Structured array with the fields of `OptionBook.dtype` \n
+        :param invalid: "raise" or "nan", see `OptionBook`
+        """
+        book = cls(invalid=invalid)
+        book.extend_records(positions)
+        return book
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Structured array with one row per position. Changes to it change the book."""
+        return self._positions[: self._size]
+
+    def __len__(self) -> int:
+        """Number of positions."""
+        return self._size
+
+    def __getitem__(self, key: Union[str, int, slice, ArrayLike]) -> Union[np.ndarray, "OptionBook"]:
+        """
+        Column of the book (ex. `book["K"]`), or a new book with the selected positions
+        (ex. `book[book["T"] < 0.5]`).
+        """
+        if isinstance(key, str):
+            return self.positions[key]
+        positions = self.positions[key]
+        return self.from_records(np.atleast_1d(positions), self._invalid)
+
+    def filter(self, mask: ArrayLike) -> "OptionBook":
+        """
+        New book with the positions for which `mask` is True.
+
+        :param mask: Boolean flag per position
+        """
+        mask = np.asarray(mask, dtype=bool)
+        assert mask.shape == (self._size,), f"Mask needs one flag per position. Got shape {mask.shape}"
+        return self.from_records(self.positions[mask], self._invalid)
+
+    def append(
+        self,
+        kind: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        q: ArrayLike = 0.0,
+        quantity: ArrayLike = 1.0,
+    ) -> None:
+        """
+        Add positions to the book in place. Scalars apply to every new position. \n
+        Storage grows geometrically, so appending one position at a time is amortized O(1).
+        """
+        columns = np.broadcast_arrays(
+            *(np.asarray(param) for param in (kind, S, K, T, r, sigma, q, quantity))
+        )
+        assert columns[0].ndim <= 1, f"Positions must be given as 1-dimensional arrays. Got shape {columns[0].shape}"
+        records = np.empty(columns[0].size, dtype=self.dtype)
+        for name, column in zip(self.dtype.names, columns):
+            records[name] = column.ravel()
+        self.extend_records(records)
+
+    def extend(self, book: "OptionBook") -> None:
+        """
+        Add all positions of another book in place.
+
+        :param book: Book with the positions to add
+        """
+        self.extend_records(book.positions)
+
+    def extend_records(self, positions: np.ndarray) -> None:
+        """
+        Add positions from a structured array in place.
+
+        :param positions: Structured array with the fields of `OptionBook.dtype`
+        """
+        positions = np.asarray(positions)
+        assert positions.ndim == 1, f"Positions must be a 1-dimensional array. Got shape {positions.shape}"
+        unknown = np.flatnonzero(~np.isin(positions["kind"], list(InstrumentType)))
+        if unknown.size:
+            raise ValueError(f"Unknown instrument type (kind) {positions['kind'][unknown[0]]} at index {unknown[0]}.")
+        if self._invalid == "raise":
+            _raise_on_errors(_position_errors(positions))
+        size = self._size + positions.shape[0]
+        if size > self._positions.shape[0]:
+            grown = np.empty(max(size, 2 * self._positions.shape[0]), dtype=self.dtype)
+            grown[: self._size] = self.positions
+            self._positions = grown
+        self._positions[self._size : size] = positions
+        self._size = size
+
+    def option(self, index: int) -> Union[BlackScholesCall, BlackScholesPut, Black76Call, Black76Put, BinaryCall, BinaryPut]:
+        """
+        Scalar option object for a single position (without its quantity).
+
+        :param index: Position of the row
+        """
+        row = self.positions[index]
+        kind = InstrumentType(row["kind"])
+        S, K, T, r, sigma, q = (row[name].item() for name in ("S", "K", "T", "r", "sigma", "q"))
+        if kind in (InstrumentType.BLACK_76_CALL, InstrumentType.BLACK_76_PUT):
+            return _OPTION_CLASSES[kind](F=S, K=K, T=T, r=r, sigma=sigma)
+        return _OPTION_CLASSES[kind](S=S, K=K, T=T, r=r, sigma=sigma, q=q)
+
+    def net(self) -> "OptionBook":
+        """
+        New book with one position per contract. \n
+        Quantities of positions with the same kind, S, K, T, r, sigma and q are summed,
+        and contracts that net to zero are dropped.
+        """
+        positions = self.positions
+        contracts, inverse = np.unique(positions[list(_CONTRACT_COLUMNS)], return_inverse=True)
+        quantity = np.bincount(inverse.ravel(), weights=positions["quantity"], minlength=contracts.shape[0])
+        netted = np.empty(contracts.shape[0], dtype=self.dtype)
+        for name in _CONTRACT_COLUMNS:
+            netted[name] = contracts[name]
+        netted["quantity"] = quantity
+        return self.from_records(netted[quantity != 0.0], self._invalid)
+
+    def errors(self) -> np.ndarray:
+        """
+        `InputError` flags per position as uint8. 0 means the inputs are valid. \n
+        `q` is not checked for Black-76 options, and NaN or infinite quantities are not flagged.
+        """
+        return _position_errors(self.positions)
+
+    def price(self) -> np.ndarray:
+        """Fair value per option."""
+        return self.get_greeks(["price"])["price"]
+
+    def get_greeks(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Retrieve a selection of Greeks per option as a dictionary of arrays. \n
+        Every option family in the book is evaluated once for all selected Greeks.
+        With invalid="nan", positions with invalid inputs are NaN.
+        A ValueError names the option family when a Greek is not available for positions in the book,
+        ex. vanna for binary options. Select the other positions first to evaluate it.
+
+        :param names: Names of the Greeks to evaluate. "price" is also accepted.
+        Ex. ["delta", "gamma", "vega"]
+        """
+        names = tuple(names)
+        positions = self.positions
+        kind = positions["kind"]
+        families = []
+        for engine, call, put in _FAMILIES:
+            rows = np.flatnonzero((kind == call) | (kind == put))
+            if rows.size == 0:
+                continue
+            unsupported = [name for name in names if name not in engine._greek_names]
+            if unsupported:
+                raise ValueError(
+                    f"Greek(s) {unsupported} not available for the {rows.size} {call.name} and {put.name} "
+                    f"position(s) in the book. Choose from {sorted(engine._greek_names)}, "
+                    "or select the other positions first."
+                )
+            families.append((engine, call, rows))
+        greeks = {name: np.empty(self._size) for name in names}
+        for engine, call, rows in families:
+            family = positions[rows]
+            if engine is Black76Vectorized:
+                options = engine(
+                    F=family["S"], K=family["K"], T=family["T"], r=family["r"], sigma=family["sigma"],
+                    is_call=family["kind"] == call, invalid=self._invalid,
+                )
+            else:
+                options = engine(
+                    S=family["S"], K=family["K"], T=family["T"], r=family["r"], sigma=family["sigma"],
+                    q=family["q"], is_call=family["kind"] == call, invalid=self._invalid,
+                )
+            for name, value in options.get_greeks(names).items():
+                greeks[name][rows] = value
+        return greeks
+
+    def total_greeks(self, names: Iterable[str]) -> Dict[str, float]:
+        """
+        Quantity-weighted sum of a selection of Greeks over all positions.
+        With invalid="nan", positions with invalid inputs are left out. Use `errors` to find them.
+
+        :param names: Names of the Greeks to evaluate. "price" gives the value of the book.
+        """
+        quantity = self.positions["quantity"]
+        greeks = self.get_greeks(names)
+        if self._invalid == "nan":
+            valid = self.errors() == 0
+            quantity = quantity[valid]
+            greeks = {name: value[valid] for name, value in greeks.items()}
+        return {name: float(quantity @ value) for name, value in greeks.items()}
@@ -1,8 +1,9 @@
-from . import BlackScholesCall, BlackScholesPut
-from .base import BlackScholesStructureBase
+from .call import BlackScholesCall
+from .put import BlackScholesPut
+from .structure import BlackScholesStructure, _leg
 
 
-class BlackScholesButterflyLong(BlackScholesStructureBase):
+class BlackScholesButterflyLong(BlackScholesStructure):
     """
     Create long butterfly option structure.
     - Long butterfly -> Call(K1) - 2 * Call(K2) + Call(K3)
@@ -19,6 +20,11 @@ class BlackScholesButterflyLong(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    call1 = _leg(0)
+    call2 = _leg(1)
+    call3 = _leg(2)
+
     def __init__(
         self,
         S: float,
@@ -40,29 +46,17 @@ class BlackScholesButterflyLong(BlackScholesStructureBase):
         ), f"""Strike price must be symmetric, so K2 - K1 = K3 - K2.
                         Got {K2}-{K1} != {K3}-{K2}.
                         """
-        super().__init__()
-        self.call1 = BlackScholesCall(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.call2 = BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        self.call3 = BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q)
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from three call options into a long call butterfly. \n
-        All greeks and price are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to long call butterfly.
-        """
-        call_attr1 = getattr(self.call1, attribute_name)
-        call_attr2 = getattr(self.call2, attribute_name)
-        call_attr3 = getattr(self.call3, attribute_name)
-        return call_attr1() - 2 * call_attr2() + call_attr3()
+        self._set_legs(
+            quantity=[1.0, -2.0, 1.0],
+            options=[
+                BlackScholesCall(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
 
 
-class BlackScholesButterflyShort(BlackScholesStructureBase):
+class BlackScholesButterflyShort(BlackScholesStructure):
     """
     Create short butterfly option structure. \n
     - Short butterfly -> -Put(K1) + 2 * Put(K2) - Put(K3)
@@ -79,6 +73,11 @@ class BlackScholesButterflyShort(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    put1 = _leg(0)
+    put2 = _leg(1)
+    put3 = _leg(2)
+
     def __init__(
         self,
         S: float,
@@ -100,23 +99,11 @@ class BlackScholesButterflyShort(BlackScholesStructureBase):
         ), f"""Strike price must be symmetric, so K2 - K1 = K3 - K2.
                         Got {K2}-{K1} != {K3}-{K2}.
                         """
-        super().__init__()
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.put2 = BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        self.put3 = BlackScholesPut(S=S, K=K3, T=T, r=r, sigma=sigma, q=q)
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from three put options into a short put butterfly. \n
-        All greeks and price are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to short put butterfly.
-        """
-        put_attr1 = getattr(self.put1, attribute_name)
-        put_attr2 = getattr(self.put2, attribute_name)
-        put_attr3 = getattr(self.put3, attribute_name)
-        return -put_attr1() + 2 * put_attr2() - put_attr3()
+        self._set_legs(
+            quantity=[-1.0, 2.0, -1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K3, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
@@ -1,5 +1,3 @@
-from math import exp, sqrt
-
 from .base import Black76Base, BlackScholesBase, BinaryBase
 
 
@@ -16,6 +14,9 @@ class BlackScholesCall(BlackScholesBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    _sign = 1.0
+
     def __init__(
         self, S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0
     ):
@@ -23,10 +24,7 @@ class BlackScholesCall(BlackScholesBase):
 
     def price(self) -> float:
         """Fair value of Black-Scholes call option."""
-        return (
-            self.S * exp(-self.q * self.T) * self._cdf(self._d1)
-            - self._cdf(self._d2) * exp(-self.r * self.T) * self.K
-        )
+        return self._price()
 
     def delta(self) -> float:
         """Rate of change in option price
@@ -34,56 +32,52 @@ class BlackScholesCall(BlackScholesBase):
         Note that this is the forward delta.
         For the spot delta, use `spot_delta`.
         """
-        return exp(-self.q * self.T) * self._cdf(self._d1)
+        return self._discount_q * self._cdf_d1
 
     def spot_delta(self) -> float:
         """
         Delta discounted for interest rates.
         For the forward delta, use `delta`.
         """
-        return exp((self.r - self.q) * self.T) * self._cdf(self._d1)
+        return (self._discount_q / self._discount_r) * self._cdf_d1
 
     def dual_delta(self) -> float:
         """1st derivative in option price
         with respect to strike price.
         """
-        return exp(-self.r * self.T) * self._cdf(self._d2)
+        return self._discount_r * self._cdf_d2
 
     def theta(self) -> float:
         """Rate of change in option price
         with respect to time (i.e. time decay).
         """
         return (
-            (-exp(-self.q * self.T) * self.S * self._pdf(self._d1) * self.sigma)
-            / (2 * sqrt(self.T))
-            - (self.r * self.K * exp(-self.r * self.T) * self._cdf(self._d2))
-            + self.q * self.S * exp(-self.q * self.T) * self._cdf(self._d1)
+            (-self._discount_q * self.S * self._pdf_d1 * self.sigma)
+            / (2 * self._sqrt_T)
+            - (self.r * self.K * self._discount_r * self._cdf_d2)
+            + self.q * self.S * self._discount_q * self._cdf_d1
         )
 
     def rho(self) -> float:
         """Rate of change in option price
         with respect to the risk-free rate.
         """
-        return self.K * self.T * exp(-self.r * self.T) * self._cdf(self._d2)
+        return self.K * self.T * self._discount_r * self._cdf_d2
 
     def epsilon(self) -> float:
         """Change in option price with respect to underlying dividend yield. \n
         Also known as psi."""
-        return -self.S * self.T * exp(-self.q * self.T) * self._cdf(self._d1)
+        return -self.S * self.T * self._discount_q * self._cdf_d1
 
     def charm(self) -> float:
         """Rate of change of delta over time (also known as delta decay)."""
-        return self.q * exp(-self.q * self.T) * self._cdf(self._d1) - exp(
-            -self.q * self.T
-        ) * self._pdf(self._d1) * (
-            2.0 * (self.r - self.q) * self.T - self._d2 * self.sigma * sqrt(self.T)
-        ) / (
-            2.0 * self.T * self.sigma * sqrt(self.T)
-        )
+        return self.q * self._discount_q * self._cdf_d1 - self._discount_q * self._pdf_d1 * (
+            2.0 * (self.r - self.q) * self.T - self._d2 * self._sigma_sqrt_T
+        ) / (2.0 * self.T * self._sigma_sqrt_T)
 
     def in_the_money(self) -> float:
         """Naive Probability that call option will be in the money at maturity."""
-        return self._cdf(self._d2)
+        return self._cdf_d2
 
 
 class Black76Call(Black76Base):
@@ -98,21 +92,22 @@ class Black76Call(Black76Base):
     :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
     """
 
+    __slots__ = ()
+    _sign = 1.0
+
     def __init__(self, F: float, K: float, T: float, r: float, sigma: float):
         super().__init__(F=F, K=K, T=T, r=r, sigma=sigma)
 
     def price(self) -> float:
         """Fair value of a Black-76 call option."""
-        return exp(-self.r * self.T) * (
-            self.F * self._cdf(self._d1) - self.K * self._cdf(self._d2)
-        )
+        return self._price()
 
     def delta(self) -> float:
         """Rate of change in option price
         with respect to the underlying futures price (1st derivative).
         Proxy for probability of the option expiring in the money.
         """
-        return exp(-self.r * self.T) * self._cdf(self._d1)
+        return self._discount_r * self._cdf_d1
 
     def theta(self) -> float:
         """Rate of change in option price
@@ -120,12 +115,12 @@ class Black76Call(Black76Base):
         """
         return (
             -self.F
-            * exp(-self.r * self.T)
-            * self._pdf(self._d1)
+            * self._discount_r
+            * self._pdf_d1
             * self.sigma
-            / (2 * sqrt(self.T))
-            - self.r * self.K * exp(-self.r * self.T) * self._cdf(self._d2)
-            + self.r * self.F * exp(-self.r * self.T) * self._cdf(self._d1)
+            / (2 * self._sqrt_T)
+            - self.r * self.K * self._discount_r * self._cdf_d2
+            + self.r * self.F * self._discount_r * self._cdf_d1
         )
 
     def rho(self) -> float:
@@ -134,8 +129,8 @@ class Black76Call(Black76Base):
         """
         return (
             -self.T
-            * exp(-self.r * self.T)
-            * (self.F * self._cdf(self._d1) - self.K * self._cdf(self._d2))
+            * self._discount_r
+            * (self.F * self._cdf_d1 - self.K * self._cdf_d2)
         )
 
 class BinaryCall(BinaryBase):
@@ -148,44 +143,47 @@ class BinaryCall(BinaryBase):
     :param T: Time till expiration in years (1/12 indicates 1 month) \n
     :param r: Risk-free interest rate (0.05 indicates 5%) \n
     :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
-    Assumes dividend yield is 0%.
+    :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    _sign = 1.0
+
     def __init__(
-        self, S: float, K: float, T: float, r: float, sigma: float
+        self, S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0
     ):
-        super().__init__(S=S, K=K, T=T, r=r, sigma=sigma)
+        super().__init__(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
 
     def price(self) -> float:
         """Fair value of binary call option."""
-        return exp(-self.r * self.T) * self._cdf(self._d2)
+        return self._discount_r * self._cdf_d2
     
     def forward(self) -> float:
         """Fair value of binary call option without discounting for interest rates."""
-        return self._cdf(self._d2)
+        return self._cdf_d2
     
     def delta(self) -> float:
         """Rate of change in option price
-        with respect to the forward price (1st derivative).
-        Note that this is the forward delta.
+        with respect to the underlying price (1st derivative).
         """
-        return exp(-self.r * self.T) * self._pdf(self._d1) / sqrt(self.T)
-    
+        return self._discount_pdf_d2 / (self.S * self._sigma_sqrt_T)
+
     def vega(self) -> float:
         """Rate of change in option price
         with respect to the volatility (1st derivative).
         """
-        return self.S * sqrt(self.T) * self._pdf(self._d1) * self._d1 / self.sigma
-    
+        return -self._discount_pdf_d2 * self._d1 / self.sigma
+
     def theta(self) -> float:
         """Rate of change in option price
         with respect to time (i.e. time decay).
         """
-        return self.r * self.K * exp(-self.r * self.T) * self._cdf(self._d2) - (self.S * self._pdf(self._d1) * self.sigma) / (2 * sqrt(self.T))
-    
+        return self.r * self.price() - self._discount_pdf_d2 * (
+            (self.r - self.q) / self._sigma_sqrt_T - self._d1 / (2 * self.T)
+        )
+
     def rho(self) -> float:
         """Rate of change in option price
         with respect to the risk-free rate.
         """
-        return self.T * self.K * exp(-self.r * self.T) * self._cdf(self._d2)
-    
\ No newline at end of file
+        return -self.T * self.price() + self._discount_pdf_d2 * self._sqrt_T / self.sigma
@@ -0,0 +1,181 @@
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional, Type
+
+import numpy as np
+
+from numpy.typing import ArrayLike, DTypeLike
+
+from .vectorized import VectorizedInputsMixin
+
+# L2 cache bytes per option of a chunk. Throughput plateaus between 16k and 64k options per chunk
+# on a 2 MB L2 cache, for the price alone as well as with several Greeks.
+_L2_BYTES_PER_ROW = 64
+# Smaller chunks spend most of their time in Python overhead
+_MIN_CHUNK_SIZE = 8_192
+_DEFAULT_L2_BYTES = 1 << 20
+
+
+def _l2_cache_bytes() -> int:
+    """Size of the L2 cache of the first CPU (Linux), or 1 MB when it cannot be read."""
+    directory = "/sys/devices/system/cpu/cpu0/cache"
+    try:
+        for index in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, index, "level")) as level, open(os.path.join(directory, index, "size")) as size:
+                if level.read().strip() == "2":
+                    value = size.read().strip()
+                    return int(value[:-1]) * {"K": 1 << 10, "M": 1 << 20}[value[-1]] if value[-1] in "KM" else int(value)
+    except (OSError, ValueError):
+        pass
+    return _DEFAULT_L2_BYTES
+
+
+@lru_cache(maxsize=None)
+def auto_chunk_size() -> int:
+    """Number of options per chunk that keeps the intermediates of a chunk in the L2 cache."""
+    rows = max(_l2_cache_bytes() // _L2_BYTES_PER_ROW, _MIN_CHUNK_SIZE)
+    # Round down to a power of 2
+    return 1 << (rows.bit_length() - 1)
+
+
+class ChunkedPricingStats(NamedTuple):
+    """
+    Summary of a `price_chunked` run. \n
+    `peak_rss_bytes` is the largest resident memory of the process seen after any chunk,
+    or None when the platform does not report it.
+    """
+
+    rows: int
+    chunks: int
+    seconds: float
+    peak_rss_bytes: Optional[int]
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput of the run."""
+        return self.rows / self.seconds if self.seconds > 0.0 else float("inf")
+
+
+def _resident_bytes() -> Optional[int]:
+    """Current resident memory of the process (Linux), or the peak so far on other Unix platforms."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * mmap.PAGESIZE
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+def _release_pages(array: np.ndarray, start: int, stop: int) -> None:
+    """
+    Drop the processed rows [start, stop) of a shared memory-mapped array from resident memory. \n
+    The pages stay in the file (and in the page cache for outputs) and are read back when accessed again.
+    Arrays that are not shared 1-dimensional memory maps are left alone.
+    """
+    if not isinstance(array, np.memmap) or array._mmap is None or array.mode == "c" or array.ndim != 1:
+        return
+    if not hasattr(mmap, "MADV_DONTNEED") or array.strides[0] <= 0:
+        return
+    base = np.frombuffer(array._mmap, dtype=np.uint8)
+    first = array.ctypes.data - base.ctypes.data + start * array.strides[0]
+    last = array.ctypes.data - base.ctypes.data + stop * array.strides[0]
+    del base
+    # Only whole pages, so rows that are not processed yet are never dropped
+    first -= first % mmap.PAGESIZE
+    last -= last % mmap.PAGESIZE
+    if last > first:
+        array._mmap.madvise(mmap.MADV_DONTNEED, first, last - first)
+
+
+def create_output_memmaps(directory: str, names: Iterable[str], rows: int, dtype: DTypeLike = np.float64) -> Dict[str, np.memmap]:
+    """
+    Memory-mapped `.npy` files to pass as `outputs` to `price_chunked`, one per output.
+
+    :param directory: Existing directory for the files. Each output is written to "<name>.npy". \n
+    :param names: Names of the outputs. Ex. ["price", "delta"] \n
+    :param rows: Number of options \n
+    :param dtype: np.float64, or np.float32 for an engine with dtype=np.float32
+    """
+    return {
+        name: np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+", dtype=dtype, shape=(rows,))
+        for name in names
+    }
+
+
+def price_chunked(
+    engine: Type[VectorizedInputsMixin],
+    inputs: Mapping[str, ArrayLike],
+    outputs: Mapping[str, np.ndarray],
+    chunk_size: Optional[int] = None,
+    invalid: str = "raise",
+    release_pages: bool = True,
+    threads: int = 1,
+) -> ChunkedPricingStats:
+    """
+    Price a dataset that is larger than memory in chunks with a vectorized engine. \n
+    Inputs are typically memory-mapped columns (ex. `np.load(path, mmap_mode="r")`), and outputs
+    memory-mapped arrays from `create_output_memmaps`. Only one chunk of inputs, intermediates
+    and outputs is in memory at a time. With `release_pages`, processed pages of memory-mapped
+    inputs and outputs are dropped from resident memory, so the peak stays flat as the dataset grows. \n
+    With `threads` above 1, chunks are priced concurrently by a thread pool.
+    NumPy releases the GIL in its kernels, so this uses several cores without starting processes.
+    Every thread then holds one chunk in memory.
+
+    :param engine: Vectorized engine class. Ex. `BlackScholesVectorized` or `Black76Vectorized` \n
+    :param inputs: Arguments of `engine` by name. Arrays hold one value per option,
+    scalars apply to every option. Ex. {"S": S, "K": K, "T": T, "r": 0.01, "sigma": sigma, "is_call": True} \n
+    :param outputs: Writable 1-dimensional array per output with one value per option.
+    "price" and the names of the Greeks of `engine` are accepted. \n
+    :param chunk_size: Number of options priced at once. Defaults to `auto_chunk_size()`, sized to the L2 cache. \n
+    :param invalid: "raise" or "nan", see `engine` \n
+    :param release_pages: Drop processed pages of memory-mapped inputs and outputs from resident memory \n
+    :param threads: Number of threads that price chunks concurrently
+
+    :return: Rows, chunks, seconds and peak resident memory of the run
+    """
+    if chunk_size is None:
+        chunk_size = auto_chunk_size()
+    assert chunk_size > 0, f"chunk_size needs to be larger than 0. Got '{chunk_size}'"
+    assert threads > 0, f"threads needs to be larger than 0. Got '{threads}'"
+    inputs = {name: np.asanyarray(value) for name, value in inputs.items()}
+    lengths = {value.shape[0] for value in inputs.values() if value.ndim > 0}
+    assert all(value.ndim <= 1 for value in inputs.values()), "Inputs must be scalars or 1-dimensional arrays."
+    assert len(lengths) <= 1, f"Input arrays need the same length. Got lengths {sorted(lengths)}"
+    rows = lengths.pop() if lengths else 1
+    assert all(value.shape == (rows,) for value in outputs.values()), f"Outputs need shape ({rows},)."
+    names = list(outputs)
+
+    def price_chunk(start: int) -> Optional[int]:
+        """Price rows [start, start + chunk_size) and return the resident memory afterwards."""
+        stop = min(start + chunk_size, rows)
+        chunk = {name: value[start:stop] if value.ndim else value for name, value in inputs.items()}
+        for name, value in engine(**chunk, invalid=invalid).get_greeks(names).items():
+            outputs[name][start:stop] = value
+        if release_pages:
+            for array in (*inputs.values(), *outputs.values()):
+                _release_pages(array, start, stop)
+        return _resident_bytes()
+
+    start_time = time.perf_counter()
+    starts = range(0, rows, chunk_size)
+    if threads == 1:
+        resident = [price_chunk(start) for start in starts]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            resident = list(executor.map(price_chunk, starts))
+    resident = [rss for rss in [_resident_bytes(), *resident] if rss is not None]
+    return ChunkedPricingStats(
+        rows=rows,
+        chunks=len(starts),
+        seconds=time.perf_counter() - start_time,
+        peak_rss_bytes=max(resident) if resident else None,
+    )
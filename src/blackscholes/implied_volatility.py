@@ -0,0 +1,419 @@
+from enum import IntEnum
+from math import erfc, exp, isnan, log, sqrt
+from statistics import NormalDist
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from .vectorized import VectorizedStandardNormalMixin
+
+_INV_SQRT_2 = 0.7071067811865475244008443621048
+_INV_SQRT_2PI = 0.398942280401432677939946059934
+_TOLERANCE = 1e-5
+# Relative rounding error of a price in double precision, a few units in the last place
+_PRICE_PRECISION = 1e-15
+_inv_cdf = NormalDist().inv_cdf
+
+
+class ImpliedVolatilityStatus(IntEnum):
+    """Outcome of an implied volatility calculation."""
+
+    CONVERGED = 0
+    # Price is at or below the intrinsic value, so no positive volatility reproduces it.
+    BELOW_INTRINSIC = 1
+    # Price is at or above the upper no-arbitrage bound
+    # (S * exp(-qT) for calls and K * exp(-rT) for puts).
+    ABOVE_MAXIMUM = 2
+    # The iteration limit was reached before the volatility converged.
+    NOT_CONVERGED = 3
+    # Vega is so small that the rounding error of the price alone moves the volatility
+    # by more than the solver tolerance, ex. deep in the money or at extreme volatilities.
+    # The price does not identify the volatility.
+    VEGA_TOO_SMALL = 4
+
+
+class ImpliedVolatilityResult(NamedTuple):
+    """
+    Implied volatility together with how it was obtained. \n
+    `sigma` is NaN unless `status` is `ImpliedVolatilityStatus.CONVERGED`.
+    """
+
+    sigma: float
+    status: ImpliedVolatilityStatus
+    iterations: int
+
+    @property
+    def converged(self) -> bool:
+        """Whether the solver converged to the implied volatility."""
+        return self.status == ImpliedVolatilityStatus.CONVERGED
+
+
+class ImpliedVolatilityResultVectorized(NamedTuple):
+    """
+    Implied volatilities of a whole option chain together with how they were obtained. \n
+    `status` holds `ImpliedVolatilityStatus` codes per row and `sigma` is NaN
+    for every row that did not converge.
+    """
+
+    sigma: np.ndarray
+    status: np.ndarray
+    iterations: np.ndarray
+
+    @property
+    def converged(self) -> np.ndarray:
+        """Per-row flags for whether the solver converged to the implied volatility."""
+        return self.status == ImpliedVolatilityStatus.CONVERGED
+
+
+def _normalized_call(x: float, s: float) -> float:
+    """
+    Black price of an out-of-the-money call (x <= 0) normalized by sqrt(F * K) and the discount factor.
+
+    :param x: Log-moneyness ln(F / K) \n
+    :param s: Total volatility sigma * sqrt(T)
+    """
+    # N(d) = erfc(-d / sqrt(2)) / 2 keeps relative precision for negative d.
+    d1 = x / s + 0.5 * s
+    d2 = d1 - s
+    return 0.5 * (exp(0.5 * x) * erfc(-d1 * _INV_SQRT_2) - exp(-0.5 * x) * erfc(-d2 * _INV_SQRT_2))
+
+
+def _initial_guess(x: float, beta: float) -> "tuple[float, bool]":
+    """
+    Rational initial guess for the total volatility of an out-of-the-money call,
+    following the two-branch approach of Jäckel's "By Implication" (2006). \n
+    Returns the guess and whether it lies on the lower (small price) branch.
+    """
+    # The normalized price is convex in s below the inflection point s_c and concave above it.
+    s_c = sqrt(-2.0 * x)
+    b_c = _normalized_call(x, s_c) if x < 0.0 else 0.0
+    if beta < b_c:
+        # Convexity puts the secant through the origin and (s_c, b_c) above the price curve,
+        # so s_c * beta / b_c is a lower bound that is accurate close to the money.
+        # The asymptotic inversion of b ~ exp(-x^2 / (2 s^2)) takes over for tiny prices.
+        s_low = sqrt(2.0 * x * x / (-x - 4.0 * log(beta / b_c)))
+        return max(s_c * beta / b_c, s_low), True
+    # For large s the price tends to e^(x/2) - (e^(x/2) + e^(-x/2)) * N(-s/2)
+    p = (exp(0.5 * x) - beta) / (exp(0.5 * x) + exp(-0.5 * x))
+    return -2.0 * _inv_cdf(p), False
+
+
+def implied_volatility(
+    price: float,
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    q: float = 0.0,
+    is_call: bool = True,
+    max_iterations: int = 16,
+) -> ImpliedVolatilityResult:
+    """
+    Volatility for which the Black-Scholes-Merton price of a (European) option equals `price`. \n
+    The problem is normalized to an out-of-the-money call on the forward price.
+    Starting from a rational initial guess, third order Householder steps with
+    analytic vega (and its derivatives) converge to machine precision in a few iterations,
+    in the spirit of Jäckel's "Let's Be Rational".
+
+    :param price: Market price of the option \n
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param is_call: True for a call option and False for a put option \n
+    :param max_iterations: Maximum number of Householder steps
+
+    :return: Implied volatility, status and number of iterations used.
+    """
+    assert S > 0.0, f"Asset price (S) needs to be larger than 0. Got '{S}'"
+    assert K > 0.0, f"Strike price (K) needs to be larger than 0. Got '{K}'"
+    assert T > 0.0, f"Time to maturity (T) needs to be larger than 0. Got '{T}'"
+    assert q >= 0.0, f"Annual dividend yield (q) cannot be negative. Got '{q}'"
+    if price >= (S * exp(-q * T) if is_call else K * exp(-r * T)):
+        return ImpliedVolatilityResult(float("nan"), ImpliedVolatilityStatus.ABOVE_MAXIMUM, 0)
+    forward = S * exp((r - q) * T)
+    x = log(forward / K)
+    beta = price / (exp(-r * T) * sqrt(forward * K))
+    # Rounding error of the normalized price, which the intrinsic value does not remove
+    beta_rounding = _PRICE_PRECISION * beta
+    # Remove the intrinsic value of in-the-money options and use put-call symmetry.
+    # b_put(x, s) = b_call(-x, s), so the problem reduces to an out-of-the-money call.
+    if (x > 0.0) == is_call and x != 0.0:
+        beta -= abs(exp(0.5 * x) - exp(-0.5 * x))
+    x = -abs(x)
+    if beta <= 0.0:
+        return ImpliedVolatilityResult(float("nan"), ImpliedVolatilityStatus.BELOW_INTRINSIC, 0)
+    if isnan(beta):
+        return ImpliedVolatilityResult(float("nan"), ImpliedVolatilityStatus.NOT_CONVERGED, 0)
+
+    s, lower_branch = _initial_guess(x, beta)
+    log_beta = log(beta) if lower_branch else 0.0
+    x2 = x * x
+    for iteration in range(1, max_iterations + 1):
+        b = _normalized_call(x, s)
+        if b <= 0.0:
+            # The guess undershot so far that the price underflows
+            s *= 2.0
+            continue
+        # Analytic vega of the normalized price and the ratios of its derivatives
+        vega = _INV_SQRT_2PI * exp(-0.5 * x2 / (s * s) - 0.125 * s * s)
+        h2 = x2 / (s * s * s) - 0.25 * s
+        h3 = h2 * h2 - 3.0 * x2 / (s * s * s * s) - 0.25
+        if lower_branch:
+            # Newton on ln(b) is much better behaved for tiny prices
+            ratio = vega / b
+            newton = (log_beta - log(b)) / ratio
+            h3 = h3 - 3.0 * h2 * ratio + 2.0 * ratio * ratio
+            h2 = h2 - ratio
+        else:
+            newton = (beta - b) / vega
+        denominator = 1.0 + newton * (h2 + h3 * newton / 6.0)
+        step = newton * (1.0 + 0.5 * h2 * newton) / denominator if denominator > 0.0 else newton
+        # Far from the root the Householder correction can flip sign, use a plain Newton step then.
+        # The objective is concave in s on either branch, so Newton steps from below do not overshoot.
+        if step * newton <= 0.0:
+            step = newton
+        s = s + step if s + step > 0.0 else 0.5 * s
+        # Convergence is cubic, so after a step this small the remaining error is below round-off
+        if abs(step) <= _TOLERANCE * s:
+            if vega * _TOLERANCE * s <= beta_rounding:
+                return ImpliedVolatilityResult(float("nan"), ImpliedVolatilityStatus.VEGA_TOO_SMALL, iteration)
+            return ImpliedVolatilityResult(s / sqrt(T), ImpliedVolatilityStatus.CONVERGED, iteration)
+    return ImpliedVolatilityResult(float("nan"), ImpliedVolatilityStatus.NOT_CONVERGED, max_iterations)
+
+
+def _normalized_call_vectorized(x: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """Vectorized version of `_normalized_call`."""
+    d1 = x / s + 0.5 * s
+    cdf = VectorizedStandardNormalMixin._cdf
+    return np.exp(0.5 * x) * cdf(d1) - np.exp(-0.5 * x) * cdf(d1 - s)
+
+
+def _initial_guess_vectorized(x: np.ndarray, beta: np.ndarray) -> "tuple[np.ndarray, np.ndarray]":
+    """Vectorized version of `_initial_guess`."""
+    s_c = np.sqrt(-2.0 * x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b_c = np.where(x < 0.0, _normalized_call_vectorized(x, s_c), 0.0)
+        lower_branch = beta < b_c
+        s_low = np.maximum(s_c * beta / b_c, np.sqrt(2.0 * x * x / (-x - 4.0 * np.log(beta / b_c))))
+    p = (np.exp(0.5 * x) - beta) / (np.exp(0.5 * x) + np.exp(-0.5 * x))
+    s_high = -2.0 * VectorizedStandardNormalMixin._inv_cdf(np.where(lower_branch, 0.25, p))
+    return np.where(lower_branch, s_low, s_high), lower_branch
+
+
+def implied_volatility_vectorized(
+    price: ArrayLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    q: ArrayLike = 0.0,
+    is_call: ArrayLike = True,
+    max_iterations: int = 16,
+    initial_sigma: Optional[ArrayLike] = None,
+) -> ImpliedVolatilityResultVectorized:
+    """
+    Implied volatilities for whole option chains at once. \n
+    Solves every row with the same algorithm as `implied_volatility`, using NumPy.
+    Rows drop out of the iteration as soon as they have converged,
+    so the remaining work shrinks with every step.
+    All inputs broadcast against each other.
+
+    :param price: Market prices of the options \n
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param is_call: True for call options and False for put options \n
+    :param max_iterations: Maximum number of Householder steps \n
+    :param initial_sigma: Optional starting volatilities, for example the solution of the previous tick.
+    Rows where it is NaN or not positive start from the rational initial guess.
+
+    :return: Implied volatilities, status codes and number of iterations used per row.
+    """
+    price, S, K, T, r, q = (
+        np.asarray(param, dtype=np.float64) for param in (price, S, K, T, r, q)
+    )
+    # Parameter checks
+    assert np.all(S > 0.0), "Asset price (S) needs to be larger than 0."
+    assert np.all(K > 0.0), "Strike price (K) needs to be larger than 0."
+    assert np.all(T > 0.0), "Time to maturity (T) needs to be larger than 0."
+    assert np.all(q >= 0.0), "Annual dividend yield (q) cannot be negative."
+    price, S, K, T, r, q, is_call = np.broadcast_arrays(
+        price, S, K, T, r, q, np.asarray(is_call, dtype=bool)
+    )
+    shape = price.shape
+    price, S, K, T, r, q, is_call = (param.ravel() for param in (price, S, K, T, r, q, is_call))
+
+    sigma = np.full(price.shape, np.nan)
+    status = np.full(price.shape, ImpliedVolatilityStatus.NOT_CONVERGED, dtype=np.int8)
+    iterations = np.zeros(price.shape, dtype=np.int64)
+
+    above = price >= np.where(is_call, S * np.exp(-q * T), K * np.exp(-r * T))
+    forward = S * np.exp((r - q) * T)
+    x = np.log(forward / K)
+    beta = price / (np.exp(-r * T) * np.sqrt(forward * K))
+    beta_rounding = _PRICE_PRECISION * beta
+    # Remove the intrinsic value of in-the-money options and use put-call symmetry
+    in_the_money = ((x > 0.0) == is_call) & (x != 0.0)
+    beta = beta - np.where(in_the_money, np.abs(np.exp(0.5 * x) - np.exp(-0.5 * x)), 0.0)
+    x = -np.abs(x)
+    below = ~above & (beta <= 0.0)
+    status[above] = ImpliedVolatilityStatus.ABOVE_MAXIMUM
+    status[below] = ImpliedVolatilityStatus.BELOW_INTRINSIC
+
+    # Indices of the rows that are still iterating
+    active = np.flatnonzero(~(above | below | np.isnan(beta)))
+    x, beta, beta_rounding = x[active], beta[active], beta_rounding[active]
+    if initial_sigma is None:
+        s, lower_branch = _initial_guess_vectorized(x, beta)
+    else:
+        s = np.broadcast_to(np.asarray(initial_sigma, dtype=np.float64), shape).ravel()[active] * np.sqrt(T[active])
+        # The price is convex in s below s_c = sqrt(-2x), which selects the objective
+        lower_branch = s < np.sqrt(-2.0 * x)
+        cold = ~(s > 0.0)
+        if cold.any():
+            s[cold], lower_branch[cold] = _initial_guess_vectorized(x[cold], beta[cold])
+    log_beta = np.log(beta)
+    for iteration in range(1, max_iterations + 1):
+        if active.size == 0:
+            break
+        iterations[active] = iteration
+        b = _normalized_call_vectorized(x, s)
+        # The guess undershot so far that the price underflows
+        underflow = b <= 0.0
+        b = np.where(underflow, 1.0, b)
+        x2 = x * x
+        vega = _INV_SQRT_2PI * np.exp(-0.5 * x2 / (s * s) - 0.125 * s * s)
+        h2 = x2 / (s * s * s) - 0.25 * s
+        h3 = h2 * h2 - 3.0 * x2 / (s * s * s * s) - 0.25
+        # Newton on ln(b) for the lower branch
+        ratio = vega / b
+        newton = np.where(lower_branch, (log_beta - np.log(b)) / ratio, (beta - b) / vega)
+        h3 = np.where(lower_branch, h3 - 3.0 * h2 * ratio + 2.0 * ratio * ratio, h3)
+        h2 = np.where(lower_branch, h2 - ratio, h2)
+        denominator = 1.0 + newton * (h2 + h3 * newton / 6.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = np.where(denominator > 0.0, newton * (1.0 + 0.5 * h2 * newton) / denominator, newton)
+        step = np.where(step * newton > 0.0, step, newton)
+        s = np.where(underflow, 2.0 * s, np.where(s + step > 0.0, s + step, 0.5 * s))
+
+        done = ~underflow & (np.abs(step) <= _TOLERANCE * s)
+        # Rows where the rounding error of the price alone moves the volatility by more than the tolerance
+        flat = done & (vega * _TOLERANCE * s <= beta_rounding)
+        status[active[flat]] = ImpliedVolatilityStatus.VEGA_TOO_SMALL
+        identified = done & ~flat
+        converged = active[identified]
+        sigma[converged] = s[identified] / np.sqrt(T[converged])
+        status[converged] = ImpliedVolatilityStatus.CONVERGED
+        keep = ~done
+        active, x, beta, beta_rounding, log_beta, s, lower_branch = (
+            a[keep] for a in (active, x, beta, beta_rounding, log_beta, s, lower_branch)
+        )
+    return ImpliedVolatilityResultVectorized(sigma.reshape(shape), status.reshape(shape), iterations.reshape(shape))
+
+
+class IncrementalImpliedVolatility:
+    """
+    Implied volatilities of an option chain that is updated tick by tick. \n
+    Keeps the prices, underlying prices and volatilities of the last solve per instrument.
+    On every update only the rows whose price or underlying price moved beyond the tolerances
+    are solved again, starting from their previous volatility.
+    The other rows keep their previous result.
+
+    :param K: Strike prices \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param is_call: True for call options and False for put options \n
+    :param price_tolerance: Absolute change in option price that triggers a new solve \n
+    :param spot_tolerance: Absolute change in underlying price that triggers a new solve \n
+    :param max_iterations: Maximum number of Householder steps per solve
+    """
+
+    def __init__(
+        self,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        q: ArrayLike = 0.0,
+        is_call: ArrayLike = True,
+        price_tolerance: float = 0.0,
+        spot_tolerance: float = 0.0,
+        max_iterations: int = 16,
+    ):
+        assert price_tolerance >= 0.0, f"Price tolerance cannot be negative. Got '{price_tolerance}'"
+        assert spot_tolerance >= 0.0, f"Spot tolerance cannot be negative. Got '{spot_tolerance}'"
+        K, T, r, q, is_call = np.broadcast_arrays(
+            *(np.asarray(param, dtype=np.float64) for param in (K, T, r, q)), np.asarray(is_call, dtype=bool)
+        )
+        assert K.ndim == 1, "Instruments need to be given as 1-dimensional arrays."
+        self.K, self.T, self.r, self.q, self.is_call = (param.copy() for param in (K, T, r, q, is_call))
+        self.price_tolerance = price_tolerance
+        self.spot_tolerance = spot_tolerance
+        self.max_iterations = max_iterations
+        n = K.shape[0]
+        # State of the last solve per instrument. NaN prices force a solve on the first update.
+        self.price = np.full(n, np.nan)
+        self.S = np.full(n, np.nan)
+        self.sigma = np.full(n, np.nan)
+        self.status = np.full(n, ImpliedVolatilityStatus.NOT_CONVERGED, dtype=np.int8)
+
+    def update(
+        self,
+        price: ArrayLike,
+        S: ArrayLike,
+        T: Optional[ArrayLike] = None,
+        r: Optional[ArrayLike] = None,
+        q: Optional[ArrayLike] = None,
+    ) -> ImpliedVolatilityResultVectorized:
+        """
+        Update the chain with new market data and solve the rows that moved. \n
+        Changing `T`, `r` or `q` marks every row for which they changed as moved.
+
+        :param price: Market prices of the options \n
+        :param S: Price of underlying asset \n
+        :param T: Optional new times till expiration \n
+        :param r: Optional new risk-free interest rates \n
+        :param q: Optional new annual dividend yields
+
+        :return: Implied volatilities and status codes of all rows.
+        `iterations` is 0 for rows that were not solved again.
+        """
+        n = self.K.shape[0]
+        price, S = (np.broadcast_to(np.asarray(param, dtype=np.float64), (n,)) for param in (price, S))
+        # Rows without a previous solution always move because comparisons with NaN are False
+        moved = ~(np.abs(price - self.price) <= self.price_tolerance)
+        moved |= ~(np.abs(S - self.S) <= self.spot_tolerance)
+        for name, value in (("T", T), ("r", r), ("q", q)):
+            if value is not None:
+                value = np.broadcast_to(np.asarray(value, dtype=np.float64), (n,))
+                current = getattr(self, name)
+                moved |= value != current
+                current[:] = value
+
+        iterations = np.zeros(n, dtype=np.int64)
+        rows = np.flatnonzero(moved)
+        if rows.size:
+            warm = np.where(self.status[rows] == ImpliedVolatilityStatus.CONVERGED, self.sigma[rows], np.nan)
+            result = implied_volatility_vectorized(
+                price[rows],
+                S[rows],
+                self.K[rows],
+                self.T[rows],
+                self.r[rows],
+                self.q[rows],
+                self.is_call[rows],
+                max_iterations=self.max_iterations,
+                initial_sigma=warm,
+            )
+            self.price[rows] = price[rows]
+            self.S[rows] = S[rows]
+            self.sigma[rows] = result.sigma
+            self.status[rows] = result.status
+            iterations[rows] = result.iterations
+        return ImpliedVolatilityResultVectorized(self.sigma.copy(), self.status.copy(), iterations)
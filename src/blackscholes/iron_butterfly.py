@@ -1,8 +1,9 @@
-from blackscholes.base import BlackScholesStructureBase
-from blackscholes import BlackScholesCall, BlackScholesPut
+from .call import BlackScholesCall
+from .put import BlackScholesPut
+from .structure import BlackScholesStructure, _leg
 
 
-class BlackScholesIronButterflyLong(BlackScholesStructureBase):
+class BlackScholesIronButterflyLong(BlackScholesStructure):
     """
     Create long iron butterfly option structure. \n
     - Long iron butterfly -> - Put(K1) + Put(K2) + Call(K3) - Call(K4)
@@ -19,6 +20,12 @@ class BlackScholesIronButterflyLong(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    put1 = _leg(0)
+    put2 = _leg(1)
+    call1 = _leg(2)
+    call2 = _leg(3)
+
     def __init__(
         self,
         S: float,
@@ -40,31 +47,18 @@ class BlackScholesIronButterflyLong(BlackScholesStructureBase):
         ), f"""All strike prices must be equidistant, so K4 - K3 = K3 - K2 = K2 - K1.
         Got {K3}-{K2} != {K2}-{K1}.
         """
-        super().__init__()
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.put2 = BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        self.call1 = BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        self.call2 = BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q)
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from two put and two call options into a long iron butterfly. \n
-        All greeks and price are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to long iron butterfly.
-        """
-        put_attr1 = getattr(self.put1, attribute_name)
-        put_attr2 = getattr(self.put2, attribute_name)
-        call_attr1 = getattr(self.call1, attribute_name)
-        call_attr2 = getattr(self.call2, attribute_name)
-        return -put_attr1() + put_attr2() + call_attr1() - call_attr2()
+        self._set_legs(
+            quantity=[-1.0, 1.0, 1.0, -1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
 
 
-class BlackScholesIronButterflyShort(BlackScholesStructureBase):
+class BlackScholesIronButterflyShort(BlackScholesStructure):
     """
     Create short iron butterfly option structure. \n
     - Short iron butterfly -> Put(K1) - Put(K2) - Call(K3) + Call(K4)
@@ -81,6 +75,12 @@ class BlackScholesIronButterflyShort(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    put1 = _leg(0)
+    put2 = _leg(1)
+    call1 = _leg(2)
+    call2 = _leg(3)
+
     def __init__(
         self,
         S: float,
@@ -102,25 +102,12 @@ class BlackScholesIronButterflyShort(BlackScholesStructureBase):
         ), f"""All strike prices must be equidistant, so K4 - K3 = K3 - K2 = K2 - K1.
         Got {K3}-{K2} != {K2}-{K1}.
         """
-        super().__init__()
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.put2 = BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        self.call1 = BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        self.call2 = BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q)
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from two put and two call options into a short iron butterfly. \n
-        All greeks and price are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to short iron butterfly.
-        """
-        put_attr1 = getattr(self.put1, attribute_name)
-        put_attr2 = getattr(self.put2, attribute_name)
-        call_attr1 = getattr(self.call1, attribute_name)
-        call_attr2 = getattr(self.call2, attribute_name)
-        return put_attr1() - put_attr2() - call_attr1() + call_attr2()
+        self._set_legs(
+            quantity=[1.0, -1.0, -1.0, 1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
@@ -1,8 +1,9 @@
-from blackscholes.base import BlackScholesStructureBase
-from blackscholes import BlackScholesCall, BlackScholesPut
+from .call import BlackScholesCall
+from .put import BlackScholesPut
+from .structure import BlackScholesStructure, _leg
 
 
-class BlackScholesIronCondorLong(BlackScholesStructureBase):
+class BlackScholesIronCondorLong(BlackScholesStructure):
     """
     Create long iron condor option structure. \n
     - Long iron condor -> Put(K1) - Put(K2) - Call(K3) + Call(K4)
@@ -20,6 +21,12 @@ class BlackScholesIronCondorLong(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    put1 = _leg(0)
+    put2 = _leg(1)
+    call1 = _leg(2)
+    call2 = _leg(3)
+
     def __init__(
         self,
         S: float,
@@ -42,31 +49,18 @@ class BlackScholesIronCondorLong(BlackScholesStructureBase):
         ), f"""Strike price must be symmetric, so K4 - K3 = K2 - K1.
         Got {K2}-{K1} != {K3}-{K2}.
         """
-        super().__init__()
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.put2 = BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        self.call1 = BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q)
-        self.call2 = BlackScholesCall(S=S, K=K4, T=T, r=r, sigma=sigma, q=q)
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from two put and two call options into a long iron condor. \n
-        All greeks and price are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to long iron condor.
-        """
-        put_attr1 = getattr(self.put1, attribute_name)
-        put_attr2 = getattr(self.put2, attribute_name)
-        call_attr1 = getattr(self.call1, attribute_name)
-        call_attr2 = getattr(self.call2, attribute_name)
-        return -put_attr1() + put_attr2() + call_attr1() - call_attr2()
+        self._set_legs(
+            quantity=[-1.0, 1.0, 1.0, -1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K4, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
 
 
-class BlackScholesIronCondorShort(BlackScholesStructureBase):
+class BlackScholesIronCondorShort(BlackScholesStructure):
     """
     Create short iron condor option structure. \n
     - Short iron condor -> -Put(K1) + Put(K2) + Call(K3) - Call(K4)
@@ -84,6 +78,12 @@ class BlackScholesIronCondorShort(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    put1 = _leg(0)
+    put2 = _leg(1)
+    call1 = _leg(2)
+    call2 = _leg(3)
+
     def __init__(
         self,
         S: float,
@@ -106,25 +106,12 @@ class BlackScholesIronCondorShort(BlackScholesStructureBase):
         ), f"""Strike price must be symmetric, so K4 - K3 = K2 - K1.
         Got {K2}-{K1} != {K3}-{K2}.
         """
-        super().__init__()
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.put2 = BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        self.call1 = BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q)
-        self.call2 = BlackScholesCall(S=S, K=K4, T=T, r=r, sigma=sigma, q=q)
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from two put and two call options into a short iron condor. \n
-        All greeks and price are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to short iron condor.
-        """
-        put_attr1 = getattr(self.put1, attribute_name)
-        put_attr2 = getattr(self.put2, attribute_name)
-        call_attr1 = getattr(self.call1, attribute_name)
-        call_attr2 = getattr(self.call2, attribute_name)
-        return put_attr1() - put_attr2() - call_attr1() + call_attr2()
+        self._set_legs(
+            quantity=[1.0, -1.0, -1.0, 1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K3, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K4, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
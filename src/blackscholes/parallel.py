@@ -0,0 +1,213 @@
+import multiprocessing
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Type
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from .chunked import auto_chunk_size, price_chunked
+from .jit import NUMBA_AVAILABLE
+from .vectorized import VectorizedInputsMixin, _check_dtype
+
+# Arrays in the shared block start on cache line boundaries
+_ALIGNMENT = 64
+
+# (name, dtype, byte offset) of every array in a shared memory block
+_Layout = List[Tuple[str, str, int]]
+
+
+def _layout(columns: Iterable[Tuple[str, np.dtype]], rows: int, offset: int) -> Tuple[_Layout, int]:
+    """Place arrays of `rows` values one after the other from `offset`. Also returns the end of the last array."""
+    layout = []
+    for name, dtype in columns:
+        layout.append((name, dtype.str, offset))
+        offset += -(-rows * dtype.itemsize // _ALIGNMENT) * _ALIGNMENT
+    return layout, offset
+
+
+def _engine_dtype(engine: Type[VectorizedInputsMixin]) -> np.dtype:
+    """Floating point type of the outputs of an engine, ex. float32 for `partial(BlackScholesVectorized, dtype=np.float32)`."""
+    keywords = getattr(engine, "keywords", None) or {}
+    return _check_dtype(keywords.get("dtype", np.float64))
+
+
+def _attach(shm: shared_memory.SharedMemory, layout: _Layout, rows: int) -> Dict[str, np.ndarray]:
+    """Arrays of `layout` as views on a shared memory block."""
+    return {name: np.ndarray((rows,), dtype=dtype, buffer=shm.buf, offset=offset) for name, dtype, offset in layout}
+
+
+def _price_views(
+    shm: shared_memory.SharedMemory,
+    input_layout: _Layout,
+    output_layout: _Layout,
+    rows: int,
+    scalars: Dict[str, float],
+    engine: Type[VectorizedInputsMixin],
+    start: int,
+    stop: int,
+    chunk_size: int,
+    invalid: str,
+) -> None:
+    """Price rows [start, stop) of the shared inputs into the shared outputs."""
+    inputs = {name: value[start:stop] for name, value in _attach(shm, input_layout, rows).items()}
+    outputs = {name: value[start:stop] for name, value in _attach(shm, output_layout, rows).items()}
+    price_chunked(engine, dict(inputs, **scalars), outputs, chunk_size=chunk_size, invalid=invalid, release_pages=False)
+
+
+def _price_slice(shm_name: str, *args) -> None:
+    """Worker task: attach to the shared memory block and price a slice of it, see `_price_views`."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        _price_views(shm, *args)
+    except BaseException as error:
+        # The traceback keeps the views alive, which stops the block from being closed
+        traceback.clear_frames(error.__traceback__)
+        raise
+    finally:
+        shm.close()
+
+
+class ParallelPricer:
+    """
+    Prices large books with a pool of worker processes or threads. \n
+    With backend="process", input and output arrays are placed in one `multiprocessing.shared_memory` block,
+    so they are never pickled. Every worker prices a contiguous slice of the rows
+    with a vectorized engine, in chunks of `chunk_size` rows.
+    The pool is started once and reused by every call to `price`, so use it as a context manager
+    or call `close` when done. \n
+    With backend="thread", chunks are priced by threads of this process with `price_chunked`.
+    NumPy releases the GIL in its kernels, so threads use several cores without
+    starting processes or copying arrays.
+
+    :param workers: Number of worker processes or threads. Defaults to the number of CPUs available to this process. \n
+    :param chunk_size: Number of options a worker prices at once. Defaults to `auto_chunk_size()`, sized to the L2 cache. \n
+    :param backend: "process" or "thread" \n
+    :param mp_context: Optional multiprocessing context for backend="process", ex. `multiprocessing.get_context("spawn")`.
+    When numba is installed, defaults to "forkserver" (or "spawn"), because forking a process
+    in which Numba has started its threads hangs that process at exit.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None, backend: str = "process", mp_context=None):
+        if workers is None:
+            workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = auto_chunk_size()
+        assert workers > 0, f"workers needs to be larger than 0. Got '{workers}'"
+        assert chunk_size > 0, f"chunk_size needs to be larger than 0. Got '{chunk_size}'"
+        assert backend in ("process", "thread"), f"backend needs to be 'process' or 'thread'. Got '{backend}'"
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.backend = backend
+        if mp_context is None and NUMBA_AVAILABLE:
+            methods = multiprocessing.get_all_start_methods()
+            mp_context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) if backend == "process" else None
+
+    def __enter__(self) -> "ParallelPricer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def price(
+        self,
+        engine: Type[VectorizedInputsMixin],
+        inputs: Mapping[str, ArrayLike],
+        names: Iterable[str] = ("price",),
+        invalid: str = "raise",
+    ) -> Dict[str, np.ndarray]:
+        """
+        Prices and Greeks of a book, computed in parallel.
+
+        :param engine: Vectorized engine class. Ex. `BlackScholesVectorized` or `Black76Vectorized`.
+        Outputs have the dtype of the engine, ex. float32 for `partial(BlackScholesVectorized, dtype=np.float32)`. \n
+        :param inputs: Arguments of `engine` by name. Arrays hold one value per option,
+        scalars apply to every option. \n
+        :param names: Names of the outputs. "price" and the names of the Greeks of `engine` are accepted. \n
+        :param invalid: "raise" or "nan", see `engine`
+
+        :return: Array with one value per option for every name.
+        """
+        names = tuple(names)
+        dtype = _engine_dtype(engine)
+        inputs = {name: np.asarray(value) for name, value in inputs.items()}
+        if self.backend == "thread":
+            shape = np.broadcast_shapes(*(value.shape for value in inputs.values()))
+            assert len(shape) <= 1, "Inputs must be scalars or 1-dimensional arrays."
+            outputs = {name: np.empty(shape[0] if shape else 1, dtype=dtype) for name in names}
+            price_chunked(engine, inputs, outputs, chunk_size=self.chunk_size, invalid=invalid, release_pages=False, threads=self.workers)
+            return outputs
+        assert all(value.ndim <= 1 for value in inputs.values()), "Inputs must be scalars or 1-dimensional arrays."
+        lengths = {value.shape[0] for value in inputs.values() if value.ndim == 1}
+        assert len(lengths) <= 1, f"Input arrays need the same length. Got lengths {sorted(lengths)}"
+        rows = lengths.pop() if lengths else 1
+        # Floating point inputs are shared in the dtype of the engine, which converts them to it anyway
+        arrays = {
+            name: value.astype(dtype, copy=False) if value.dtype.kind == "f" else value
+            for name, value in inputs.items() if value.ndim == 1
+        }
+        scalars = {name: value.item() for name, value in inputs.items() if value.ndim == 0}
+        if not arrays:
+            # Nothing to share, ex. a single option
+            arrays = {name: np.full(1, value) for name, value in scalars.items()}
+            scalars = {}
+
+        # The inputs followed by the outputs in one block
+        input_layout, size = _layout(((name, value.dtype) for name, value in arrays.items()), rows, 0)
+        output_layout, size = _layout(((name, dtype) for name in names), rows, size)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        shared_inputs, shared_outputs = _attach(shm, input_layout, rows), _attach(shm, output_layout, rows)
+        try:
+            for name, view in shared_inputs.items():
+                view[:] = arrays[name]
+            bounds = np.linspace(0, rows, min(self.workers, rows) + 1).astype(int)
+            futures = [
+                self._executor.submit(
+                    _price_slice, shm.name, input_layout, output_layout, rows, scalars,
+                    engine, start, stop, self.chunk_size, invalid,
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+            return {name: view.copy() for name, view in shared_outputs.items()}
+        finally:
+            # Views must be gone before the block can be closed
+            view = shared_inputs = shared_outputs = None
+            shm.close()
+            shm.unlink()
+
+
+def price_parallel(
+    engine: Type[VectorizedInputsMixin],
+    inputs: Mapping[str, ArrayLike],
+    names: Iterable[str] = ("price",),
+    workers: Optional[int] = None,
+    invalid: str = "raise",
+    backend: str = "process",
+) -> Dict[str, np.ndarray]:
+    """
+    Prices and Greeks of a book, computed by a temporary `ParallelPricer`. \n
+    Starting the worker processes takes time, so reuse a `ParallelPricer` for repeated calls.
+    Threads start quickly, so backend="thread" is also cheap as a one-off.
+
+    :param engine: Vectorized engine class. Ex. `BlackScholesVectorized` or `Black76Vectorized`.
+    Outputs have the dtype of the engine, ex. float32 for `partial(BlackScholesVectorized, dtype=np.float32)`. \n
+    :param inputs: Arguments of `engine` by name. Arrays hold one value per option,
+    scalars apply to every option. \n
+    :param names: Names of the outputs. "price" and the names of the Greeks of `engine` are accepted. \n
+    :param workers: Number of worker processes. Defaults to the number of CPUs available. \n
+    :param invalid: "raise" or "nan", see `engine` \n
+    :param backend: "process" or "thread"
+    """
+    with ParallelPricer(workers=workers, backend=backend) as pricer:
+        return pricer.price(engine, inputs, names=names, invalid=invalid)
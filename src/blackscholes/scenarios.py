@@ -0,0 +1,205 @@
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from .book import _FAMILIES, OptionBook
+from .chunked import auto_chunk_size
+from .structure import BlackScholesStructure
+from .vectorized import Black76Vectorized, BinaryVectorized, BlackScholesVectorized
+
+
+# Lowest volatility of a shocked position (0.01 volatility points)
+MIN_SHOCKED_SIGMA = 1e-4
+
+
+class _ScenarioInputs:
+    """
+    Inputs of a vectorized engine that keep their own shapes instead of being broadcast. \n
+    Positions run along the first axis and spot, volatility and time shocks along the other three,
+    so intermediates like sqrt(T), exp(-r*T) and sigma * sqrt(T) are computed once per position
+    and shock of the inputs they depend on, and shared by all other scenarios through broadcasting.
+    Inputs are checked by `ScenarioGrid`.
+    """
+
+    def __init__(self, accuracy: str, **inputs: np.ndarray):
+        self._set_inputs(**inputs)
+        self._accuracy = accuracy
+
+
+class _BlackScholesScenarios(_ScenarioInputs, BlackScholesVectorized):
+    pass
+
+
+class _Black76Scenarios(_ScenarioInputs, Black76Vectorized):
+    pass
+
+
+class _BinaryScenarios(_ScenarioInputs, BinaryVectorized):
+    pass
+
+
+_SCENARIO_ENGINES = {
+    BlackScholesVectorized: _BlackScholesScenarios,
+    Black76Vectorized: _Black76Scenarios,
+    BinaryVectorized: _BinaryScenarios,
+}
+
+
+class ScenarioGrid:
+    """
+    Full revaluation of option positions over a grid of spot, volatility and time scenarios. \n
+    Every combination of a spot shock, a volatility shock and a time step is one scenario,
+    ordered with the spot shock changing slowest and the time step fastest,
+    so `values.reshape(len(book), *grid.shape)` gives a (positions, spot, vol, time) cube. \n
+    Positions are evaluated against all scenarios at once by broadcasting. Intermediates
+    that do not depend on a shocked input are not recomputed per scenario: exp(-r*T) and sqrt(T)
+    are computed once per position and time step, sigma * sqrt(T) once per volatility shock and
+    time step, and log(S/K) once per spot shock. \n
+    Positions that expire within a time step are valued at their payoff.
+    Volatility shocks that would take the volatility of a position to 0 or below
+    floor it at `MIN_SHOCKED_SIGMA` instead.
+    Ex. 21 spot shocks x 11 vol shocks x 3 time steps ->
+    `ScenarioGrid(np.linspace(-0.1, 0.1, 21), np.linspace(-0.05, 0.05, 11), [0.0, 1/365, 7/365])`
+
+    :param spot_shocks: Relative moves of the underlying (or futures) price (0.05 indicates +5%) \n
+    :param vol_shocks: Absolute moves of the volatility (0.01 indicates +1 volatility point) \n
+    :param time_steps: Time that passes in years (1/365 indicates 1 day) \n
+    :param accuracy: "full" or "fast", see `BlackScholesVectorized`
+    """
+
+    def __init__(
+        self,
+        spot_shocks: ArrayLike = (0.0,),
+        vol_shocks: ArrayLike = (0.0,),
+        time_steps: ArrayLike = (0.0,),
+        accuracy: str = "full",
+    ):
+        spot_shocks, vol_shocks, time_steps = (
+            np.atleast_1d(np.asarray(shocks, dtype=np.float64)) for shocks in (spot_shocks, vol_shocks, time_steps)
+        )
+        for name, shocks in (("spot_shocks", spot_shocks), ("vol_shocks", vol_shocks), ("time_steps", time_steps)):
+            if shocks.ndim != 1 or shocks.size == 0:
+                raise ValueError(f"{name} needs to be a non-empty 1-dimensional array. Got shape {shocks.shape}")
+            if not np.isfinite(shocks).all():
+                raise ValueError(f"{name} needs to be finite.")
+        if not (spot_shocks > -1.0).all():
+            raise ValueError("Spot shocks need to be larger than -1 (-100%).")
+        if not (time_steps >= 0.0).all():
+            raise ValueError("Time steps cannot be negative.")
+        if accuracy not in ("full", "fast"):
+            raise ValueError(f"accuracy needs to be 'full' or 'fast'. Got '{accuracy}'")
+        self.spot_shocks = spot_shocks
+        self.vol_shocks = vol_shocks
+        self.time_steps = time_steps
+        self.accuracy = accuracy
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Number of spot shocks, volatility shocks and time steps."""
+        return self.spot_shocks.size, self.vol_shocks.size, self.time_steps.size
+
+    def __len__(self) -> int:
+        """Number of scenarios."""
+        return self.spot_shocks.size * self.vol_shocks.size * self.time_steps.size
+
+    def scenarios(self) -> Dict[str, np.ndarray]:
+        """Spot shock, volatility shock and time step of every scenario, as {"spot", "vol", "time"}."""
+        spot, vol, time = np.meshgrid(self.spot_shocks, self.vol_shocks, self.time_steps, indexing="ij")
+        return {"spot": spot.ravel(), "vol": vol.ravel(), "time": time.ravel()}
+
+    def values(self, book: OptionBook) -> np.ndarray:
+        """
+        Fair value per option (without quantities) in every scenario. \n
+        With invalid="nan" books, positions with invalid inputs are NaN.
+
+        :param book: Positions to revalue
+
+        :return: Array of shape (positions, scenarios)
+        """
+        return _revalue(book, self.spot_shocks, self.vol_shocks, self.time_steps, self.accuracy)
+
+    def pnl(self, book: OptionBook) -> np.ndarray:
+        """
+        Profit and loss per position in every scenario: quantity times the change from the current value.
+        Time steps are included, so the P&L also holds the time decay of the positions.
+
+        :param book: Positions to revalue
+
+        :return: Array of shape (positions, scenarios)
+        """
+        # Current values with the same accuracy, so that P&L is exactly 0 without shocks
+        current = ScenarioGrid(accuracy=self.accuracy).values(book)
+        return book.positions["quantity"][:, None] * (self.values(book) - current)
+
+    def structure_pnl(self, structures: Sequence[BlackScholesStructure]) -> np.ndarray:
+        """
+        Profit and loss per option structure in every scenario, ex. for a list of preset straddles and condors.
+        The legs of all structures are revalued in one pass.
+
+        :param structures: Option structures to revalue
+
+        :return: Array of shape (structures, scenarios)
+        """
+        if len(structures) == 0:
+            return np.empty((0, len(self)))
+        legs = OptionBook()
+        for structure in structures:
+            legs.extend(structure.to_book())
+        starts = np.cumsum([0] + [len(structure) for structure in structures[:-1]])
+        return np.add.reduceat(self.pnl(legs), starts, axis=0)
+
+
+def _revalue(
+    book: OptionBook, spot_shocks: np.ndarray, vol_shocks: np.ndarray, time_steps: np.ndarray, accuracy: str
+) -> np.ndarray:
+    """
+    Value per option in every combination of a spot shock, volatility shock and time step,
+    as (positions, spot x vol x time) with the time step changing fastest. \n
+    Shocks are 1-dimensional arrays shared by all positions,
+    or 2-dimensional arrays with one row of shocks per position.
+    With invalid="nan" books, positions with invalid inputs are NaN.
+    """
+    positions = book.positions
+    shape = (spot_shocks.shape[-1], vol_shocks.shape[-1], time_steps.shape[-1])
+    values = np.full((len(book), int(np.prod(shape))), np.nan)
+    kind = positions["kind"]
+    valid = book.errors() == 0 if book._invalid == "nan" else True
+    # Positions per pass, so that the intermediates of a pass stay in cache
+    chunk_size = max(auto_chunk_size() // values.shape[1], 1)
+    for engine, call, put in _FAMILIES:
+        rows = np.flatnonzero(((kind == call) | (kind == put)) & valid)
+        for start in range(0, rows.size, chunk_size):
+            chunk = rows[start : start + chunk_size]
+            shocks = (shocks[chunk] if shocks.ndim == 2 else shocks for shocks in (spot_shocks, vol_shocks, time_steps))
+            values[chunk] = _family_values(engine, positions[chunk], kind[chunk] == call, *shocks, accuracy).reshape(chunk.size, -1)
+    return values
+
+
+def _family_values(
+    engine: type, positions: np.ndarray, is_call: np.ndarray,
+    spot_shocks: np.ndarray, vol_shocks: np.ndarray, time_steps: np.ndarray, accuracy: str,
+) -> np.ndarray:
+    """Values of positions of one option family as (positions, spot shocks, volatility shocks, time steps)."""
+    n = positions.shape[0]
+    # Positions along axis 0, then spot shocks, volatility shocks and time steps
+    S = positions["S"].reshape(n, 1, 1, 1) * (1.0 + spot_shocks[..., :, None, None])
+    # Volatility shocks larger than the volatility of a position are floored, instead of failing the whole run
+    sigma = np.maximum(positions["sigma"].reshape(n, 1, 1, 1) + vol_shocks[..., None, :, None], MIN_SHOCKED_SIGMA)
+    T = positions["T"].reshape(n, 1, 1, 1) - time_steps[..., None, None, :]
+    # Positions that expire within a time step get their payoff below
+    expired = T <= 0.0
+    T = np.where(expired, np.nan, T)
+    K, r, q = (positions[name].reshape(n, 1, 1, 1) for name in ("K", "r", "q"))
+    is_call = is_call.reshape(n, 1, 1, 1)
+    if engine is Black76Vectorized:
+        options = _Black76Scenarios(accuracy, F=S, K=K, T=T, r=r, sigma=sigma, is_call=is_call)
+    else:
+        options = _SCENARIO_ENGINES[engine](accuracy, S=S, K=K, T=T, r=r, sigma=sigma, q=q, is_call=is_call)
+    values = np.broadcast_to(options.price(), np.broadcast_shapes(S.shape, sigma.shape, T.shape))
+    if expired.any():
+        moneyness = np.where(is_call, S - K, K - S)
+        payoff = (moneyness > 0.0).astype(np.float64) if engine is BinaryVectorized else np.maximum(moneyness, 0.0)
+        values = np.where(expired, payoff, values)
+    return values
@@ -0,0 +1,175 @@
+from typing import Dict, Hashable, Mapping
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from .book import OptionBook
+from .scenarios import MIN_SHOCKED_SIGMA, _revalue
+
+# Scenarios 1-14 combine every price move with every volatility move, in this order.
+# Scenarios 15 and 16 are the extreme price moves without a volatility move.
+_SPAN_PRICE_MOVES = (0.0, 1 / 3, -1 / 3, 2 / 3, -2 / 3, 1.0, -1.0)
+_SPAN_VOL_MOVES = (1.0, -1.0)
+_SPAN_EXTREME_MOVES = (3.0, -3.0)
+# (price move in price scan ranges, volatility move in volatility scan ranges) of the 16 standard SPAN scenarios
+SPAN_SCENARIOS = tuple(
+    [(price, vol) for price in _SPAN_PRICE_MOVES for vol in _SPAN_VOL_MOVES]
+    + [(price, 0.0) for price in _SPAN_EXTREME_MOVES]
+)
+
+
+def span_risk_arrays(
+    book: OptionBook,
+    price_scan: ArrayLike,
+    vol_scan: ArrayLike,
+    extreme_cover: float = 0.35,
+    time_step: float = 0.0,
+    accuracy: str = "full",
+) -> np.ndarray:
+    """
+    SPAN-style risk arrays: the loss of every position in the 16 standard SPAN scenarios. \n
+    Scenarios 1-14 move the price by 0, 1/3, 2/3 and 3/3 of the price scan range, up and down,
+    each with the volatility up and down by the volatility scan range (see `SPAN_SCENARIOS`).
+    Scenarios 15 and 16 move the price up and down by 3 price scan ranges, and only
+    `extreme_cover` of their loss counts. Losses are positive and gains negative,
+    and they include the quantity of the position. \n
+    The scenarios of all positions are revalued in 2 vectorized passes with `ScenarioGrid`'s engine.
+    Volatility down moves of positions with a volatility below the volatility scan range
+    floor the volatility at `MIN_SHOCKED_SIGMA`.
+    With invalid="nan" books, positions with invalid inputs are NaN.
+
+    :param book: Positions \n
+    :param price_scan: Price scan range as a fraction of the underlying (or futures) price (0.08 indicates 8%).
+    Either one value for every position or one value per position. \n
+    :param vol_scan: Volatility scan range in volatility points (0.04 indicates 4 points).
+    Either one value for every position or one value per position. \n
+    :param extreme_cover: Fraction of the loss of the extreme scenarios 15 and 16 that counts \n
+    :param time_step: Time in years that passes in every scenario (1/365 indicates 1 day) \n
+    :param accuracy: "full" or "fast", see `BlackScholesVectorized`
+
+    :return: Array of shape (positions, 16)
+    """
+    n = len(book)
+    price_scan, vol_scan = (
+        np.broadcast_to(np.asarray(scan, dtype=np.float64), (n,)).reshape(n, 1) for scan in (price_scan, vol_scan)
+    )
+    if not ((price_scan >= 0.0).all() and (price_scan * _SPAN_EXTREME_MOVES[0] < 1.0).all()):
+        raise ValueError("Price scan ranges need to be between 0 and 1/3, so that extreme moves keep the price positive.")
+    if not (vol_scan >= 0.0).all():
+        raise ValueError("Volatility scan ranges cannot be negative.")
+    if not 0.0 <= extreme_cover <= 1.0:
+        raise ValueError(f"extreme_cover needs to be between 0 and 1. Got '{extreme_cover}'")
+    if not time_step >= 0.0:
+        raise ValueError(f"time_step cannot be negative. Got '{time_step}'")
+    if accuracy not in ("full", "fast"):
+        raise ValueError(f"accuracy needs to be 'full' or 'fast'. Got '{accuracy}'")
+    no_shock, time = np.zeros(1), np.array([time_step])
+    current = _revalue(book, no_shock, no_shock, no_shock, accuracy)
+    # The volatility down scenarios are floored for positions with a volatility below the scan range
+    vol_shocks = np.maximum(vol_scan * np.array(_SPAN_VOL_MOVES), MIN_SHOCKED_SIGMA - book.positions["sigma"][:, None])
+    # Scenarios 1-14, then the extreme scenarios 15 and 16
+    scan = _revalue(book, price_scan * np.array(_SPAN_PRICE_MOVES), vol_shocks, time, accuracy)
+    extreme = _revalue(book, price_scan * np.array(_SPAN_EXTREME_MOVES), no_shock, time, accuracy)
+    pnl = np.hstack([scan - current, extreme_cover * (extreme - current)])
+    return -book.positions["quantity"][:, None] * pnl
+
+
+class SpanMargin:
+    """
+    Scanning risk of a portfolio from SPAN-style risk arrays (see `span_risk_arrays`),
+    with the risk arrays of all positions summed per underlying. \n
+    The scanning risk of an underlying is the largest loss over the 16 scenarios of the summed
+    risk arrays, or 0 when no scenario loses. Only the sums are kept, so a pre-trade `check`
+    only revalues the new positions, and adding positions with `add` is cheap as well.
+    Ex. `margin = SpanMargin({"ES": 0.06, "CL": 0.1}, {"ES": 0.04, "CL": 0.05})`,
+    then `margin.add(book, underlying)` and `margin.check(order, "CL")`
+
+    :param price_scan: Price scan range per underlying, as a fraction of the underlying price (0.08 indicates 8%) \n
+    :param vol_scan: Volatility scan range per underlying, in volatility points (0.04 indicates 4 points) \n
+    :param extreme_cover: Fraction of the loss of the extreme scenarios 15 and 16 that counts \n
+    :param time_step: Time in years that passes in every scenario (1/365 indicates 1 day) \n
+    :param accuracy: "full" or "fast", see `BlackScholesVectorized`
+    """
+
+    def __init__(
+        self,
+        price_scan: Mapping[Hashable, float],
+        vol_scan: Mapping[Hashable, float],
+        extreme_cover: float = 0.35,
+        time_step: float = 0.0,
+        accuracy: str = "full",
+    ):
+        if set(price_scan) != set(vol_scan):
+            raise ValueError("price_scan and vol_scan need the same underlyings.")
+        self.price_scan = dict(price_scan)
+        self.vol_scan = dict(vol_scan)
+        self.extreme_cover = extreme_cover
+        self.time_step = time_step
+        self.accuracy = accuracy
+        # Summed risk arrays per underlying
+        self._risk_arrays: Dict[Hashable, np.ndarray] = {}
+
+    @property
+    def risk_arrays(self) -> Dict[Hashable, np.ndarray]:
+        """Sum of the risk arrays of the positions per underlying, 16 losses each."""
+        return {underlying: risk_array.copy() for underlying, risk_array in self._risk_arrays.items()}
+
+    def add(self, book: OptionBook, underlying: ArrayLike) -> None:
+        """
+        Add positions to the portfolio in place.
+        With invalid="nan" books, positions with invalid inputs are left out. Use `errors` to find them.
+
+        :param book: Positions to add \n
+        :param underlying: Underlying per position, or one underlying for every position
+        """
+        for name, risk_array in self._book_risk_arrays(book, underlying).items():
+            self._risk_arrays[name] = self._risk_arrays.get(name, 0.0) + risk_array
+
+    def scanning_risk(self) -> Dict[Hashable, float]:
+        """Scanning risk per underlying in the portfolio."""
+        return {underlying: _scanning_risk(risk_array) for underlying, risk_array in self._risk_arrays.items()}
+
+    def total(self) -> float:
+        """Sum of the scanning risk of all underlyings."""
+        return sum(self.scanning_risk().values())
+
+    def check(self, book: OptionBook, underlying: ArrayLike) -> Dict[Hashable, float]:
+        """
+        Pre-trade check: scanning risk per underlying if the positions were added, without adding them.
+        Only the new positions are revalued.
+
+        :param book: Positions to check, ex. an order \n
+        :param underlying: Underlying per position, or one underlying for every position
+        """
+        risk_arrays = dict(self._risk_arrays)
+        for name, risk_array in self._book_risk_arrays(book, underlying).items():
+            risk_arrays[name] = risk_arrays.get(name, 0.0) + risk_array
+        return {name: _scanning_risk(risk_array) for name, risk_array in risk_arrays.items()}
+
+    def _book_risk_arrays(self, book: OptionBook, underlying: ArrayLike) -> Dict[Hashable, np.ndarray]:
+        """Sum of the risk arrays of the positions of a book per underlying."""
+        underlying = np.broadcast_to(np.asarray(underlying), (len(book),))
+        names, inverse = np.unique(underlying, return_inverse=True)
+        names = names.tolist()
+        for name in names:
+            if name not in self.price_scan:
+                raise ValueError(f"No scan ranges for underlying '{name}'.")
+        risk_arrays = span_risk_arrays(
+            book,
+            price_scan=np.array([self.price_scan[name] for name in names])[inverse],
+            vol_scan=np.array([self.vol_scan[name] for name in names])[inverse],
+            extreme_cover=self.extreme_cover,
+            time_step=self.time_step,
+            accuracy=self.accuracy,
+        )
+        if book._invalid == "nan":
+            risk_arrays[book.errors() != 0] = 0.0
+        sums = np.zeros((len(names), len(SPAN_SCENARIOS)))
+        np.add.at(sums, inverse, risk_arrays)
+        return dict(zip(names, sums))
+
+
+def _scanning_risk(risk_array: np.ndarray) -> float:
+    """Largest loss of a risk array, or 0 when no scenario loses."""
+    return max(float(risk_array.max()), 0.0)
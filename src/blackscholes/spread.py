@@ -1,8 +1,9 @@
-from . import BlackScholesCall, BlackScholesPut
-from .base import BlackScholesStructureBase
+from .call import BlackScholesCall
+from .put import BlackScholesPut
+from .structure import BlackScholesStructure, _leg
 
 
-class BlackScholesBullSpread(BlackScholesStructureBase):
+class BlackScholesBullSpread(BlackScholesStructure):
     """
     Create bull spread option structure. \n
     - Bull Spread -> Call(K1) - Call(K2)
@@ -17,6 +18,10 @@ class BlackScholesBullSpread(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield) \n
     """
 
+    __slots__ = ()
+    call1 = _leg(0)
+    call2 = _leg(1)
+
     def __init__(
         self,
         S: float,
@@ -32,27 +37,16 @@ class BlackScholesBullSpread(BlackScholesStructureBase):
         ), f"""1st strike price should be smaller than 2nd.
         Got K1={K1}, which is not smaller than K2={K2}.
         """
-        self.call1 = BlackScholesCall(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.call2 = BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        super().__init__()
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from two call options into a bull spread. \n
-        All greeks and prices are combined in the same way.
+        self._set_legs(
+            quantity=[1.0, -1.0],
+            options=[
+                BlackScholesCall(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
 
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
 
-        :return: Combined value according to bull spread.
-        """
-        call1_attr = getattr(self.call1, attribute_name)
-        call2_attr = getattr(self.call2, attribute_name)
-        return call1_attr() - call2_attr()
-
-
-class BlackScholesBearSpread(BlackScholesStructureBase):
+class BlackScholesBearSpread(BlackScholesStructure):
     """
     Create bear spread option structure. \n
     - Bear Spread -> Put(K1) - Put(K2)
@@ -66,6 +60,11 @@ class BlackScholesBearSpread(BlackScholesStructureBase):
     :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
     :param q: Annual dividend yield (0.05 indicates 5% yield) \n
     """
+
+    __slots__ = ()
+    put1 = _leg(0)
+    put2 = _leg(1)
+
     def __init__(
         self,
         S: float,
@@ -81,27 +80,16 @@ class BlackScholesBearSpread(BlackScholesStructureBase):
         ), f"""1st strike price should be larger than 2nd.
         Got K1={K1}, which is not larger than K2={K2}.
         """
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.put2 = BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        super().__init__()
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from two put options into a bear spread. \n
-        All greeks and prices are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to bear spread.
-        """
-        put1_attr = getattr(self.put1, attribute_name)
-        put2_attr = getattr(self.put2, attribute_name)
-        return put1_attr() - put2_attr()
+        self._set_legs(
+            quantity=[1.0, -1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
 
 
-class BlackScholesCalendarCallSpread(BlackScholesStructureBase):
+class BlackScholesCalendarCallSpread(BlackScholesStructure):
     """
     Create a calendar call spread option structure. \n
     Horizontal Calendar Call Spread -> K1 == K2 \n 
@@ -117,6 +105,11 @@ class BlackScholesCalendarCallSpread(BlackScholesStructureBase):
     :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
     :param q: Annual dividend yield (0.05 indicates 5% yield) \n
     """
+
+    __slots__ = ()
+    call1 = _leg(0)
+    call2 = _leg(1)
+
     def __init__(
         self,
         S: float,
@@ -133,27 +126,16 @@ class BlackScholesCalendarCallSpread(BlackScholesStructureBase):
         ), f"""1st time to maturity should be longer than 2nd.
         Got T1={T1}, which is not longer than T2={T2}.
         """
-        self.call1 = BlackScholesCall(S=S, K=K1, T=T1, r=r, sigma=sigma, q=q)
-        self.call2 = BlackScholesCall(S=S, K=K2, T=T2, r=r, sigma=sigma, q=q)
-        super().__init__()
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from two put options into a calendar spread. \n
-        All greeks and prices are combined in the same way.
+        self._set_legs(
+            quantity=[1.0, -1.0],
+            options=[
+                BlackScholesCall(S=S, K=K1, T=T1, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K2, T=T2, r=r, sigma=sigma, q=q),
+            ],
+        )
 
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
 
-        :return: Combined value according to the calendar spread.
-        """
-        call1_attr = getattr(self.call1, attribute_name)
-        call2_attr = getattr(self.call2, attribute_name)
-        return call1_attr() - call2_attr()
-    
-    
-class BlackScholesCalendarPutSpread(BlackScholesStructureBase):
+class BlackScholesCalendarPutSpread(BlackScholesStructure):
     """
     Create a calendar put spread option structure. \n
     Horizontal Calendar Put Spread -> K1 == K2 \n 
@@ -169,6 +151,11 @@ class BlackScholesCalendarPutSpread(BlackScholesStructureBase):
     :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
     :param q: Annual dividend yield (0.05 indicates 5% yield) \n
     """
+
+    __slots__ = ()
+    put1 = _leg(0)
+    put2 = _leg(1)
+
     def __init__(
         self,
         S: float,
@@ -185,21 +172,10 @@ class BlackScholesCalendarPutSpread(BlackScholesStructureBase):
         ), f"""1st time to maturity should be longer than 2nd.
         Got T1={T1}, which is not longer than T2={T2}.
         """
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T1, r=r, sigma=sigma, q=q)
-        self.put2 = BlackScholesPut(S=S, K=K2, T=T2, r=r, sigma=sigma, q=q)
-        super().__init__()
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from two put options into a calendar spread. \n
-        All greeks and prices are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to the calendar spread.
-        """
-        put1_attr = getattr(self.put1, attribute_name)
-        put2_attr = getattr(self.put2, attribute_name)
-        return put1_attr() - put2_attr()
\ No newline at end of file
+        self._set_legs(
+            quantity=[1.0, -1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T1, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K2, T=T2, r=r, sigma=sigma, q=q),
+            ],
+        )
@@ -1,8 +1,9 @@
-from . import BlackScholesCall, BlackScholesPut
-from .base import BlackScholesStructureBase
+from .call import BlackScholesCall
+from .put import BlackScholesPut
+from .structure import BlackScholesStructure, _leg
 
 
-class BlackScholesStraddleLong(BlackScholesStructureBase):
+class BlackScholesStraddleLong(BlackScholesStructure):
     """
     Create long straddle option structure. \n
     - Long Straddle -> Put(K) + Call(K)
@@ -15,6 +16,10 @@ class BlackScholesStraddleLong(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield) \n
     """
 
+    __slots__ = ()
+    call1 = _leg(0)
+    put1 = _leg(1)
+
     def __init__(
         self,
         S: float,
@@ -24,27 +29,16 @@ class BlackScholesStraddleLong(BlackScholesStructureBase):
         sigma: float,
         q: float = 0.0,
     ):
-        self.call1 = BlackScholesCall(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
-        self.put1 = BlackScholesPut(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
-        super().__init__()
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from a put and call option into a long straddle. \n
-        All greeks and price are combined in the same way. \n
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to long straddle.
-        """
-        put_attr = getattr(self.put1, attribute_name)
-        call_attr = getattr(self.call1, attribute_name)
-        return put_attr() + call_attr()
+        self._set_legs(
+            quantity=[1.0, 1.0],
+            options=[
+                BlackScholesCall(S=S, K=K, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
 
 
-class BlackScholesStraddleShort(BlackScholesStructureBase):
+class BlackScholesStraddleShort(BlackScholesStructure):
     """
     Create straddle option structure. \n
     - Short Straddle -> -Put(K) - Call(K)
@@ -57,6 +51,10 @@ class BlackScholesStraddleShort(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    call1 = _leg(0)
+    put1 = _leg(1)
+
     def __init__(
         self,
         S: float,
@@ -66,21 +64,10 @@ class BlackScholesStraddleShort(BlackScholesStructureBase):
         sigma: float,
         q: float = 0.0,
     ):
-        self.call1 = BlackScholesCall(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
-        self.put1 = BlackScholesPut(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
-        super().__init__()
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from a put and call option into a short straddle. \n
-        All greeks and price are combined in the same way. \n
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to short straddle.
-        """
-        put_attr = getattr(self.put1, attribute_name)
-        call_attr = getattr(self.call1, attribute_name)
-        return -put_attr() - call_attr()
+        self._set_legs(
+            quantity=[-1.0, -1.0],
+            options=[
+                BlackScholesCall(S=S, K=K, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesPut(S=S, K=K, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
@@ -1,8 +1,9 @@
-from . import BlackScholesCall, BlackScholesPut
-from .base import BlackScholesStructureBase
+from .call import BlackScholesCall
+from .put import BlackScholesPut
+from .structure import BlackScholesStructure, _leg
 
 
-class BlackScholesStrangleLong(BlackScholesStructureBase):
+class BlackScholesStrangleLong(BlackScholesStructure):
     """
     Create long strangle option structure. \n
     - Long strangle -> Put(K1) + Call(K2)
@@ -17,6 +18,10 @@ class BlackScholesStrangleLong(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield) \n
     """
 
+    __slots__ = ()
+    put1 = _leg(0)
+    call1 = _leg(1)
+
     def __init__(
         self,
         S: float,
@@ -32,27 +37,16 @@ class BlackScholesStrangleLong(BlackScholesStructureBase):
         ), f"""1st strike price should be smaller than 2nd.
         Got K1={K1}, which is not smaller than K2={K2}.
         """
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.call1 = BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        super().__init__()
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from a put and call option into a long strangle. \n
-        All greeks and price are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to long strangle.
-        """
-        put_attr = getattr(self.put1, attribute_name)
-        call_attr = getattr(self.call1, attribute_name)
-        return put_attr() + call_attr()
+        self._set_legs(
+            quantity=[1.0, 1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
 
 
-class BlackScholesStrangleShort(BlackScholesStructureBase):
+class BlackScholesStrangleShort(BlackScholesStructure):
     """
     Create short strangle option structure. \n
     - Short strangle -> -Put(K1) - Call(K2)
@@ -67,6 +61,10 @@ class BlackScholesStrangleShort(BlackScholesStructureBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+    put1 = _leg(0)
+    call1 = _leg(1)
+
     def __init__(
         self,
         S: float,
@@ -82,21 +80,10 @@ class BlackScholesStrangleShort(BlackScholesStructureBase):
         ), f"""1st strike price should be smaller than 2nd.
         Got K1={K1}, which is not smaller than K2={K2}.
         """
-        self.put1 = BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q)
-        self.call1 = BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q)
-        super().__init__()
-
-    def _calc_attr(self, attribute_name: str) -> float:
-        """
-        Combines attributes from a put and call option into a short strangle. \n
-        All greeks and price are combined in the same way.
-
-        :param attribute_name: String name of option attribute
-        pointing to a method that can be called on
-        BlackScholesCall and BlackScholesPut.
-
-        :return: Combined value according to short strangle.
-        """
-        put_attr = getattr(self.put1, attribute_name)
-        call_attr = getattr(self.call1, attribute_name)
-        return -put_attr() - call_attr()
+        self._set_legs(
+            quantity=[-1.0, -1.0],
+            options=[
+                BlackScholesPut(S=S, K=K1, T=T, r=r, sigma=sigma, q=q),
+                BlackScholesCall(S=S, K=K2, T=T, r=r, sigma=sigma, q=q),
+            ],
+        )
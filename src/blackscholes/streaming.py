@@ -0,0 +1,168 @@
+import asyncio
+import time
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .implied_volatility import ImpliedVolatilityStatus, implied_volatility_vectorized
+from .vectorized import BlackScholesVectorized, validate_inputs
+
+DEFAULT_GREEKS = ("delta", "gamma", "vega", "theta")
+
+
+class Quote(NamedTuple):
+    """
+    Market quote of a Black-Scholes option. \n
+    Plain tuples with the same field order are accepted as well.
+
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param bid: Bid price of the option \n
+    :param ask: Ask price of the option \n
+    :param is_call: True for call options and False for put options \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield)
+    """
+
+    S: float
+    K: float
+    T: float
+    r: float
+    bid: float
+    ask: float
+    is_call: bool = True
+    q: float = 0.0
+
+
+class PricedQuote(NamedTuple):
+    """
+    Quote with its implied volatility and Greeks. \n
+    `sigma` and the Greeks are NaN unless `status` is `ImpliedVolatilityStatus.CONVERGED`.
+    `errors` holds `InputError` flags for quotes with invalid S, K, T or q.
+    """
+
+    quote: Quote
+    mid: float
+    sigma: float
+    status: ImpliedVolatilityStatus
+    errors: int
+    greeks: Dict[str, float]
+
+
+def price_quotes(quotes: Sequence[Quote], greeks: Iterable[str] = DEFAULT_GREEKS) -> List[PricedQuote]:
+    """
+    Implied volatility at the mid price and Greeks at that volatility for a batch of quotes,
+    computed with one vectorized call each. \n
+    Quotes with invalid inputs get NaN results instead of raising.
+
+    :param quotes: Quotes to price \n
+    :param greeks: Names of the Greeks to evaluate. Ex. ["delta", "gamma", "vega"]
+    """
+    names = tuple(greeks)
+    if len(quotes) == 0:
+        return []
+    S, K, T, r, bid, ask, is_call, q = np.array(quotes, dtype=np.float64).T
+    is_call = is_call != 0.0
+    mid = 0.5 * (bid + ask)
+    errors = validate_inputs(S, K, T, r, sigma=1.0, q=q)
+    valid = np.flatnonzero(errors == 0)
+    sigma = np.full(mid.shape, np.nan)
+    status = np.full(mid.shape, ImpliedVolatilityStatus.NOT_CONVERGED, dtype=np.int8)
+    values = {name: np.full(mid.shape, np.nan) for name in names}
+    if valid.size:
+        solved = implied_volatility_vectorized(mid[valid], S[valid], K[valid], T[valid], r[valid], q[valid], is_call[valid])
+        sigma[valid], status[valid] = solved.sigma, solved.status
+        # Quotes without a volatility get NaN Greeks
+        options = BlackScholesVectorized(S[valid], K[valid], T[valid], r[valid], solved.sigma, q[valid], is_call[valid], invalid="nan")
+        for name, value in options.get_greeks(names).items():
+            values[name][valid] = value
+    statuses = list(ImpliedVolatilityStatus)
+    columns = [values[name].tolist() for name in names]
+    return [
+        PricedQuote(quote, m, s, statuses[code], e, dict(zip(names, row)))
+        for quote, m, s, code, e, *row in zip(
+            quotes, mid.tolist(), sigma.tolist(), status.tolist(), errors.tolist(), *columns
+        )
+    ]
+
+
+def stream_quotes(
+    quotes: Iterable[Quote],
+    greeks: Iterable[str] = DEFAULT_GREEKS,
+    batch_size: int = 1_024,
+    max_latency: Optional[float] = None,
+) -> Iterator[PricedQuote]:
+    """
+    Price a stream of quotes in micro-batches, yielding results in the order of the quotes. \n
+    A batch is priced when it holds `batch_size` quotes, or when a quote arrives more than
+    `max_latency` seconds after the first quote of the batch. The source is only read when
+    it yields, so use `astream_quotes` to also flush while a quiet feed blocks.
+
+    :param quotes: Iterable of quotes \n
+    :param greeks: Names of the Greeks to evaluate \n
+    :param batch_size: Largest number of quotes priced at once.
+    Larger batches give more throughput and smaller batches less latency. \n
+    :param max_latency: Longest time in seconds that a quote waits in a batch. None waits for a full batch.
+    """
+    assert batch_size > 0, f"batch_size needs to be larger than 0. Got '{batch_size}'"
+    greeks = tuple(greeks)
+    batch = []
+    deadline = float("inf")
+    for quote in quotes:
+        if not batch and max_latency is not None:
+            deadline = time.monotonic() + max_latency
+        batch.append(quote)
+        if len(batch) >= batch_size or time.monotonic() >= deadline:
+            yield from price_quotes(batch, greeks)
+            batch = []
+    yield from price_quotes(batch, greeks)
+
+
+async def astream_quotes(
+    quotes: AsyncIterable[Quote],
+    greeks: Iterable[str] = DEFAULT_GREEKS,
+    batch_size: int = 1_024,
+    max_latency: Optional[float] = None,
+) -> AsyncIterator[PricedQuote]:
+    """
+    Price an async stream of quotes in micro-batches, yielding results in the order of the quotes. \n
+    A batch is priced when it holds `batch_size` quotes, or `max_latency` seconds after its first
+    quote arrived, also when no further quotes arrive in the meantime.
+
+    :param quotes: Async iterable of quotes, ex. a market data feed \n
+    :param greeks: Names of the Greeks to evaluate \n
+    :param batch_size: Largest number of quotes priced at once.
+    Larger batches give more throughput and smaller batches less latency. \n
+    :param max_latency: Longest time in seconds that a quote waits in a batch. None waits for a full batch.
+    """
+    assert batch_size > 0, f"batch_size needs to be larger than 0. Got '{batch_size}'"
+    greeks = tuple(greeks)
+    iterator = quotes.__aiter__()
+    batch = []
+    deadline = None
+    # The next quote is awaited in a task, so a timeout flushes the batch without cancelling the source
+    pending = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if done:
+                try:
+                    quote = pending.result()
+                except StopAsyncIteration:
+                    break
+                pending = asyncio.ensure_future(iterator.__anext__())
+                if not batch and max_latency is not None:
+                    deadline = time.monotonic() + max_latency
+                batch.append(quote)
+            if len(batch) >= batch_size or (deadline is not None and time.monotonic() >= deadline):
+                for priced in price_quotes(batch, greeks):
+                    yield priced
+                batch = []
+                deadline = None
+    finally:
+        if not pending.done():
+            pending.cancel()
+    for priced in price_quotes(batch, greeks):
+        yield priced
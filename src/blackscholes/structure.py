@@ -0,0 +1,307 @@
+from typing import Dict, Iterable, List, Union
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from . import BlackScholesCall, BlackScholesPut
+from .base import BlackScholesGreeks, BlackScholesStructureBase
+from .book import InstrumentType, OptionBook
+from .vectorized import BlackScholesVectorized, _input_errors, _raise_on_errors
+
+# Intermediates that only depend on T, r, sigma and q
+_EXPIRY_INTERMEDIATES = ("_sqrt_T", "_sigma_sqrt_T", "_discount_q", "_discount_r")
+# Intermediates that also depend on S and K, but not on the call/put flag
+_STRIKE_INTERMEDIATES = _EXPIRY_INTERMEDIATES + ("_d1", "_d2")
+
+
+class _StructureLegs(BlackScholesVectorized):
+    """
+    Legs of an option structure, evaluated as one vectorized book. \n
+    Unlike `BlackScholesVectorized`, parameters that are the same for every leg
+    (usually S, T, r, sigma and q) are not broadcast to one value per leg.
+    They stay scalars, so expiry terms like exp(-q*T), exp(-r*T), sqrt(T) and sigma**2
+    are computed once and shared by all legs through broadcasting.
+
+    :param K: Strike price per leg \n
+    :param is_call: True for call legs and False for put legs, per leg \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for legs with invalid inputs (see `errors`) \n
+    S, T, r, sigma and q are either scalars or given per leg.
+    """
+
+    def __init__(
+        self,
+        S: np.ndarray,
+        K: np.ndarray,
+        T: np.ndarray,
+        r: np.ndarray,
+        sigma: np.ndarray,
+        q: np.ndarray,
+        is_call: np.ndarray,
+        invalid: str = "raise",
+    ):
+        self._set_checked_inputs(invalid, S=S, K=K, T=T, r=r, sigma=sigma, q=q, is_call=is_call)
+
+    def _checked_inputs(self, inputs: Dict[str, ArrayLike]) -> Dict[str, np.ndarray]:
+        """New input values for `update` stay scalars if they are the same for every leg."""
+        n_legs = self.K.shape[0]
+        checked = {}
+        for name, value in inputs.items():
+            if name not in self._dependents:
+                raise ValueError(f"Unknown input '{name}' for {type(self).__name__}. Choose from {list(self._inputs)}.")
+            value = np.asarray(value, dtype=np.float64)
+            value = value.reshape(()) if value.size == 1 else value
+            assert value.shape in ((), (n_legs,)), f"Expected 1 value or {n_legs} values for {name}. Got shape {value.shape}"
+            checked[name] = value
+        if self._invalid == "raise":
+            _raise_on_errors(_input_errors(checked, self._input_checks))
+        else:
+            checked = self._nan_invalid(dict(self._raw_inputs, **checked))
+        return checked
+
+
+def _share_leg_intermediates(options: List[Union[BlackScholesCall, BlackScholesPut]]) -> None:
+    """
+    Share intermediates between the scalar legs of a structure. \n
+    Legs with the same T, r, sigma and q read exp(-q*T), exp(-r*T), sqrt(T) and sigma * sqrt(T)
+    from the first of them. Legs that also have the same S and K (ex. the call and put of a straddle)
+    read d1 and d2 from the first of them as well.
+    """
+    expiries, strikes = {}, {}
+    for option in options:
+        expiry = (option.T, option.r, option.sigma, option.q)
+        first_of_strike = strikes.setdefault((option.S, option.K) + expiry, option)
+        if first_of_strike is not option:
+            option._share_cache(first_of_strike, _STRIKE_INTERMEDIATES)
+            continue
+        first_of_expiry = expiries.setdefault(expiry, option)
+        if first_of_expiry is not option:
+            option._share_cache(first_of_expiry, _EXPIRY_INTERMEDIATES)
+
+
+class BlackScholesStructure(BlackScholesStructureBase):
+    """
+    Create a custom option structure from any number of weighted legs. \n
+    Every leg is a European call or put with its own quantity, strike and expiry.
+    Legs share their intermediates: expiry terms like exp(-q*T), exp(-r*T) and sqrt(T)
+    are computed once per expiry, and d1 and d2 once per strike. \n
+    Structures with more than 16 legs are evaluated in one vectorized pass,
+    followed by a weighted sum, so their cost hardly grows with the number of legs.
+    Smaller structures evaluate one scalar option per leg, which avoids NumPy overhead. \n
+    Ex. Long iron condor -> quantity=[-1, 1, 1, -1], K=[20, 25, 45, 50],
+    is_call=[False, False, True, True]
+
+    :param S: Price of underlying asset \n
+    :param quantity: Number of options per leg. Negative quantities are short legs. \n
+    :param K: Strike price per leg \n
+    :param T: Time till expiration in years per leg (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param is_call: True for call legs and False for put legs
+    """
+
+    # Quantities are a list for scalar legs and an array for vectorized legs
+    __slots__ = ("_quantity", "_options", "_legs")
+    # Largest structure that is evaluated with one scalar option per leg
+    _MAX_SCALAR_LEGS = 16
+    # Inputs that can be changed with `update`
+    _market_inputs = ("S", "T", "r", "sigma", "q")
+
+    def __init__(
+        self,
+        S: ArrayLike,
+        quantity: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        q: ArrayLike = 0.0,
+        is_call: ArrayLike = True,
+    ):
+        params = (quantity, S, K, T, r, sigma, q, is_call)
+        n_legs = max(len(param) if isinstance(param, (list, tuple)) else getattr(param, "size", 1) for param in params)
+        if n_legs <= self._MAX_SCALAR_LEGS:
+            # Plain Python values avoid NumPy overhead for a handful of legs
+            quantity, S, K, T, r, sigma, q, is_call = (_per_leg(param, n_legs) for param in params)
+            self._set_legs(
+                quantity,
+                [
+                    (BlackScholesCall if call else BlackScholesPut)(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
+                    for S, K, T, r, sigma, q, call in zip(S, K, T, r, sigma, q, is_call)
+                ],
+            )
+        else:
+            quantity, S, K, T, r, sigma, q = (
+                np.asarray(param, dtype=np.float64) for param in (quantity, S, K, T, r, sigma, q)
+            )
+            is_call = np.asarray(is_call, dtype=bool)
+            shape = np.broadcast_shapes(
+                quantity.shape, S.shape, K.shape, T.shape, r.shape, sigma.shape, q.shape, is_call.shape
+            )
+            assert len(shape) == 1, f"Legs must be given as 1-dimensional arrays. Got shape {shape}"
+            self._quantity = np.broadcast_to(quantity, shape)
+            # Parameters that are the same for every leg stay scalars, so the legs can share them
+            S, T, r, sigma, q = (param.reshape(()) if param.size == 1 else param for param in (S, T, r, sigma, q))
+            self._options = None
+            self._legs = _StructureLegs(
+                S=S, K=np.broadcast_to(K, shape), T=T, r=r, sigma=sigma, q=q, is_call=np.broadcast_to(is_call, shape)
+            )
+
+    def _set_legs(self, quantity: List[float], options: List[Union[BlackScholesCall, BlackScholesPut]]) -> None:
+        """
+        Use one scalar option per leg. Preset structures call this directly with their legs.
+
+        :param quantity: Number of options per leg \n
+        :param options: BlackScholesCall or BlackScholesPut per leg
+        """
+        self._quantity = [float(value) for value in quantity]
+        self._options = options
+        self._legs = None
+        _share_leg_intermediates(options)
+
+    def update(self, **inputs) -> None:
+        """
+        Change market inputs of all legs in place, ex. `structure.update(S=56.0, sigma=0.16)`. \n
+        Legs are not constructed again. Only the new values are validated,
+        and only the intermediates that depend on them are computed again.
+
+        :param inputs: New values of S, T, r, sigma or q.
+        Either one value for every leg or one value per leg.
+        """
+        for name in inputs:
+            if name not in self._market_inputs:
+                raise ValueError(f"Unknown input '{name}' for {type(self).__name__}. Choose from {list(self._market_inputs)}.")
+        if self._options is None:
+            self._legs.update(**inputs)
+            return
+        options = self._options
+        if any(isinstance(value, (list, tuple, np.ndarray)) for value in inputs.values()):
+            per_leg = [_per_leg(value, len(options)) for value in inputs.values()]
+            for option, values in zip(options, zip(*per_leg)):
+                option.update(**dict(zip(inputs, values)))
+        else:
+            for option in options:
+                option.update(**inputs)
+        _share_leg_intermediates(options)
+
+    @property
+    def quantity(self) -> np.ndarray:
+        """Number of options per leg."""
+        return np.asarray(self._quantity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        """Number of legs."""
+        return len(self._quantity)
+
+    def leg(self, index: int) -> Union[BlackScholesCall, BlackScholesPut]:
+        """
+        Scalar option object for a single leg (without its quantity). \n
+        This is a copy, so changing it does not change the structure.
+        Use `update` to change the legs, or the leg attributes of the preset structures.
+
+        :param index: Position of the leg
+        """
+        if self._options is not None:
+            option = self._options[index]
+            return type(option)(S=option.S, K=option.K, T=option.T, r=option.r, sigma=option.sigma, q=option.q)
+        legs = self._legs
+        option_cls = BlackScholesCall if legs.is_call[index] else BlackScholesPut
+        S, K, T, r, sigma, q = (
+            (param[index] if param.ndim else param).item()
+            for param in (legs.S, legs.K, legs.T, legs.r, legs.sigma, legs.q)
+        )
+        return option_cls(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
+
+    def to_book(self) -> OptionBook:
+        """`OptionBook` with one position per leg, with the leg quantities as position quantities."""
+        if self._options is not None:
+            options = self._options
+            columns = {
+                name: [getattr(option, name) for option in options] for name in ("S", "K", "T", "r", "sigma", "q")
+            }
+            is_call = np.array([isinstance(option, BlackScholesCall) for option in options])
+        else:
+            legs = self._legs
+            columns = {name: getattr(legs, name) for name in ("S", "K", "T", "r", "sigma", "q")}
+            is_call = legs.is_call
+        kind = np.where(is_call, InstrumentType.BLACK_SCHOLES_CALL, InstrumentType.BLACK_SCHOLES_PUT)
+        return OptionBook(kind=kind, quantity=self.quantity, **columns)
+
+    def _calc_attr(self, attribute_name: str) -> float:
+        """
+        Combines an attribute of all legs into the structure value
+        with a weighted sum over the leg values.
+
+        :param attribute_name: String name of option attribute
+        pointing to a method that can be called on
+        BlackScholesCall, BlackScholesPut and BlackScholesVectorized.
+
+        :return: Combined value according to leg quantities.
+        """
+        if self._options is not None:
+            return sum(
+                weight * getattr(option, attribute_name)() for weight, option in zip(self._quantity, self._options)
+            )
+        return float(self._quantity @ getattr(self._legs, attribute_name)())
+
+    def get_greeks(self, names: Iterable[str]) -> Dict[str, float]:
+        """
+        Retrieve a selection of Greeks for the structure as a dictionary. \n
+        Shared intermediates of the legs are computed once.
+
+        :param names: Names of the Greeks to evaluate. "price" is also accepted.
+        Ex. ["delta", "gamma", "vanna", "charm"]
+        """
+        names = tuple(names)
+        if self._options is not None:
+            greeks = [option.get_greeks(names) for option in self._options]
+            return {
+                name: sum(weight * values[name] for weight, values in zip(self._quantity, greeks))
+                for name in names
+            }
+        greeks = self._legs.get_greeks(names)
+        return {name: float(self._quantity @ value) for name, value in greeks.items()}
+
+    def get_core_greeks(self) -> Dict[str, float]:
+        """
+        Get the top 5 most well known Greeks for the compound.
+        1. Delta
+        2. Gamma
+        3. Vega
+        4. Theta
+        5. Rho
+        """
+        return self.get_greeks(("delta", "gamma", "vega", "theta", "rho"))
+
+    def get_all_greeks(self) -> Dict[str, float]:
+        """Retrieve all Greeks for the compound
+        implemented as a dictionary. \n
+        All Greeks of every leg are evaluated in one fused pass
+        and combined with one weighted sum per Greek."""
+        if self._options is not None:
+            greeks = np.array([option.all_greeks() for option in self._options])
+            return dict(zip(BlackScholesGreeks._fields, (self.quantity @ greeks).tolist()))
+        greeks = self._legs.all_greeks()
+        return dict(zip(greeks._fields, (np.array(greeks) @ self._quantity).tolist()))
+
+
+def _per_leg(param: ArrayLike, n_legs: int) -> list:
+    """Python values of a leg parameter, repeated for every leg if it is shared."""
+    values = param.tolist() if isinstance(param, np.ndarray) else param
+    if not isinstance(values, (list, tuple)):
+        return [values] * n_legs
+    assert len(values) in (1, n_legs) and not any(
+        isinstance(value, (list, tuple, np.ndarray)) for value in values
+    ), f"Legs must be given as scalars or 1-dimensional arrays of the same length. Got {param}"
+    return list(values) * n_legs if len(values) == 1 else list(values)
+
+
+def _leg(index: int) -> property:
+    """
+    Scalar option object of a preset structure leg, exposed as an attribute. \n
+    Presets always have scalar legs, so this is the leg itself rather than a copy:
+    changing it with `update` changes the structure as well.
+    """
+    return property(lambda self: self._options[index], doc=f"Scalar option object of leg {index}.")
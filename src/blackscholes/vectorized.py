@@ -0,0 +1,1283 @@
+from enum import IntFlag
+from math import erfc
+from typing import Callable, Dict, Iterable, Tuple
+
+import numpy as np
+
+from numpy.typing import ArrayLike, DTypeLike
+
+from .base import (
+    Black76Greeks,
+    BlackScholesGreeks,
+    CachedIntermediatesMixin,
+    GreekPlan,
+    _BLACK_SCHOLES_INPUT_CHECKS,
+    _black_76_greeks,
+    _black_scholes_greeks,
+    _cached_on,
+)
+
+
+def _float_array(x: ArrayLike) -> np.ndarray:
+    """`x` as a float32 array if it is one, and as a float64 array otherwise."""
+    x = np.asarray(x)
+    return x if x.dtype == np.float32 else x.astype(np.float64, copy=False)
+
+
+class VectorizedStandardNormalMixin:
+    """
+    PDF, CDF and inverse CDF calculations for the standard normal distribution on NumPy arrays. \n
+    The CDF has two accuracy tiers:
+    - "full": W. J. Cody's rational approximations (ACM Algorithm 715),
+    which are accurate to double precision over the whole real line, including the tails.
+    - "fast": Abramowitz & Stegun 26.2.17, with a maximum absolute error of 7.5e-8.
+    About 3-4x faster, but the relative error grows in the lower tail.
+    The inverse CDF uses M. J. Wichura's Algorithm AS 241 (PPND16).
+    """
+
+    # CDF accuracy tier of the engine, see `_cdf`
+    _accuracy = "full"
+
+    # Coefficients for |x| <= 0.67448975
+    _A = (2.2352520354606839287, 161.02823106855587881, 1067.6894854603709582,
+          18154.981253343561249, 0.065682337918207449113)
+    _B = (47.20258190468824187, 976.09855173777669322, 10260.932208618978205,
+          45507.789335026729956)
+    # Coefficients for 0.67448975 < |x| <= sqrt(32)
+    _C = (0.39894151208813466764, 8.8831497943883759412, 93.506656132177855979,
+          597.27027639480026226, 2494.5375852903726711, 6848.1904505362823326,
+          11602.651437647350124, 9842.7148383839780218, 1.0765576773720192317e-8)
+    _D = (22.266688044328115691, 235.38790178262499861, 1519.377599407554805,
+          6485.558298266760755, 18615.571640885098091, 34900.952721145977266,
+          38912.003286093271411, 19685.429676859990727)
+    # Coefficients for |x| > sqrt(32)
+    _P = (0.21589853405795699, 0.1274011611602473639, 0.022235277870649807,
+          0.001421619193227893466, 2.9112874951168792e-5, 0.02307344176494017303)
+    _Q = (1.28426009614491121, 0.468238212480865118, 0.0659881378689285515,
+          0.00378239633202758244, 7.29751555083966205e-5)
+
+    # Coefficients of the inverse CDF (Wichura, Algorithm AS 241), highest order first
+    _INV_A = (2509.0809287301226727, 33430.575583588128105, 67265.770927008700853,
+              45921.953931549871457, 13731.693765509461125, 1971.5909503065514427,
+              133.14166789178437745, 3.387132872796366608)
+    _INV_B = (5226.495278852545561, 28729.085735721942674, 39307.89580009271061,
+              21213.794301586595867, 5394.1960214247511077, 687.1870074920579083,
+              42.313330701600911252, 1.0)
+    _INV_C = (0.000774545014278341407640, 0.0227238449892691845833, 0.241780725177450611770,
+              1.27045825245236838258, 3.64784832476320460504, 5.76949722146069140550,
+              4.63033784615654529590, 1.42343711074968357734)
+    _INV_D = (1.05075007164441684324e-9, 0.000547593808499534494600, 0.0151986665636164571966,
+              0.148103976427480074590, 0.689767334985100004550, 1.67638483018380384940,
+              2.05319162663775882187, 1.0)
+    _INV_E = (2.01033439929228813265e-7, 2.71155556874348757815e-5, 0.00124266094738807843860,
+              0.0265321895265761230930, 0.296560571828504891230, 1.78482653991729133580,
+              5.46378491116411436990, 6.65790464350110377720)
+    _INV_F = (2.04426310338993978564e-15, 1.42151175831644588870e-7, 1.84631831751005468180e-5,
+              0.000786869131145613259100, 0.0148753612908506148525, 0.136929880922735805310,
+              0.599832206555887937690, 1.0)
+
+    # Coefficients of Abramowitz & Stegun 26.2.17
+    _FAST_P = 0.2316419
+    _FAST_B = (0.319381530, -0.356563782, 1.781477937, -1.821255978, 1.330274429)
+
+    # Bounds of the center, middle and tail branches of the CDF
+    _CENTER = 0.67448975
+    _MIDDLE = 5.656854249492380195206754896838
+
+    _INV_SQRT_2PI = 0.398942280401432677939946059934
+    _SQRT_2PI = 2.506628274631000502415765284811
+    # Below this size the per-element erfc from the C math library beats the branch masks
+    _SMALL_SIZE = 16
+
+    @property
+    def accuracy(self) -> str:
+        """
+        CDF accuracy tier of the engine, "full" or "fast". \n
+        Cached CDF values depend on it, so it is set on construction and cannot be changed.
+        """
+        return self._accuracy
+
+    @staticmethod
+    def _pdf(x: np.ndarray) -> np.ndarray:
+        """PDF of standard normal distribution."""
+        return np.exp(-0.5 * x * x) * VectorizedStandardNormalMixin._INV_SQRT_2PI
+
+    @classmethod
+    def _cdf(cls, x: ArrayLike, accuracy: str = "full") -> np.ndarray:
+        """
+        CDF of standard normal distribution.
+
+        :param x: Values to evaluate \n
+        :param accuracy: "full" for double precision or "fast" for a maximum absolute error of 7.5e-8
+        """
+        x = _float_array(x)
+        if accuracy == "fast":
+            return cls._cdf_fast(x)
+        if x.size <= cls._SMALL_SIZE:
+            return np.array([0.5 * erfc(-value * 0.7071067811865476) for value in x.ravel().tolist()], dtype=x.dtype).reshape(x.shape)
+        y = np.abs(x)
+        result = np.empty_like(y)
+
+        center = y <= cls._CENTER
+        if center.any():
+            result[center] = cls._center_cdf(x[center])
+
+        middle = ~center & (y <= cls._MIDDLE)
+        if middle.any():
+            ym = y[middle]
+            result[middle] = cls._scaled_tail(ym, cls._middle_ratio(ym))
+
+        tail = ~(center | middle)
+        if tail.any():
+            # The CDF underflows long before |x| = 40, which also maps -inf to 0 and inf to 1
+            yt = np.minimum(y[tail], 40.0)
+            result[tail] = cls._scaled_tail(yt, cls._tail_ratio(yt))
+
+        # The middle and tail branches hold the lower tail probability of -|x|.
+        upper = ~center & (x > 0.0)
+        result[upper] = 1.0 - result[upper]
+        return result
+
+    @classmethod
+    def _mills_ratio(cls, y: np.ndarray) -> np.ndarray:
+        """
+        Mills ratio CDF(-y) / PDF(y) for y >= 0, with full relative precision
+        where CDF(-y) and PDF(y) are too small to divide (or underflow).
+        """
+        result = np.empty_like(y)
+        center = y <= cls._CENTER
+        if center.any():
+            yc = y[center]
+            result[center] = cls._center_cdf(-yc) / cls._pdf(yc)
+        middle = ~center & (y <= cls._MIDDLE)
+        if middle.any():
+            result[middle] = cls._middle_ratio(y[middle]) * cls._SQRT_2PI
+        tail = ~(center | middle)
+        if tail.any():
+            result[tail] = cls._tail_ratio(y[tail]) * cls._SQRT_2PI
+        return result
+
+    @classmethod
+    def _center_cdf(cls, x: np.ndarray) -> np.ndarray:
+        """CDF for |x| <= 0.67448975."""
+        xsq = x * x
+        xnum, xden = cls._A[4] * xsq, xsq
+        for a, b in zip(cls._A[:3], cls._B[:3]):
+            xnum = (xnum + a) * xsq
+            xden = (xden + b) * xsq
+        return 0.5 + x * (xnum + cls._A[3]) / (xden + cls._B[3])
+
+    @classmethod
+    def _middle_ratio(cls, y: np.ndarray) -> np.ndarray:
+        """CDF(-y) * exp(y**2 / 2) for 0.67448975 < y <= sqrt(32)."""
+        xnum, xden = cls._C[8] * y, y
+        for c, d in zip(cls._C[:7], cls._D[:7]):
+            xnum = (xnum + c) * y
+            xden = (xden + d) * y
+        return (xnum + cls._C[7]) / (xden + cls._D[7])
+
+    @classmethod
+    def _tail_ratio(cls, y: np.ndarray) -> np.ndarray:
+        """CDF(-y) * exp(y**2 / 2) for y > sqrt(32)."""
+        xsq = 1.0 / (y * y)
+        xnum, xden = cls._P[5] * xsq, xsq
+        for p, q in zip(cls._P[:4], cls._Q[:4]):
+            xnum = (xnum + p) * xsq
+            xden = (xden + q) * xsq
+        temp = xsq * (xnum + cls._P[4]) / (xden + cls._Q[4])
+        return (cls._INV_SQRT_2PI - temp) / y
+
+    @classmethod
+    def _cdf_fast(cls, x: np.ndarray) -> np.ndarray:
+        """CDF of standard normal distribution with Abramowitz & Stegun 26.2.17 (absolute error below 7.5e-8)."""
+        t = 1.0 / (1.0 + cls._FAST_P * np.abs(x))
+        b1, b2, b3, b4, b5 = cls._FAST_B
+        # Lower tail probability of -|x|
+        tail = cls._pdf(x) * (t * (b1 + t * (b2 + t * (b3 + t * (b4 + t * b5)))))
+        return np.where(x > 0.0, 1.0 - tail, tail)
+
+    @classmethod
+    def _inv_cdf(cls, p: ArrayLike) -> np.ndarray:
+        """Inverse CDF (quantile function) of standard normal distribution for 0 < p < 1."""
+        p = np.asarray(p, dtype=np.float64)
+        q = p - 0.5
+        result = np.empty_like(q)
+
+        center = np.abs(q) <= 0.425
+        if center.any():
+            qc = q[center]
+            r = 0.180625 - qc * qc
+            result[center] = qc * np.polyval(cls._INV_A, r) / np.polyval(cls._INV_B, r)
+
+        tail = ~center
+        if tail.any():
+            qt = q[tail]
+            r = np.sqrt(-np.log(np.where(qt < 0.0, p[tail], 1.0 - p[tail])))
+            near = r <= 5.0
+            rn = r - np.where(near, 1.6, 5.0)
+            x = np.where(
+                near,
+                np.polyval(cls._INV_C, rn) / np.polyval(cls._INV_D, rn),
+                np.polyval(cls._INV_E, rn) / np.polyval(cls._INV_F, rn),
+            )
+            result[tail] = np.where(qt < 0.0, -x, x)
+        return result
+
+    @staticmethod
+    def _scaled_tail(y: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+        """exp(-y**2 / 2) * ratio without losing precision in y**2."""
+        ysq = np.trunc(y * 16.0) / 16.0
+        delta = (y - ysq) * (y + ysq)
+        return np.exp(-ysq * ysq * 0.5) * np.exp(-delta * 0.5) * ratio
+
+
+# Error amplification of the direct price formula above which the Mills ratio path is used.
+# Below it the direct formula is accurate to about 1e-13, and it is much cheaper.
+_TAIL_CANCELLATION = 500.0
+
+
+def _tail_safe_price_vectorized(
+    phi: np.ndarray, d1: np.ndarray, d2: np.ndarray, forward: np.ndarray, strike: np.ndarray,
+    pdf_d1: np.ndarray, cdf_phi_d1: np.ndarray, cdf_phi_d2: np.ndarray,
+) -> np.ndarray:
+    """Vectorized version of `_tail_safe_price`, with Mills ratios only evaluated where the terms cancel."""
+    forward_term = np.asarray(forward * cdf_phi_d1)
+    price = np.asarray(phi * (forward_term - strike * cdf_phi_d2))
+    phi_d1, phi_d2 = np.asarray(phi * d1), np.asarray(phi * d2)
+    # Rounding in d1 and d2 grows the relative error of the CDFs by about d1**2, and the cancellation
+    # between the terms amplifies it. Only rows where the product exceeds _TAIL_CANCELLATION take the
+    # Mills ratio path, and they always lie out of the money.
+    otm = (np.abs(price) * _TAIL_CANCELLATION < forward_term * (1.0 + phi_d1 * phi_d1)) & (np.maximum(phi_d1, phi_d2) <= 0.0)
+    if otm.any():
+        mills_ratio = VectorizedStandardNormalMixin._mills_ratio
+        price[otm] = np.asarray(phi * forward * pdf_d1)[otm] * (mills_ratio(-phi_d1[otm]) - mills_ratio(-phi_d2[otm]))
+    # Scalars for 0-dimensional inputs, like the other methods
+    return price[()]
+
+
+class InputError(IntFlag):
+    """
+    Reasons why the inputs of an option are invalid, as flags per option. \n
+    Flags combine, ex. S=-inf gives `NON_POSITIVE_S | NOT_FINITE`.
+    """
+
+    NONE = 0
+    # Asset price S (or futures price F) is not larger than 0
+    NON_POSITIVE_S = 1
+    NON_POSITIVE_K = 2
+    NON_POSITIVE_T = 4
+    NON_POSITIVE_SIGMA = 8
+    NEGATIVE_Q = 16
+    # An input is NaN or infinite
+    NOT_FINITE = 32
+
+
+# Error flag per checked input
+_INPUT_ERRORS = {
+    "S": InputError.NON_POSITIVE_S,
+    "F": InputError.NON_POSITIVE_S,
+    "K": InputError.NON_POSITIVE_K,
+    "T": InputError.NON_POSITIVE_T,
+    "sigma": InputError.NON_POSITIVE_SIGMA,
+    "q": InputError.NEGATIVE_Q,
+}
+
+
+def _input_errors(inputs: Dict[str, np.ndarray], checks: Dict[str, Tuple[Callable, str]]) -> np.ndarray:
+    """`InputError` flags per option for float inputs that broadcast against each other."""
+    errors = np.zeros(np.broadcast_shapes(*(value.shape for value in inputs.values())), dtype=np.uint8)
+    for name, value in inputs.items():
+        errors |= np.where(np.isfinite(value), np.uint8(0), np.uint8(InputError.NOT_FINITE))
+        if name in checks:
+            # NaN only counts as not finite
+            failed = ~(checks[name][0](value) | np.isnan(value))
+            errors |= np.where(failed, np.uint8(_INPUT_ERRORS[name]), np.uint8(0))
+    return errors
+
+
+def _raise_on_errors(errors: np.ndarray) -> None:
+    """Raise a ValueError naming the first invalid option and its `InputError` flags, if any option is invalid."""
+    invalid = np.flatnonzero(errors)
+    if invalid.size == 0:
+        return
+    first = invalid[0]
+    index = np.unravel_index(first, errors.shape)
+    code = int(errors.reshape(-1)[first])
+    flags = "|".join(flag.name for flag in InputError if flag.value and code & flag.value)
+    raise ValueError(
+        f"{invalid.size} option(s) with invalid inputs. First at index {index[0] if len(index) == 1 else index}: {flags}. "
+        "Use invalid='nan' to price the valid options and get NaN for the others."
+    )
+
+
+def _check_dtype(dtype: DTypeLike) -> np.dtype:
+    """Floating point type of the inputs and outputs of an engine."""
+    dtype = np.dtype(dtype)
+    assert dtype in (np.float32, np.float64), f"dtype needs to be float32 or float64. Got '{dtype}'"
+    return dtype
+
+
+def validate_inputs(
+    S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, sigma: ArrayLike, q: ArrayLike = 0.0
+) -> np.ndarray:
+    """
+    Validate option inputs per option instead of raising on the first invalid one. \n
+    Applies the same checks as the option classes, and also flags NaN and infinite inputs.
+    Pass the futures price as `S` for Black-76 options.
+
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield)
+
+    :return: `InputError` flags per option as uint8. 0 means the inputs are valid.
+    """
+    inputs = dict(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
+    return _input_errors(
+        {name: np.asarray(value, dtype=np.float64) for name, value in inputs.items()}, _BLACK_SCHOLES_INPUT_CHECKS
+    )
+
+
+class VectorizedInputsMixin(CachedIntermediatesMixin):
+    """
+    Input validation and `update` for vectorized engines. \n
+    With invalid="raise" (default) an invalid input raises a ValueError that names the first invalid option
+    and its `InputError` flags. Unlike an assert, this check also runs under `python -O`.
+    With invalid="nan" the inputs of invalid options are replaced by NaN,
+    so all their outputs are NaN while the other options are priced as usual.
+    `errors` holds the `InputError` flags per option. \n
+    `update` converts new values to arrays with the shape of the inputs they replace,
+    so a single value can be set for every option.
+    """
+
+    def _set_checked_inputs(self, invalid: str, **inputs: np.ndarray) -> None:
+        """Validate and assign broadcast inputs on construction."""
+        assert invalid in ("raise", "nan"), f"invalid needs to be 'raise' or 'nan'. Got '{invalid}'"
+        self._invalid = invalid
+        if invalid == "raise":
+            self.errors = _input_errors(
+                {name: value for name, value in inputs.items() if value.dtype.kind == "f"}, self._input_checks
+            )
+            _raise_on_errors(self.errors)
+            self._set_inputs(**inputs)
+        else:
+            self._set_inputs(**self._nan_invalid(inputs))
+
+    def _nan_invalid(self, inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Set `errors` and replace the float inputs of invalid options by NaN."""
+        # Inputs as given, so that `update` can make invalid options valid again
+        self._raw_inputs = inputs
+        floats = {name: value for name, value in inputs.items() if value.dtype.kind == "f"}
+        self.errors = _input_errors(floats, self._input_checks)
+        invalid = self.errors != 0
+        if invalid.any():
+            inputs = dict(inputs, **{name: np.where(invalid, np.nan, value) for name, value in floats.items()})
+        return inputs
+
+    @property
+    def valid(self) -> np.ndarray:
+        """True for options with valid inputs."""
+        return self.errors == 0
+
+    def _checked_inputs(self, inputs: Dict[str, ArrayLike]) -> Dict[str, np.ndarray]:
+        """
+        Broadcast new input values to the current shape and validate them for `update`. \n
+        With invalid="nan" every input is assigned again, because options can become valid or invalid.
+        """
+        checked = {}
+        for name, value in inputs.items():
+            if name not in self._dependents:
+                raise ValueError(f"Unknown input '{name}' for {type(self).__name__}. Choose from {list(self._inputs)}.")
+            current = getattr(self, name)
+            checked[name] = np.broadcast_to(np.asarray(value, dtype=current.dtype), current.shape)
+        if self._invalid == "raise":
+            _raise_on_errors(
+                _input_errors({name: value for name, value in checked.items() if value.dtype.kind == "f"}, self._input_checks)
+            )
+        else:
+            checked = self._nan_invalid(dict(self._raw_inputs, **checked))
+        return checked
+
+
+class BlackScholesVectorized(VectorizedInputsMixin, VectorizedStandardNormalMixin):
+    """
+    Calculate (European) option prices and Greeks with the
+    Black-Scholes-Merton formula for many options at once. \n
+    All parameters can be scalars or NumPy arrays that broadcast against each other.
+    Every method returns a NumPy array with the broadcast shape.
+
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param is_call: True for call options and False for put options \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    _inputs = ("S", "K", "T", "r", "sigma", "q", "is_call")
+    _input_checks = _BLACK_SCHOLES_INPUT_CHECKS
+    _greek_names = frozenset(BlackScholesGreeks._fields) | {"price", "in_the_money"}
+
+    def __init__(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        q: ArrayLike = 0.0,
+        is_call: ArrayLike = True,
+        invalid: str = "raise",
+        accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        dtype = _check_dtype(dtype)
+        S, K, T, r, sigma, q = (
+            np.asarray(param, dtype=dtype) for param in (S, K, T, r, sigma, q)
+        )
+        S, K, T, r, sigma, q, is_call = np.broadcast_arrays(
+            S, K, T, r, sigma, q, np.asarray(is_call, dtype=bool)
+        )
+        self._set_checked_inputs(invalid, S=S, K=K, T=T, r=r, sigma=sigma, q=q, is_call=is_call)
+        assert accuracy in ("full", "fast"), f"accuracy needs to be 'full' or 'fast'. Got '{accuracy}'"
+        self._accuracy = accuracy
+
+    def price(self) -> np.ndarray:
+        """
+        Fair value for options. \n
+        With accuracy="full", prices of out-of-the-money options keep their relative precision
+        in the far wings, see `_tail_safe_price`.
+        """
+        if self.accuracy == "fast":
+            return self._phi * (
+                self.S * self._discount_q * self._cdf_phi_d1
+                - self.K * self._discount_r * self._cdf_phi_d2
+            )
+        return _tail_safe_price_vectorized(
+            self._phi, self._d1, self._d2, self.S * self._discount_q, self.K * self._discount_r,
+            self._pdf_d1, self._cdf_phi_d1, self._cdf_phi_d2,
+        )
+
+    def in_the_money(self) -> np.ndarray:
+        """Naive probability that options will be in the money at maturity."""
+        return self._cdf_phi_d2
+
+    def delta(self) -> np.ndarray:
+        """Rate of change in option price
+        with respect to the forward price (1st derivative).
+        """
+        return self._phi * self._discount_q * self._cdf_phi_d1
+
+    def spot_delta(self) -> np.ndarray:
+        """
+        Delta discounted for interest rates.
+        For the forward delta, use `delta`.
+        """
+        return self._phi * np.exp((self.r - self.q) * self.T) * self._cdf_phi_d1
+
+    def dual_delta(self) -> np.ndarray:
+        """1st derivative of option price with respect to the strike price."""
+        return self._discount_r * self._cdf_phi_d2
+
+    def gamma(self) -> np.ndarray:
+        """
+        Rate of change in delta with respect to the underlying asset price (2nd derivative).
+        """
+        return self._discount_q * self._pdf_d1 / (self.S * self._sigma_sqrt_T)
+
+    def dual_gamma(self) -> np.ndarray:
+        """
+        Rate of change in delta with respect to the strike price (2nd derivative).
+        """
+        return self._discount_r * self._pdf_d2 / (self.K * self._sigma_sqrt_T)
+
+    def vega(self) -> np.ndarray:
+        """
+        Rate of change in option price with respect to the volatility of the asset.
+        """
+        return self.S * self._discount_q * self._pdf_d1 * self._sqrt_T
+
+    def theta(self) -> np.ndarray:
+        """
+        Rate of change in option price
+        with respect to time (i.e. time decay).
+        """
+        return (
+            -self._discount_q * self.S * self._pdf_d1 * self.sigma / (2.0 * self._sqrt_T)
+            - self._phi * self.r * self.K * self._discount_r * self._cdf_phi_d2
+            + self._phi * self.q * self.S * self._discount_q * self._cdf_phi_d1
+        )
+
+    def epsilon(self) -> np.ndarray:
+        """Change in option price with respect to underlying dividend yield. \n
+        Also known as psi."""
+        return -self._phi * self.S * self.T * self._discount_q * self._cdf_phi_d1
+
+    def rho(self) -> np.ndarray:
+        """Rate of change in option price
+        with respect to the risk-free rate.
+        """
+        return self._phi * self.K * self.T * self._discount_r * self._cdf_phi_d2
+
+    def lambda_greek(self) -> np.ndarray:
+        """Percentage change in option value per %
+        change in asset price. Also called gearing.
+        """
+        return self.delta() * self.S / self.price()
+
+    def vanna(self) -> np.ndarray:
+        """Sensitivity of delta with respect to change in volatility."""
+        return -self._discount_q * self._pdf_d1 * self._d2 / self.sigma
+
+    def charm(self) -> np.ndarray:
+        """Rate of change of delta over time (also known as delta decay)."""
+        return self._phi * self.q * self._discount_q * self._cdf_phi_d1 - self._discount_q * self._pdf_d1 * (
+            2.0 * (self.r - self.q) * self.T - self._d2 * self._sigma_sqrt_T
+        ) / (2.0 * self.T * self._sigma_sqrt_T)
+
+    def vomma(self) -> np.ndarray:
+        """2nd order sensitivity to volatility."""
+        return self.vega() * self._d1 * self._d2 / self.sigma
+
+    def veta(self) -> np.ndarray:
+        """Rate of change in `vega` with respect to time."""
+        return (
+            -self.S
+            * self._discount_q
+            * self._pdf_d1
+            * self._sqrt_T
+            * (
+                self.q
+                + (self.r - self.q) * self._d1 / self._sigma_sqrt_T
+                - (1.0 + self._d1 * self._d2) / (2.0 * self.T)
+            )
+        )
+
+    def phi(self) -> np.ndarray:
+        """2nd order partial derivative with respect to strike price. \n
+        Phi is used in the Breeden-Litzenberger formula. \n
+        Breeden-Litzenberger uses quoted option prices
+        to estimate risk-neutral probabilities.
+        """
+        # The exponent in the closed form of `BlackScholesBase.phi` reduces to -d2**2 / 2.
+        return self.dual_gamma()
+
+    def speed(self) -> np.ndarray:
+        """Rate of change in Gamma with respect to change in the underlying price."""
+        return -self.gamma() / self.S * (self._d1 / self._sigma_sqrt_T + 1.0)
+
+    def zomma(self) -> np.ndarray:
+        """Rate of change of gamma with respect to changes in volatility."""
+        return self.gamma() * ((self._d1 * self._d2 - 1.0) / self.sigma)
+
+    def color(self) -> np.ndarray:
+        """Rate of change of gamma over time."""
+        return (
+            -self._discount_q
+            * self._pdf_d1
+            / (2.0 * self.S * self.T * self._sigma_sqrt_T)
+            * (
+                2.0 * self.q * self.T
+                + 1.0
+                + (2.0 * (self.r - self.q) * self.T - self._d2 * self._sigma_sqrt_T)
+                / self._sigma_sqrt_T
+                * self._d1
+            )
+        )
+
+    def ultima(self) -> np.ndarray:
+        """Sensitivity of vomma with respect to change in volatility. \n
+        3rd order derivative of option value to volatility.
+        """
+        d1d2 = self._d1 * self._d2
+        return (
+            -self.vega()
+            / self.sigma**2
+            * (d1d2 * (1.0 - d1d2) + self._d1**2 + self._d2**2)
+        )
+
+    def alpha(self) -> np.ndarray:
+        """Theta to gamma ratio. Also called "gamma rent".
+        More info: "Dynamic Hedging" by Nassim Taleb, p. 178-181.
+        """
+        return np.abs(self.theta()) / (self.gamma() + 1e-9)
+
+    def get_core_greeks(self) -> Dict[str, np.ndarray]:
+        """
+        Get the top 5 most well known Greeks.
+        1. Delta
+        2. Gamma
+        3. Vega
+        4. Theta
+        5. Rho
+        """
+        return {
+            "delta": self.delta(),
+            "gamma": self.gamma(),
+            "vega": self.vega(),
+            "theta": self.theta(),
+            "rho": self.rho(),
+        }
+
+    def get_itm_proxies(self) -> Dict[str, np.ndarray]:
+        """Get multiple ways of calculating probability
+        of options being in the money.
+        """
+        return {"in_the_money": self.in_the_money(), "dual_delta": self.dual_delta()}
+
+    def get_all_greeks(self) -> Dict[str, np.ndarray]:
+        """Retrieve all Greeks for the Black-Scholes-Merton model
+        implemented as a dictionary of arrays."""
+        return self.all_greeks()._asdict()
+
+    def get_greeks(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Retrieve a selection of Greeks as a dictionary of arrays. \n
+        Shared intermediates are computed once and
+        only when one of the selected Greeks needs them.
+
+        :param names: Names of the Greeks to evaluate. "price" is also accepted.
+        Ex. ["delta", "gamma", "vanna", "charm"]
+        """
+        return GreekPlan.compile(type(self), tuple(names))(self)
+
+    def all_greeks(self) -> BlackScholesGreeks:
+        """
+        Evaluate all Greeks in a single pass over shared intermediates. \n
+        Every field of the result is an array.
+        """
+        return _black_scholes_greeks(
+            self.S, self.K, self.T, self.r, self.sigma, self.q, self._phi,
+            self._sqrt_T, self._sigma_sqrt_T, self._d1, self._d2,
+            self._pdf_d1, self._pdf_d2, self._cdf_phi_d1, self._cdf_phi_d2,
+            self._discount_q, self._discount_r, self.price(),
+        )
+
+    @_cached_on("is_call")
+    def _phi(self) -> np.ndarray:
+        """+1 for calls and -1 for puts."""
+        return np.where(self.is_call, 1.0, -1.0).astype(self.K.dtype, copy=False)
+
+    @_cached_on("T")
+    def _sqrt_T(self) -> np.ndarray:
+        return np.sqrt(self.T)
+
+    @_cached_on("sigma", "_sqrt_T")
+    def _sigma_sqrt_T(self) -> np.ndarray:
+        return self.sigma * self._sqrt_T
+
+    @_cached_on("q", "T")
+    def _discount_q(self) -> np.ndarray:
+        return np.exp(-self.q * self.T)
+
+    @_cached_on("r", "T")
+    def _discount_r(self) -> np.ndarray:
+        return np.exp(-self.r * self.T)
+
+    @_cached_on("S", "K", "T", "r", "sigma", "q")
+    def _d1(self) -> np.ndarray:
+        """1st probability factor that acts as a multiplication factor for stock prices."""
+        return (
+            np.log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T
+        ) / self._sigma_sqrt_T
+
+    @_cached_on("_d1", "_sigma_sqrt_T")
+    def _d2(self) -> np.ndarray:
+        """2nd probability parameter that acts as a multiplication factor for discounting."""
+        return self._d1 - self._sigma_sqrt_T
+
+    @_cached_on("_d1")
+    def _pdf_d1(self) -> np.ndarray:
+        return self._pdf(self._d1)
+
+    @_cached_on("_d2")
+    def _pdf_d2(self) -> np.ndarray:
+        return self._pdf(self._d2)
+
+    @_cached_on("_phi", "_d1")
+    def _cdf_phi_d1(self) -> np.ndarray:
+        return self._cdf(self._phi * self._d1, self.accuracy)
+
+    @_cached_on("_phi", "_d2")
+    def _cdf_phi_d2(self) -> np.ndarray:
+        return self._cdf(self._phi * self._d2, self.accuracy)
+
+
+class BlackScholesCallVectorized(BlackScholesVectorized):
+    """
+    Calculate (European) call option prices and Greeks
+    with the Black-Scholes-Merton formula for arrays of options.
+
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    def __init__(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        q: ArrayLike = 0.0,
+        invalid: str = "raise",
+        accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        super().__init__(S=S, K=K, T=T, r=r, sigma=sigma, q=q, is_call=True, invalid=invalid, accuracy=accuracy, dtype=dtype)
+
+
+class BlackScholesPutVectorized(BlackScholesVectorized):
+    """
+    Calculate (European) put option prices and Greeks
+    with the Black-Scholes-Merton formula for arrays of options.
+
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    def __init__(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        q: ArrayLike = 0.0,
+        invalid: str = "raise",
+        accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        super().__init__(S=S, K=K, T=T, r=r, sigma=sigma, q=q, is_call=False, invalid=invalid, accuracy=accuracy, dtype=dtype)
+
+
+class Black76Vectorized(VectorizedInputsMixin, VectorizedStandardNormalMixin):
+    """
+    Calculate (European) option prices and Greeks with the
+    Black-76 formula for many options on futures at once. \n
+    All parameters can be scalars or NumPy arrays that broadcast against each other.
+    Every method returns a NumPy array with the broadcast shape.
+
+    :param F: Price of underlying futures contract \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of futures contract (0.15 indicates 15%) \n
+    :param is_call: True for call options and False for put options \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    _inputs = ("F", "K", "T", "r", "sigma", "is_call")
+    _input_checks = {
+        "F": (lambda F: F > 0.0, "Futures price (F) needs to be larger than 0."),
+        "K": (lambda K: K > 0.0, "Strike price (K) needs to be larger than 0."),
+        "T": (lambda T: T > 0.0, "Time to maturity (T) needs to be larger than 0."),
+        "sigma": (lambda sigma: sigma > 0.0, "Volatility (sigma) needs to be larger than 0."),
+    }
+    _greek_names = frozenset(Black76Greeks._fields) | {"price"}
+
+    def __init__(
+        self,
+        F: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        is_call: ArrayLike = True,
+        invalid: str = "raise",
+        accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        dtype = _check_dtype(dtype)
+        F, K, T, r, sigma = (
+            np.asarray(param, dtype=dtype) for param in (F, K, T, r, sigma)
+        )
+        F, K, T, r, sigma, is_call = np.broadcast_arrays(
+            F, K, T, r, sigma, np.asarray(is_call, dtype=bool)
+        )
+        self._set_checked_inputs(invalid, F=F, K=K, T=T, r=r, sigma=sigma, is_call=is_call)
+        assert accuracy in ("full", "fast"), f"accuracy needs to be 'full' or 'fast'. Got '{accuracy}'"
+        self._accuracy = accuracy
+
+    def price(self) -> np.ndarray:
+        """
+        Fair value for options. \n
+        With accuracy="full", prices of out-of-the-money options keep their relative precision
+        in the far wings, see `_tail_safe_price`.
+        """
+        if self.accuracy == "fast":
+            return self._phi * self._discount_r * (self.F * self._cdf_phi_d1 - self.K * self._cdf_phi_d2)
+        return self._discount_r * _tail_safe_price_vectorized(
+            self._phi, self._d1, self._d2, self.F, self.K, self._pdf_d1, self._cdf_phi_d1, self._cdf_phi_d2,
+        )
+
+    def delta(self) -> np.ndarray:
+        """Rate of change in option price
+        with respect to the underlying futures price (1st derivative).
+        """
+        return self._phi * self._discount_r * self._cdf_phi_d1
+
+    def gamma(self) -> np.ndarray:
+        """
+        Rate of change in delta with respect to the underlying futures price (2nd derivative).
+        """
+        return self._discount_r * self._pdf_d1 / (self.F * self._sigma_sqrt_T)
+
+    def vega(self) -> np.ndarray:
+        """Rate of change in option price with respect to the volatility
+        of underlying futures contract.
+        """
+        return self.F * self._discount_r * self._pdf_d1 * self._sqrt_T
+
+    def theta(self) -> np.ndarray:
+        """
+        Rate of change in option price
+        with respect to time (i.e. time decay).
+        """
+        return -self.F * self._discount_r * self._pdf_d1 * self.sigma / (2.0 * self._sqrt_T) + self.r * self.price()
+
+    def rho(self) -> np.ndarray:
+        """Rate of change in option price
+        with respect to the risk-free rate.
+        """
+        return -self.T * self.price()
+
+    def vanna(self) -> np.ndarray:
+        """Sensitivity of delta with respect to change in volatility."""
+        return -self._discount_r * self._pdf_d1 * self._d2 / self.sigma
+
+    def charm(self) -> np.ndarray:
+        """Rate of change of delta over time (also known as delta decay)."""
+        return self.r * self.delta() + self._discount_r * self._pdf_d1 * self._d2 / (2.0 * self.T)
+
+    def vomma(self) -> np.ndarray:
+        """2nd order sensitivity to volatility."""
+        return self.vega() * self._d1 * self._d2 / self.sigma
+
+    def veta(self) -> np.ndarray:
+        """Rate of change in `vega` with respect to time."""
+        return -self.vega() * (self.r - (1.0 + self._d1 * self._d2) / (2.0 * self.T))
+
+    def speed(self) -> np.ndarray:
+        """Rate of change in Gamma with respect to change in the futures price."""
+        return -self.gamma() / self.F * (self._d1 / self._sigma_sqrt_T + 1.0)
+
+    def zomma(self) -> np.ndarray:
+        """Rate of change of gamma with respect to changes in volatility."""
+        return self.gamma() * (self._d1 * self._d2 - 1.0) / self.sigma
+
+    def color(self) -> np.ndarray:
+        """Rate of change of gamma over time."""
+        return -self.gamma() / (2.0 * self.T) * (2.0 * self.r * self.T + 1.0 - self._d1 * self._d2)
+
+    def ultima(self) -> np.ndarray:
+        """Sensitivity of vomma with respect to change in volatility. \n
+        3rd order derivative of option value to volatility.
+        """
+        d1d2 = self._d1 * self._d2
+        return (
+            -self.vega()
+            / self.sigma**2
+            * (d1d2 * (1.0 - d1d2) + self._d1**2 + self._d2**2)
+        )
+
+    def alpha(self) -> np.ndarray:
+        """Theta to gamma ratio. Also called "gamma rent".
+        More info: "Dynamic Hedging" by Nassim Taleb, p. 178-181.
+        """
+        return np.abs(self.theta()) / (self.gamma() + 1e-9)
+
+    def get_core_greeks(self) -> Dict[str, np.ndarray]:
+        """
+        Get the top 5 most well known Greeks.
+        1. Delta
+        2. Gamma
+        3. Vega
+        4. Theta
+        5. Rho
+        """
+        return {
+            "delta": self.delta(),
+            "gamma": self.gamma(),
+            "vega": self.vega(),
+            "theta": self.theta(),
+            "rho": self.rho(),
+        }
+
+    def get_all_greeks(self) -> Dict[str, np.ndarray]:
+        """Retrieve all Greeks for the Black76 model
+        implemented as a dictionary of arrays."""
+        return self.all_greeks()._asdict()
+
+    def get_greeks(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Retrieve a selection of Greeks as a dictionary of arrays. \n
+        Shared intermediates are computed once and
+        only when one of the selected Greeks needs them.
+
+        :param names: Names of the Greeks to evaluate. "price" is also accepted.
+        Ex. ["delta", "gamma", "charm"]
+        """
+        return GreekPlan.compile(type(self), tuple(names))(self)
+
+    def all_greeks(self) -> Black76Greeks:
+        """
+        Evaluate all Greeks in a single pass over shared intermediates. \n
+        Every field of the result is an array.
+        """
+        return _black_76_greeks(
+            self.F, self.K, self.T, self.r, self.sigma, self._phi,
+            self._sqrt_T, self._sigma_sqrt_T, self._d1, self._d2,
+            self._pdf_d1, self._cdf_phi_d1, self._cdf_phi_d2, self._discount_r, self.price(),
+        )
+
+    @_cached_on("is_call")
+    def _phi(self) -> np.ndarray:
+        """+1 for calls and -1 for puts."""
+        return np.where(self.is_call, 1.0, -1.0).astype(self.K.dtype, copy=False)
+
+    @_cached_on("T")
+    def _sqrt_T(self) -> np.ndarray:
+        return np.sqrt(self.T)
+
+    @_cached_on("sigma", "_sqrt_T")
+    def _sigma_sqrt_T(self) -> np.ndarray:
+        return self.sigma * self._sqrt_T
+
+    @_cached_on("r", "T")
+    def _discount_r(self) -> np.ndarray:
+        return np.exp(-self.r * self.T)
+
+    @_cached_on("F", "K", "T", "sigma")
+    def _d1(self) -> np.ndarray:
+        """1st probability factor that acts as a multiplication factor for futures contracts."""
+        return (np.log(self.F / self.K) + 0.5 * self.sigma**2 * self.T) / self._sigma_sqrt_T
+
+    @_cached_on("_d1", "_sigma_sqrt_T")
+    def _d2(self) -> np.ndarray:
+        """2nd probability parameter that acts as a multiplication factor for discounting."""
+        return self._d1 - self._sigma_sqrt_T
+
+    @_cached_on("_d1")
+    def _pdf_d1(self) -> np.ndarray:
+        return self._pdf(self._d1)
+
+    @_cached_on("_phi", "_d1")
+    def _cdf_phi_d1(self) -> np.ndarray:
+        return self._cdf(self._phi * self._d1, self.accuracy)
+
+    @_cached_on("_phi", "_d2")
+    def _cdf_phi_d2(self) -> np.ndarray:
+        return self._cdf(self._phi * self._d2, self.accuracy)
+
+
+class Black76CallVectorized(Black76Vectorized):
+    """
+    Calculate (European) call option prices and Greeks
+    with the Black-76 formula for arrays of options on futures.
+
+    :param F: Price of underlying futures contract \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of futures contract (0.15 indicates 15%) \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    def __init__(
+        self, F: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, sigma: ArrayLike, invalid: str = "raise", accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        super().__init__(F=F, K=K, T=T, r=r, sigma=sigma, is_call=True, invalid=invalid, accuracy=accuracy, dtype=dtype)
+
+
+class Black76PutVectorized(Black76Vectorized):
+    """
+    Calculate (European) put option prices and Greeks
+    with the Black-76 formula for arrays of options on futures.
+
+    :param F: Price of underlying futures contract \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of futures contract (0.15 indicates 15%) \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    def __init__(
+        self, F: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, sigma: ArrayLike, invalid: str = "raise", accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        super().__init__(F=F, K=K, T=T, r=r, sigma=sigma, is_call=False, invalid=invalid, accuracy=accuracy, dtype=dtype)
+
+
+class BinaryVectorized(VectorizedInputsMixin, VectorizedStandardNormalMixin):
+    """
+    Calculate (European) binary option prices and Greeks for many options at once.
+    Also called digital or exotic options. \n
+    Uses the same formulas as `BinaryCall` and `BinaryPut`.
+    All parameters can be scalars or NumPy arrays that broadcast against each other.
+    Every method returns a NumPy array with the broadcast shape.
+
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param is_call: True for call options and False for put options \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    _inputs = ("S", "K", "T", "r", "sigma", "q", "is_call")
+    _input_checks = _BLACK_SCHOLES_INPUT_CHECKS
+    _greek_names = frozenset({"price", "forward", "delta", "gamma", "vega", "theta", "rho"})
+
+    def __init__(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        q: ArrayLike = 0.0,
+        is_call: ArrayLike = True,
+        invalid: str = "raise",
+        accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        dtype = _check_dtype(dtype)
+        S, K, T, r, sigma, q = (
+            np.asarray(param, dtype=dtype) for param in (S, K, T, r, sigma, q)
+        )
+        S, K, T, r, sigma, q, is_call = np.broadcast_arrays(
+            S, K, T, r, sigma, q, np.asarray(is_call, dtype=bool)
+        )
+        self._set_checked_inputs(invalid, S=S, K=K, T=T, r=r, sigma=sigma, q=q, is_call=is_call)
+        assert accuracy in ("full", "fast"), f"accuracy needs to be 'full' or 'fast'. Got '{accuracy}'"
+        self._accuracy = accuracy
+
+    def price(self) -> np.ndarray:
+        """Fair value for binary options."""
+        return self._discount_r * self._cdf_phi_d2
+
+    def forward(self) -> np.ndarray:
+        """Fair value for binary options without discounting for interest rates."""
+        return self._cdf_phi_d2
+
+    def delta(self) -> np.ndarray:
+        """Rate of change in option price
+        with respect to the underlying price (1st derivative).
+        """
+        return self._phi * self._discount_pdf_d2 / (self.S * self._sigma_sqrt_T)
+
+    def gamma(self) -> np.ndarray:
+        """Rate of change in delta
+        with respect to the underlying price (2nd derivative).
+        """
+        return -self._phi * self._discount_pdf_d2 * self._d1 / (self.S * self._sigma_sqrt_T) ** 2
+
+    def vega(self) -> np.ndarray:
+        """Rate of change in option price
+        with respect to the volatility (1st derivative).
+        """
+        return -self._phi * self._discount_pdf_d2 * self._d1 / self.sigma
+
+    def theta(self) -> np.ndarray:
+        """Rate of change in option price
+        with respect to time (i.e. time decay).
+        """
+        return self.r * self.price() - self._phi * self._discount_pdf_d2 * (
+            (self.r - self.q) / self._sigma_sqrt_T - self._d1 / (2.0 * self.T)
+        )
+
+    def rho(self) -> np.ndarray:
+        """Rate of change in option price
+        with respect to the risk-free rate.
+        """
+        return -self.T * self.price() + self._phi * self._discount_pdf_d2 * self._sqrt_T / self.sigma
+
+    def get_core_greeks(self) -> Dict[str, np.ndarray]:
+        """
+        Get the top 5 most well known Greeks for the binary options.
+        1. Delta
+        2. Gamma
+        3. Vega
+        4. Theta
+        5. Rho
+        """
+        return {
+            "delta": self.delta(),
+            "gamma": self.gamma(),
+            "vega": self.vega(),
+            "theta": self.theta(),
+            "rho": self.rho(),
+        }
+
+    def get_greeks(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Retrieve a selection of Greeks as a dictionary of arrays. \n
+        Shared intermediates are computed once and
+        only when one of the selected Greeks needs them.
+
+        :param names: Names of the Greeks to evaluate. "price" and "forward" are also accepted.
+        Ex. ["price", "delta", "vega"]
+        """
+        return GreekPlan.compile(type(self), tuple(names))(self)
+
+    @_cached_on("is_call")
+    def _phi(self) -> np.ndarray:
+        """+1 for calls and -1 for puts."""
+        return np.where(self.is_call, 1.0, -1.0).astype(self.K.dtype, copy=False)
+
+    @_cached_on("T")
+    def _sqrt_T(self) -> np.ndarray:
+        return np.sqrt(self.T)
+
+    @_cached_on("sigma", "_sqrt_T")
+    def _sigma_sqrt_T(self) -> np.ndarray:
+        return self.sigma * self._sqrt_T
+
+    @_cached_on("r", "T")
+    def _discount_r(self) -> np.ndarray:
+        return np.exp(-self.r * self.T)
+
+    @_cached_on("S", "K", "T", "r", "sigma", "q")
+    def _d1(self) -> np.ndarray:
+        """1st probability factor that acts as a multiplication factor for stock prices."""
+        return (
+            np.log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T
+        ) / self._sigma_sqrt_T
+
+    @_cached_on("_d1", "_sigma_sqrt_T")
+    def _d2(self) -> np.ndarray:
+        """2nd probability parameter that acts as a multiplication factor for discounting."""
+        return self._d1 - self._sigma_sqrt_T
+
+    @_cached_on("_d2")
+    def _pdf_d2(self) -> np.ndarray:
+        return self._pdf(self._d2)
+
+    @_cached_on("_discount_r", "_pdf_d2")
+    def _discount_pdf_d2(self) -> np.ndarray:
+        """Discounted density of d2, the sensitivity of the price to d2 without its sign."""
+        return self._discount_r * self._pdf_d2
+
+    @_cached_on("_phi", "_d2")
+    def _cdf_phi_d2(self) -> np.ndarray:
+        return self._cdf(self._phi * self._d2, self.accuracy)
+
+
+class BinaryCallVectorized(BinaryVectorized):
+    """
+    Calculate (European) binary call option prices and Greeks for arrays of options.
+
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    def __init__(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        q: ArrayLike = 0.0,
+        invalid: str = "raise",
+        accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        super().__init__(S=S, K=K, T=T, r=r, sigma=sigma, q=q, is_call=True, invalid=invalid, accuracy=accuracy, dtype=dtype)
+
+
+class BinaryPutVectorized(BinaryVectorized):
+    """
+    Calculate (European) binary put option prices and Greeks for arrays of options.
+
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param invalid: "raise" to raise a ValueError on invalid inputs,
+    or "nan" to return NaN for options with invalid inputs (see `errors`) \n
+    :param accuracy: "full" for a normal CDF accurate to double precision,
+    or "fast" for a 3-4x faster CDF with a maximum absolute error of 7.5e-8 \n
+    :param dtype: np.float64, or np.float32 to halve memory and memory traffic.
+    float32 prices are accurate to about 1e-6 of the underlying price.
+    """
+
+    def __init__(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        sigma: ArrayLike,
+        q: ArrayLike = 0.0,
+        invalid: str = "raise",
+        accuracy: str = "full",
+        dtype: DTypeLike = np.float64,
+    ):
+        super().__init__(S=S, K=K, T=T, r=r, sigma=sigma, q=q, is_call=False, invalid=invalid, accuracy=accuracy, dtype=dtype)
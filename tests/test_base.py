@@ -1,8 +1,12 @@
+import itertools
+
 import numpy as np
 import pytest
+from scipy.special import erfcx
 from scipy.stats import norm
 
-from blackscholes.base import Black76Base, BlackScholesBase, BinaryBase, StandardNormalMixin
+from blackscholes.base import Black76Base, BlackScholesBase, BinaryBase, GreekPlan, StandardNormalMixin
+from blackscholes.vectorized import VectorizedStandardNormalMixin
 
 # Test parameters
 test_S = 55.0  # Asset price of 55
@@ -19,6 +23,25 @@ class TestStandardNormalMixIn:
         np.testing.assert_almost_equal(norm.pdf(n), mix._pdf(n), decimal=5)
         np.testing.assert_almost_equal(norm.cdf(n), mix._cdf(n), decimal=5)
 
+    def test_cdf_tails(self):
+        # Full relative precision deep in the lower tail, where 1 + erf(x) cancels
+        for x in [-37.0, -20.0, -8.5, -3.0, 0.0, 3.0, 8.5]:
+            np.testing.assert_allclose(self.mix._cdf(x), norm.cdf(x), rtol=1e-13)
+            np.testing.assert_allclose(self.mix._pdf(x), norm.pdf(x), rtol=1e-13)
+
+    def test_mills_ratio(self):
+        y = np.concatenate([np.linspace(0.0, 60.0, 6_001), [1e2, 1e3, 1e6]])
+        expected = np.sqrt(np.pi / 2.0) * erfcx(y / np.sqrt(2.0))
+        np.testing.assert_allclose([self.mix._mills_ratio(value) for value in y], expected, rtol=1e-14)
+        np.testing.assert_allclose(VectorizedStandardNormalMixin._mills_ratio(y), expected, rtol=1e-14)
+
+    @pytest.mark.parametrize("accuracy, max_abs_error", [("full", 1e-15), ("fast", 7.5e-8)])
+    def test_vectorized_accuracy(self, accuracy, max_abs_error):
+        x = np.linspace(-40.0, 40.0, 400_001)
+        cdf = VectorizedStandardNormalMixin._cdf(x, accuracy)
+        assert np.max(np.abs(cdf - norm.cdf(x))) < max_abs_error
+        assert np.all((cdf >= 0.0) & (cdf <= 1.0))
+
 
 class BlackScholesMeta(BlackScholesBase):
     """Dummy class for testing Black Scholes base methods."""
@@ -149,6 +172,65 @@ class TestBlackScholesBase:
         ultima = self.meta.ultima()
         np.testing.assert_almost_equal(ultima, -827.4229433648609, decimal=6)
 
+    def test_get_greeks(self):
+        calls = []
+
+        class CountingMeta(BlackScholesMeta):
+            @staticmethod
+            def _pdf(x):
+                calls.append("pdf")
+                return StandardNormalMixin._pdf(x)
+
+        meta = CountingMeta(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        greeks = meta.get_greeks(["gamma", "vega", "vanna", "speed", "zomma"])
+        assert list(greeks.keys()) == ["gamma", "vega", "vanna", "speed", "zomma"]
+        for name, value in greeks.items():
+            assert value == getattr(self.meta, name)()
+        # pdf(d1) is shared by all selected Greeks and only evaluated once
+        assert calls == ["pdf"]
+
+        with pytest.raises(ValueError):
+            meta.get_greeks(["delta", "not_a_greek"])
+
+    def test_greek_plan_cache_is_bounded(self):
+        meta = BlackScholesMeta(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        names = ["delta", "gamma", "vega", "theta", "rho", "vanna"]
+        # Every ordering of a selection is a separate plan
+        for names in itertools.permutations(names):
+            assert list(meta.get_greeks(names)) == list(names)
+        info = GreekPlan.compile.cache_info()
+        assert info.currsize <= info.maxsize < 720
+
+    def test_cache_invalidation(self):
+        meta = BlackScholesMeta(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        gamma = meta.gamma()
+        assert "_d1" in vars(meta) and "_pdf_d1" in vars(meta)
+        # Changing an input should discard every cached intermediate
+        meta.S = 60.0
+        assert "_d1" not in vars(meta) and "_pdf_d1" not in vars(meta)
+        bumped = BlackScholesMeta(S=60.0, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        assert meta.gamma() == bumped.gamma() != gamma
+        meta.q = 0.02
+        assert meta._d1 == BlackScholesMeta(S=60.0, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=0.02)._d1
+
+    def test_update(self):
+        meta = BlackScholesMeta(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        meta.get_greeks(["gamma", "vega", "epsilon"])
+        discount_q, sigma_sqrt_T = meta._discount_q, meta._sigma_sqrt_T
+        # Only intermediates that depend on the changed inputs are discarded
+        meta.update(S=60.0, r=0.01)
+        assert "_d1" not in vars(meta) and "_discount_r" not in vars(meta)
+        assert vars(meta)["_discount_q"] is discount_q and vars(meta)["_sigma_sqrt_T"] is sigma_sqrt_T
+        bumped = BlackScholesMeta(S=60.0, K=test_K, T=test_T, r=0.01, sigma=test_sigma)
+        assert meta.get_greeks(["gamma", "vega", "vanna"]) == bumped.get_greeks(["gamma", "vega", "vanna"])
+        meta.update(sigma=0.3, T=0.5)
+        assert meta.vanna() == BlackScholesMeta(S=60.0, K=test_K, T=0.5, r=0.01, sigma=0.3).vanna()
+
+        with pytest.raises(ValueError):
+            meta.update(sigma=-0.1)
+        with pytest.raises(ValueError):
+            meta.update(spot=60.0)
+
 
 class Black76Meta(Black76Base):
     """Dummy class for testing Black76 base methods."""
@@ -234,6 +316,27 @@ class TestBlack76Base:
         vomma = self.meta.vomma()
         np.testing.assert_almost_equal(vomma, 45.13472833935059, decimal=5)
 
+    def test_get_greeks(self):
+        greeks = self.meta.get_greeks(["gamma", "vanna"])
+        assert greeks == {"gamma": self.meta.gamma(), "vanna": self.meta.vanna()}
+
+    def test_cache_invalidation(self):
+        meta = Black76Meta(F=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        vega = meta.vega()
+        meta.sigma = 0.3
+        bumped = Black76Meta(F=test_S, K=test_K, T=test_T, r=test_r, sigma=0.3)
+        assert meta.vega() == bumped.vega() != vega
+
+    def test_update(self):
+        meta = Black76Meta(F=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        d1 = meta._d1
+        # d1 does not depend on the risk-free rate for futures options
+        meta.update(r=0.05)
+        assert vars(meta)["_d1"] is d1
+        assert meta.vega() == Black76Meta(F=test_S, K=test_K, T=test_T, r=0.05, sigma=test_sigma).vega()
+        with pytest.raises(ValueError):
+            meta.update(F=-1.0)
+
 
 class BinaryMeta(BinaryBase):
     """Dummy class for testing Binary base methods."""
@@ -311,4 +414,11 @@ class TestBinaryBase:
 
     def test_gamma(self):
         gamma = self.meta.gamma()
-        np.testing.assert_almost_equal(gamma, 0.0032595297589864043, decimal=6)
+        np.testing.assert_almost_equal(gamma, -0.003598982722841523, decimal=6)
+
+    def test_cache_invalidation(self):
+        meta = BinaryMeta(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        gamma = meta.gamma()
+        meta.T = 0.5
+        bumped = BinaryMeta(S=test_S, K=test_K, T=0.5, r=test_r, sigma=test_sigma)
+        assert meta.gamma() == bumped.gamma() != gamma
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from blackscholes import InputError, InstrumentType, OptionBook
+
+# Random book with every instrument type
+rng = np.random.default_rng(7)
+n_positions = 600
+book_kind = rng.integers(0, len(InstrumentType), n_positions)
+book_S = rng.uniform(50.0, 150.0, n_positions)
+book_K = book_S * rng.uniform(0.8, 1.25, n_positions)
+book_T = rng.uniform(0.1, 3.0, n_positions)
+book_r = rng.uniform(-0.01, 0.08, n_positions)
+book_sigma = rng.uniform(0.1, 0.6, n_positions)
+book_q = rng.uniform(0.0, 0.05, n_positions)
+book_quantity = rng.integers(-10, 11, n_positions).astype(float)
+
+
+def make_book() -> OptionBook:
+    return OptionBook(book_kind, book_S, book_K, book_T, book_r, book_sigma, book_q, book_quantity)
+
+
+class TestOptionBook:
+    def test_matches_scalar(self):
+        book = make_book()
+        greeks = book.get_greeks(["price", "delta", "gamma", "vega", "theta", "rho"])
+        for name, value in greeks.items():
+            expected = [getattr(book.option(i), name)() for i in range(n_positions)]
+            np.testing.assert_allclose(value, expected, rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(book.price(), greeks["price"])
+
+    def test_total_greeks(self):
+        book = make_book()
+        totals = book.total_greeks(["price", "delta"])
+        expected = sum(quantity * book.option(i).delta() for i, quantity in enumerate(book_quantity))
+        np.testing.assert_allclose(totals["delta"], expected, rtol=1e-10)
+        assert isinstance(totals["price"], float)
+
+    def test_columns_and_filter(self):
+        book = make_book()
+        np.testing.assert_array_equal(book["K"], book_K)
+        binary_calls = book[book["kind"] == InstrumentType.BINARY_CALL]
+        assert len(binary_calls) == np.sum(book_kind == InstrumentType.BINARY_CALL)
+        np.testing.assert_array_equal(binary_calls.price(), book.price()[book_kind == InstrumentType.BINARY_CALL])
+        assert len(book.filter(book_T < 1.0)) == np.sum(book_T < 1.0)
+        assert len(book[:10]) == 10 and len(book[3]) == 1
+
+    def test_append(self):
+        book = OptionBook()
+        for row in make_book().positions:
+            book.append(*row.tolist())
+        np.testing.assert_array_equal(book.positions, make_book().positions)
+        # Storage grows geometrically instead of once per position
+        assert book._positions.shape[0] < 2 * n_positions
+        book.extend(make_book())
+        assert len(book) == 2 * n_positions
+        np.testing.assert_allclose(book.total_greeks(["vega"])["vega"], 2 * make_book().total_greeks(["vega"])["vega"])
+
+    def test_net(self):
+        book = make_book()
+        book.extend(make_book())
+        book.append(InstrumentType.BLACK_SCHOLES_CALL, 55.0, 50.0, 1.0, 0.0025, 0.15, quantity=[3.0, -3.0])
+        netted = book.net()
+        assert len(netted) == np.sum(book_quantity != 0.0)
+        np.testing.assert_array_equal(np.sort(netted["quantity"]), np.sort(2 * book_quantity[book_quantity != 0.0]))
+        np.testing.assert_allclose(
+            netted.total_greeks(["price", "delta"])["delta"], book.total_greeks(["delta"])["delta"], rtol=1e-10
+        )
+
+    def test_black_76(self):
+        book = OptionBook(InstrumentType.BLACK_76_PUT, 55.0, 50.0, 1.0, 0.0025, 0.15, q=0.05)
+        option = book.option(0)
+        assert option.F == 55.0
+        # Black-76 options ignore the dividend yield
+        np.testing.assert_allclose(book.price(), option.price(), rtol=1e-12)
+        # A negative dividend yield is not validated for Black-76 options
+        book.append([InstrumentType.BLACK_76_CALL, InstrumentType.BLACK_76_PUT], 55.0, 50.0, 1.0, 0.0025, 0.15, q=-0.01)
+        assert len(book) == 3 and (book.errors() == 0).all()
+        with pytest.raises(ValueError):
+            book.append(InstrumentType.BLACK_SCHOLES_CALL, 55.0, 50.0, 1.0, 0.0025, 0.15, q=-0.01)
+
+    def test_invalid_nan(self):
+        S = book_S.copy()
+        S[10] = np.nan
+        T = book_T.copy()
+        T[20] = 0.0
+        book = OptionBook(book_kind, S, book_K, T, book_r, book_sigma, book_q, book_quantity, invalid="nan")
+        errors = book.errors()
+        np.testing.assert_array_equal(np.flatnonzero(errors), [10, 20])
+        assert errors[20] == InputError.NON_POSITIVE_T
+        price = book.price()
+        assert np.isnan(price[[10, 20]]).all()
+        np.testing.assert_array_equal(np.delete(price, [10, 20]), np.delete(make_book().price(), [10, 20]))
+        valid = errors == 0
+        expected = OptionBook.from_records(book.positions[valid]).total_greeks(["delta"])["delta"]
+        np.testing.assert_allclose(book.total_greeks(["delta"])["delta"], expected, rtol=1e-12)
+        assert len(book.filter(valid).errors().nonzero()[0]) == 0
+
+    def test_arg_assert(self):
+        with pytest.raises(ValueError):
+            OptionBook(InstrumentType.BLACK_SCHOLES_CALL, [55.0, -1.0], 50.0, 1.0, 0.0025, 0.15)
+        with pytest.raises(ValueError):
+            OptionBook(7, 55.0, 50.0, 1.0, 0.0025, 0.15)
+        # Greeks that only some option families in the book have
+        with pytest.raises(ValueError, match="BINARY_CALL and BINARY_PUT"):
+            make_book().get_greeks(["vanna"])
+        with pytest.raises(ValueError, match="BLACK_SCHOLES_CALL and BLACK_SCHOLES_PUT"):
+            make_book().get_greeks(["forward"])
+
+    def test_greeks_per_family(self):
+        book = make_book()
+        vanilla = book.filter(np.isin(book["kind"], [InstrumentType.BINARY_CALL, InstrumentType.BINARY_PUT], invert=True))
+        vomma = vanilla.get_greeks(["vomma"])["vomma"]
+        np.testing.assert_allclose(vomma, [vanilla.option(i).vomma() for i in range(len(vomma))], rtol=1e-12)
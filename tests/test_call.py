@@ -1,5 +1,6 @@
 import numpy as np
 
+from blackscholes.base import BlackScholesGreeks
 from blackscholes import Black76Call, Black76Put, BlackScholesCall, BlackScholesPut, BinaryCall, BinaryPut
 
 # Test parameters
@@ -17,6 +18,18 @@ class TestBlackScholesCall:
         call_price = self.call.price()
         np.testing.assert_almost_equal(call_price, 6.339408, decimal=4)
 
+    def test_price_far_out_of_the_money(self):
+        # Reference prices evaluated with 50 digit arithmetic. With T = 0.0001 the price itself
+        # is sensitive enough to its inputs that rounding in d1 and d2 costs about 1e-12.
+        for K, T, sigma, q, expected in [
+            (150.0, 1.0, 0.15, 0.0, 2.4619000708521091e-11),
+            (80.0, 0.01, 0.15, 0.0, 2.110445942614683e-139),
+            (56.0, 0.0001, 0.1, 0.01, 2.1058552888447254e-75),
+            (500.0, 1.0, 0.2, 0.01, 2.4485043473003019e-28),
+        ]:
+            price = BlackScholesCall(S=test_S, K=K, T=T, r=test_r, sigma=sigma, q=q).price()
+            np.testing.assert_allclose(price, expected, rtol=1e-11)
+
     def test_delta(self):
         call_delta = self.call.delta()
         np.testing.assert_almost_equal(call_delta, 0.766407808509462, decimal=6)
@@ -125,6 +138,19 @@ class TestBlackScholesCall:
         charm = self.call.charm()
         np.testing.assert_almost_equal(charm, 0.0832677717846717, decimal=6)
 
+    def test_all_greeks_fused(self):
+        # The single-pass kernel should agree with the individual Greek methods
+        for q in [0.0, 0.03]:
+            call = BlackScholesCall(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=q)
+            greeks = call.all_greeks()
+            assert isinstance(greeks, BlackScholesGreeks)
+            for name, value in greeks._asdict().items():
+                np.testing.assert_allclose(value, getattr(call, name)(), rtol=1e-12)
+        # Far out of the money, lambda uses the tail-safe price as well
+        call = BlackScholesCall(S=test_S, K=test_S * np.exp(2.5), T=0.5, r=test_r, sigma=test_sigma)
+        assert 0.0 < call.price() < 1e-100
+        np.testing.assert_allclose(call.all_greeks().lambda_greek, call.lambda_greek(), rtol=1e-12)
+
     def test_all_greeks(self):
         all_greeks = self.call.get_all_greeks()
         expected_result = {
@@ -163,6 +189,11 @@ class TestBlack76Call:
         price = self.call.price()
         np.testing.assert_almost_equal(price, 6.234516612704489, decimal=6)
 
+    def test_price_far_out_of_the_money(self):
+        for K, T, expected in [(150.0, 1.0, 2.1894406134192217e-11), (80.0, 0.01, 2.024095114054087e-139)]:
+            price = Black76Call(F=test_S, K=K, T=T, r=test_r, sigma=test_sigma).price()
+            np.testing.assert_allclose(price, expected, rtol=1e-12)
+
     def test_delta(self):
         delta = self.call.delta()
         np.testing.assert_almost_equal(delta, 0.7593715061928189, decimal=5)
@@ -212,6 +243,12 @@ class TestBlack76Call:
             "vanna": -1.1551661594303946,
             "vomma": 45.13472833935059,
             "alpha": 33.615376718617554,
+            "charm": 0.08853589072276163,
+            "veta": 11.84553461141271,
+            "speed": -0.0039086768888237445,
+            "zomma": -0.15038648548195166,
+            "color": -0.011372682771581731,
+            "ultima": -799.9099735048536,
         }
         assert set(all_greeks.keys()) == set(expected_result.keys())
         for key in expected_result.keys():
@@ -219,6 +256,29 @@ class TestBlack76Call:
                 all_greeks[key], expected_result[key], decimal=5
             )
 
+    def test_higher_order_greeks(self):
+        # Compare against central finite differences of lower order Greeks
+        h = 1e-4
+
+        def bump(greek: str, **kwargs) -> float:
+            params = dict(F=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+            up = Black76Call(**{**params, **{k: params[k] + v for k, v in kwargs.items()}})
+            down = Black76Call(**{**params, **{k: params[k] - v for k, v in kwargs.items()}})
+            return (getattr(up, greek)() - getattr(down, greek)()) / (2 * h)
+
+        np.testing.assert_allclose(self.call.charm(), -bump("delta", T=h), rtol=1e-6)
+        np.testing.assert_allclose(self.call.speed(), bump("gamma", F=h), rtol=1e-6)
+        np.testing.assert_allclose(self.call.zomma(), bump("gamma", sigma=h), rtol=1e-6)
+        np.testing.assert_allclose(self.call.color(), bump("gamma", T=h), rtol=1e-6)
+        np.testing.assert_allclose(self.call.veta(), bump("vega", T=h), rtol=1e-6)
+        np.testing.assert_allclose(self.call.ultima(), bump("vomma", sigma=h), rtol=1e-5)
+
+    def test_all_greeks_fused(self):
+        greeks = self.call.all_greeks()
+        for name, value in greeks._asdict().items():
+            np.testing.assert_allclose(value, getattr(self.call, name)(), rtol=1e-12)
+
+
 class TestBinaryCall:
     call = BinaryCall(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
     put = BinaryPut(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
@@ -231,38 +291,62 @@ class TestBinaryCall:
         forward = self.call.forward()
         np.testing.assert_almost_equal(forward, 0.7180531943767934, decimal=6)
 
+    def test_dividend_yield(self):
+        # The dividend yield lowers the forward in the same way as a lower interest rate
+        call = BinaryCall(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=0.03)
+        expected = BinaryCall(S=test_S, K=test_K, T=test_T, r=test_r - 0.03, sigma=test_sigma)
+        np.testing.assert_almost_equal(call.forward(), expected.forward(), decimal=12)
+        assert call.price() < self.call.price()
+
     def test_delta(self):
         delta = self.call.delta()
-        np.testing.assert_almost_equal(delta, 0.3055162306516324, decimal=6)
+        np.testing.assert_almost_equal(delta, 0.04083746356834601, decimal=6)
 
     def test_gamma(self):
         gamma = self.call.gamma()
         put_gamma = self.put.gamma()
-        np.testing.assert_almost_equal(gamma, put_gamma, decimal=15)
-        np.testing.assert_almost_equal(gamma, 0.0032595297589864043, decimal=6)
+        np.testing.assert_almost_equal(gamma, -put_gamma, decimal=15)
+        np.testing.assert_almost_equal(gamma, -0.003598982722841523, decimal=6)
 
     def test_vega(self):
         vega = self.call.vega()
         put_vega = self.put.vega()
         np.testing.assert_almost_equal(vega, -put_vega, decimal=15)
-        np.testing.assert_almost_equal(vega, 81.65192052446703, decimal=6)
+        np.testing.assert_almost_equal(vega, -1.6330384104893412, decimal=6)
 
     def test_theta(self):
         theta = self.call.theta()
-        np.testing.assert_almost_equal(theta, -1.1738764912159139, decimal=6)
+        np.testing.assert_almost_equal(theta, 0.1186533803046488, decimal=6)
 
     def test_rho(self):
         rho = self.call.rho()
-        np.testing.assert_almost_equal(rho, 35.813015171916085, decimal=6)
+        np.testing.assert_almost_equal(rho, 1.5298001928207086, decimal=6)
+
+    def test_finite_differences(self):
+        # Greeks with a dividend yield against central finite differences of the price and delta
+        h = 1e-4
+        params = dict(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=0.03)
+        option = BinaryCall(**params)
+
+        def bump(greek: str, name: str) -> float:
+            up = BinaryCall(**{**params, name: params[name] + h})
+            down = BinaryCall(**{**params, name: params[name] - h})
+            return (getattr(up, greek)() - getattr(down, greek)()) / (2 * h)
+
+        np.testing.assert_allclose(option.delta(), bump("price", "S"), rtol=1e-6)
+        np.testing.assert_allclose(option.gamma(), bump("delta", "S"), rtol=1e-6)
+        np.testing.assert_allclose(option.vega(), bump("price", "sigma"), rtol=1e-6)
+        np.testing.assert_allclose(option.theta(), -bump("price", "T"), rtol=1e-6)
+        np.testing.assert_allclose(option.rho(), bump("price", "r"), rtol=1e-6)
 
     def test_get_core_greeks(self):
         core_greeks = self.call.get_core_greeks()
         expected_result = {
-            "delta": 0.3055162306516324,
-            "gamma": 0.0032595297589864043,
-            "vega": 81.65192052446703,
-            "theta": -1.1738764912159139,
-            "rho": 35.813015171916085,
+            "delta": 0.04083746356834601,
+            "gamma": -0.003598982722841523,
+            "vega": -1.6330384104893412,
+            "theta": 0.1186533803046488,
+            "rho": 1.5298001928207086,
         }
 
         assert set(core_greeks.keys()) == set(expected_result.keys())
@@ -0,0 +1,94 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from blackscholes import (
+    Black76Vectorized,
+    BlackScholesVectorized,
+    create_output_memmaps,
+    price_chunked,
+)
+from blackscholes.chunked import auto_chunk_size
+
+# Random dataset of options
+rng = np.random.default_rng(11)
+n_rows = 10_000
+data_S = rng.uniform(50.0, 150.0, n_rows)
+data_K = data_S * rng.uniform(0.8, 1.25, n_rows)
+data_T = rng.uniform(0.1, 3.0, n_rows)
+data_sigma = rng.uniform(0.1, 0.6, n_rows)
+data_is_call = rng.random(n_rows) < 0.5
+names = ["price", "delta", "gamma", "vega"]
+
+
+def memmap_inputs(directory, **columns) -> dict:
+    inputs = {}
+    for name, value in columns.items():
+        np.save(directory / f"{name}.npy", value)
+        inputs[name] = np.load(directory / f"{name}.npy", mmap_mode="r")
+    return inputs
+
+
+class TestPriceChunked:
+    def test_matches_vectorized(self, tmp_path):
+        inputs = memmap_inputs(tmp_path, S=data_S, K=data_K, T=data_T, sigma=data_sigma, is_call=data_is_call)
+        inputs.update(r=0.01, q=0.02)
+        outputs = create_output_memmaps(str(tmp_path), names, n_rows)
+        # Chunk size that does not divide the number of rows
+        stats = price_chunked(BlackScholesVectorized, inputs, outputs, chunk_size=3_000)
+        assert (stats.rows, stats.chunks) == (n_rows, 4)
+        assert stats.rows_per_second > 0.0
+        expected = BlackScholesVectorized(data_S, data_K, data_T, 0.01, data_sigma, 0.02, is_call=data_is_call).get_greeks(names)
+        for name in names:
+            # Processed pages were released, so this reads the values back from the files
+            np.testing.assert_array_equal(np.load(tmp_path / f"{name}.npy", mmap_mode="r"), expected[name])
+            np.testing.assert_array_equal(outputs[name], expected[name])
+
+    def test_black_76_in_memory(self):
+        outputs = {"price": np.empty(n_rows), "theta": np.empty(n_rows)}
+        price_chunked(Black76Vectorized, dict(F=data_S, K=data_K, T=data_T, r=0.01, sigma=data_sigma), outputs, chunk_size=4_096)
+        expected = Black76Vectorized(data_S, data_K, data_T, 0.01, data_sigma)
+        np.testing.assert_array_equal(outputs["price"], expected.price())
+        np.testing.assert_allclose(outputs["theta"], expected.theta(), rtol=1e-12)
+
+    def test_threads(self, tmp_path):
+        inputs = memmap_inputs(tmp_path, S=data_S, K=data_K, T=data_T, sigma=data_sigma, is_call=data_is_call)
+        inputs["r"] = 0.01
+        outputs = create_output_memmaps(str(tmp_path), names, n_rows)
+        stats = price_chunked(BlackScholesVectorized, inputs, outputs, chunk_size=1_000, threads=4)
+        assert stats.chunks == 10
+        expected = BlackScholesVectorized(data_S, data_K, data_T, 0.01, data_sigma, is_call=data_is_call).get_greeks(names)
+        for name in names:
+            np.testing.assert_array_equal(outputs[name], expected[name])
+
+    def test_float32(self, tmp_path):
+        inputs = dict(S=data_S, K=data_K, T=data_T, r=0.01, sigma=data_sigma)
+        outputs = create_output_memmaps(str(tmp_path), names, n_rows, dtype=np.float32)
+        price_chunked(partial(BlackScholesVectorized, dtype=np.float32), inputs, outputs, chunk_size=4_096)
+        expected = BlackScholesVectorized(dtype=np.float32, **inputs).get_greeks(names)
+        for name in names:
+            assert np.load(tmp_path / f"{name}.npy", mmap_mode="r").dtype == np.float32
+            np.testing.assert_array_equal(outputs[name], expected[name])
+
+    def test_auto_chunk_size(self):
+        chunk_size = auto_chunk_size()
+        assert chunk_size >= 8_192 and chunk_size & (chunk_size - 1) == 0
+        outputs = {"price": np.empty(n_rows)}
+        stats = price_chunked(BlackScholesVectorized, dict(S=data_S, K=data_K, T=data_T, r=0.01, sigma=data_sigma), outputs)
+        assert stats.chunks == -(-n_rows // chunk_size)
+
+    def test_invalid_nan(self):
+        K = data_K.copy()
+        K[5_000] = -1.0
+        outputs = {"price": np.empty(n_rows)}
+        with pytest.raises(ValueError):
+            price_chunked(BlackScholesVectorized, dict(S=data_S, K=K, T=data_T, r=0.01, sigma=data_sigma), outputs)
+        price_chunked(BlackScholesVectorized, dict(S=data_S, K=K, T=data_T, r=0.01, sigma=data_sigma), outputs, invalid="nan")
+        np.testing.assert_array_equal(np.flatnonzero(np.isnan(outputs["price"])), [5_000])
+
+    def test_arg_assert(self):
+        with pytest.raises(AssertionError):
+            price_chunked(BlackScholesVectorized, dict(S=data_S, K=data_K[:10], T=1.0, r=0.01, sigma=0.2), {"price": np.empty(n_rows)})
+        with pytest.raises(AssertionError):
+            price_chunked(BlackScholesVectorized, dict(S=data_S, K=data_K, T=1.0, r=0.01, sigma=0.2), {"price": np.empty(10)})
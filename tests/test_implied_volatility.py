@@ -0,0 +1,256 @@
+import numpy as np
+import pytest
+
+from blackscholes import (
+    BlackScholesCall,
+    BlackScholesCallVectorized,
+    BlackScholesPut,
+    BlackScholesVectorized,
+    ImpliedVolatilityStatus,
+    IncrementalImpliedVolatility,
+    implied_volatility,
+    implied_volatility_vectorized,
+)
+
+# Test parameters
+test_S = 55.0  # Asset price of 55
+test_K = 50.0  # Strike price of 50
+test_T = 1.0  # 1 year to maturity
+test_r = 0.0025  # 0.25% risk-free rate
+test_sigma = 0.15  # 15% vol
+
+# Random book of options with moderate moneyness
+rng = np.random.default_rng(7)
+n_options = 500
+book_S = rng.uniform(50.0, 150.0, n_options)
+book_K = book_S * np.exp(rng.uniform(-0.4, 0.4, n_options))
+book_T = rng.uniform(0.05, 3.0, n_options)
+book_r = rng.uniform(-0.01, 0.08, n_options)
+book_sigma = rng.uniform(0.1, 1.0, n_options)
+book_q = rng.uniform(0.0, 0.05, n_options)
+
+
+class TestImpliedVolatility:
+    def test_call(self):
+        price = BlackScholesCall(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma).price()
+        result = implied_volatility(price, S=test_S, K=test_K, T=test_T, r=test_r)
+        assert result.converged
+        assert result.status == ImpliedVolatilityStatus.CONVERGED
+        np.testing.assert_allclose(result.sigma, test_sigma, rtol=1e-12)
+        assert result.iterations <= 3
+
+    def test_put(self):
+        price = BlackScholesPut(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=0.02).price()
+        result = implied_volatility(price, S=test_S, K=test_K, T=test_T, r=test_r, q=0.02, is_call=False)
+        assert result.converged
+        np.testing.assert_allclose(result.sigma, test_sigma, rtol=1e-12)
+        assert result.iterations <= 3
+
+    @pytest.mark.parametrize("option_cls, is_call", [(BlackScholesCall, True), (BlackScholesPut, False)])
+    def test_round_trip(self, option_cls, is_call):
+        iterations = []
+        for S, K, T, r, sigma, q in zip(book_S, book_K, book_T, book_r, book_sigma, book_q):
+            price = option_cls(S=S, K=K, T=T, r=r, sigma=sigma, q=q).price()
+            result = implied_volatility(price, S=S, K=K, T=T, r=r, q=q, is_call=is_call)
+            if price == 0.0:
+                # Deep out-of-the-money prices that underflow carry no volatility information
+                assert result.status == ImpliedVolatilityStatus.BELOW_INTRINSIC
+                continue
+            if result.status == ImpliedVolatilityStatus.VEGA_TOO_SMALL:
+                # The time value is lost in the rounding of the price, so a 1% change in volatility does not show
+                np.testing.assert_allclose(option_cls(S=S, K=K, T=T, r=r, sigma=1.01 * sigma, q=q).price(), price, rtol=1e-15)
+                continue
+            assert result.converged
+            np.testing.assert_allclose(
+                option_cls(S=S, K=K, T=T, r=r, sigma=result.sigma, q=q).price(), price, rtol=1e-12, atol=1e-12 * S
+            )
+            iterations.append(result.iterations)
+        assert max(iterations) <= 4
+        assert np.mean(iterations) <= 3
+
+    def test_tiny_prices(self):
+        # Deep out-of-the-money options are solved on the log of the price
+        for K, sigma in [(150.0, 0.2), (100.0, 0.1), (70.0, 0.05)]:
+            # Reference prices from the vectorized engine, which is accurate far into the tails
+            price = float(BlackScholesCallVectorized(S=test_S, K=K, T=test_T, r=test_r, sigma=sigma).price())
+            assert price < 1e-6
+            result = implied_volatility(price, S=test_S, K=K, T=test_T, r=test_r)
+            assert result.converged
+            np.testing.assert_allclose(result.sigma, sigma, rtol=1e-10)
+
+    def test_wing_iterations(self):
+        # Wing quotes converge in as few iterations as at-the-money quotes
+        atm = implied_volatility(
+            BlackScholesCall(S=test_S, K=test_S, T=test_T, r=test_r, sigma=test_sigma).price(), S=test_S, K=test_S, T=test_T, r=test_r
+        )
+        for K, T, is_call in [(150.0, 1.0, True), (80.0, 0.01, True), (20.0, 1.0, False), (40.0, 0.01, False)]:
+            option_cls = BlackScholesCall if is_call else BlackScholesPut
+            price = option_cls(S=test_S, K=K, T=T, r=test_r, sigma=test_sigma).price()
+            result = implied_volatility(price, S=test_S, K=K, T=T, r=test_r, is_call=is_call)
+            assert result.converged
+            np.testing.assert_allclose(result.sigma, test_sigma, rtol=1e-10)
+            assert result.iterations <= atm.iterations + 1
+
+    def test_outside_bounds(self):
+        intrinsic = test_S - test_K * np.exp(-test_r * test_T)
+        result = implied_volatility(intrinsic - 0.01, S=test_S, K=test_K, T=test_T, r=test_r)
+        assert result.status == ImpliedVolatilityStatus.BELOW_INTRINSIC
+        assert not result.converged
+        assert np.isnan(result.sigma)
+        assert result.iterations == 0
+
+        result = implied_volatility(0.0, S=test_S, K=test_K, T=test_T, r=test_r, is_call=False)
+        assert result.status == ImpliedVolatilityStatus.BELOW_INTRINSIC
+
+        result = implied_volatility(test_S, S=test_S, K=test_K, T=test_T, r=test_r)
+        assert result.status == ImpliedVolatilityStatus.ABOVE_MAXIMUM
+        result = implied_volatility(test_K, S=test_S, K=test_K, T=test_T, r=test_r, is_call=False)
+        assert result.status == ImpliedVolatilityStatus.ABOVE_MAXIMUM
+        assert np.isnan(result.sigma)
+
+    def test_vega_too_small(self):
+        # Deep in the money the time value is far below the rounding of the price
+        price = BlackScholesCall(S=100.0, K=20.0, T=1.0, r=0.01, sigma=0.2).price()
+        result = implied_volatility(price, S=100.0, K=20.0, T=1.0, r=0.01)
+        assert result.status == ImpliedVolatilityStatus.VEGA_TOO_SMALL
+        assert not result.converged and np.isnan(result.sigma)
+        # Less deep in the money the volatility is still identified
+        price = BlackScholesCall(S=100.0, K=40.0, T=1.0, r=0.01, sigma=0.2).price()
+        np.testing.assert_allclose(implied_volatility(price, S=100.0, K=40.0, T=1.0, r=0.01).sigma, 0.2, rtol=1e-6)
+
+    def test_not_converged(self):
+        price = BlackScholesCall(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma).price()
+        result = implied_volatility(price, S=test_S, K=test_K, T=test_T, r=test_r, max_iterations=1)
+        assert result.status == ImpliedVolatilityStatus.NOT_CONVERGED
+        assert np.isnan(result.sigma)
+
+    def test_arg_assert(self):
+        with pytest.raises(AssertionError):
+            implied_volatility(1.0, S=0.0, K=test_K, T=test_T, r=test_r)
+        with pytest.raises(AssertionError):
+            implied_volatility(1.0, S=test_S, K=test_K, T=0.0, r=test_r)
+
+
+class TestImpliedVolatilityVectorized:
+    def test_matches_scalar(self):
+        is_call = np.arange(n_options) % 2 == 0
+        prices = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=is_call).price()
+        result = implied_volatility_vectorized(prices, book_S, book_K, book_T, book_r, book_q, is_call=is_call)
+        # Deep in-the-money quotes whose time value is lost in rounding do not identify the volatility
+        flat = result.status == ImpliedVolatilityStatus.VEGA_TOO_SMALL
+        assert (result.converged | flat).all() and flat.sum() < n_options // 100
+        assert result.iterations.max() <= 4
+        # Deep in-the-money quotes carry little volatility information, so compare prices
+        sigma = np.where(flat, 1.01 * book_sigma, result.sigma)
+        repriced = BlackScholesVectorized(book_S, book_K, book_T, book_r, sigma, book_q, is_call=is_call).price()
+        np.testing.assert_allclose(repriced / book_S, prices / book_S, rtol=1e-12, atol=1e-12)
+        for i in list(range(0, n_options, 25)) + list(np.flatnonzero(flat)):
+            expected = implied_volatility(prices[i], book_S[i], book_K[i], book_T[i], book_r[i], book_q[i], bool(is_call[i]))
+            np.testing.assert_allclose(result.sigma[i], expected.sigma, rtol=1e-12)
+            assert result.status[i] == expected.status
+            assert result.iterations[i] == expected.iterations
+
+    def test_converged_rows_stop(self):
+        # A near-the-money quote converges before a tiny out-of-the-money quote
+        prices = BlackScholesVectorized(test_S, [55.0, 200.0], test_T, test_r, 0.2).price()
+        result = implied_volatility_vectorized(prices, test_S, [55.0, 200.0], test_T, test_r)
+        assert result.converged.all()
+        assert result.iterations[0] < result.iterations[1]
+
+    def test_status(self):
+        prices = np.array([test_S, 0.01, 5.9, 6.339414])
+        result = implied_volatility_vectorized(prices, S=test_S, K=test_K, T=test_T, r=test_r)
+        np.testing.assert_array_equal(
+            result.status,
+            [
+                ImpliedVolatilityStatus.ABOVE_MAXIMUM,
+                ImpliedVolatilityStatus.BELOW_INTRINSIC,
+                ImpliedVolatilityStatus.CONVERGED,
+                ImpliedVolatilityStatus.CONVERGED,
+            ],
+        )
+        np.testing.assert_array_equal(result.converged, [False, False, True, True])
+        assert np.isnan(result.sigma[:2]).all()
+        np.testing.assert_array_equal(result.iterations[:2], 0)
+        np.testing.assert_allclose(result.sigma[3], test_sigma, rtol=1e-6)
+
+    def test_vega_too_small(self):
+        K = np.array([10.0, 20.0, 40.0])
+        prices = BlackScholesVectorized(100.0, K, 1.0, 0.01, 0.2).price()
+        result = implied_volatility_vectorized(prices, 100.0, K, 1.0, 0.01)
+        # The time value of the first quote is lost completely, which can also show as below intrinsic
+        assert result.status[0] in (ImpliedVolatilityStatus.VEGA_TOO_SMALL, ImpliedVolatilityStatus.BELOW_INTRINSIC)
+        assert result.status[1] == ImpliedVolatilityStatus.VEGA_TOO_SMALL
+        assert np.isnan(result.sigma[:2]).all()
+        np.testing.assert_allclose(result.sigma[2], 0.2, rtol=1e-6)
+
+    def test_not_converged(self):
+        result = implied_volatility_vectorized([6.339414], S=test_S, K=test_K, T=test_T, r=test_r, max_iterations=1)
+        assert result.status[0] == ImpliedVolatilityStatus.NOT_CONVERGED
+        assert np.isnan(result.sigma[0])
+
+    def test_broadcasting(self):
+        strikes = np.array([45.0, 50.0, 55.0])
+        vols = np.array([[0.1], [0.3]])
+        prices = BlackScholesVectorized(test_S, strikes, test_T, test_r, vols, is_call=False).price()
+        result = implied_volatility_vectorized(prices, test_S, strikes, test_T, test_r, is_call=False)
+        assert result.sigma.shape == (2, 3)
+        assert result.status.shape == (2, 3)
+        np.testing.assert_allclose(result.sigma, np.broadcast_to(vols, (2, 3)), rtol=1e-12)
+
+    def test_initial_sigma(self):
+        prices = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q).price()
+        cold = implied_volatility_vectorized(prices, book_S, book_K, book_T, book_r, book_q)
+        initial_sigma = book_sigma * 1.001
+        initial_sigma[::2] = np.nan
+        warm = implied_volatility_vectorized(prices, book_S, book_K, book_T, book_r, book_q, initial_sigma=initial_sigma)
+        np.testing.assert_array_equal(warm.status, cold.status)
+        np.testing.assert_allclose(warm.sigma, cold.sigma, rtol=1e-10)
+        np.testing.assert_array_equal(warm.iterations[::2], cold.iterations[::2])
+        assert warm.iterations[1::2].max() <= 2
+
+    def test_arg_assert(self):
+        with pytest.raises(AssertionError):
+            implied_volatility_vectorized([1.0, 2.0], S=[test_S, 0.0], K=test_K, T=test_T, r=test_r)
+
+
+class TestIncrementalImpliedVolatility:
+    def test_update(self):
+        chain = IncrementalImpliedVolatility(book_K, book_T, book_r, book_q, is_call=book_K > book_S)
+        prices = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=book_K > book_S).price()
+        result = chain.update(prices, book_S)
+        assert result.converged.all()
+        assert (result.iterations > 0).all()
+        np.testing.assert_array_equal(result.sigma, chain.sigma)
+
+        # Unchanged market data is not solved again
+        result = chain.update(prices, book_S)
+        assert (result.iterations == 0).all()
+        assert result.converged.all()
+
+        # Only the rows that moved are solved, starting from their previous volatility
+        moved = np.arange(n_options) % 10 == 0
+        new_sigma = np.where(moved, book_sigma * 1.01, book_sigma)
+        new_prices = BlackScholesVectorized(book_S, book_K, book_T, book_r, new_sigma, book_q, is_call=book_K > book_S).price()
+        result = chain.update(new_prices, book_S)
+        np.testing.assert_array_equal(result.iterations > 0, moved)
+        assert result.iterations.max() <= 2
+        expected = implied_volatility_vectorized(new_prices, book_S, book_K, book_T, book_r, book_q, is_call=book_K > book_S)
+        np.testing.assert_allclose(result.sigma, expected.sigma, rtol=1e-10)
+
+    def test_tolerance(self):
+        chain = IncrementalImpliedVolatility([test_K, test_K], test_T, test_r, price_tolerance=0.01, spot_tolerance=0.05)
+        prices = BlackScholesVectorized(test_S, test_K, test_T, test_r, [0.15, 0.2]).price()
+        chain.update(prices, test_S)
+        result = chain.update(prices + [0.005, 0.02], test_S)
+        np.testing.assert_array_equal(result.iterations > 0, [False, True])
+        result = chain.update(prices + [0.005, 0.02], test_S + 0.1)
+        assert (result.iterations > 0).all()
+
+    def test_time_change(self):
+        chain = IncrementalImpliedVolatility(test_K, [0.5, 1.0], test_r)
+        prices = BlackScholesVectorized(test_S, test_K, [0.5, 1.0], test_r, test_sigma).price()
+        chain.update(prices, test_S)
+        result = chain.update(prices, test_S, T=[0.5, 0.99])
+        np.testing.assert_array_equal(result.iterations > 0, [False, True])
+        np.testing.assert_array_equal(chain.T, [0.5, 0.99])
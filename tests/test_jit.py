@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from blackscholes import Black76Numba, Black76Vectorized, BlackScholesNumba, BlackScholesVectorized, price_chunked
+from blackscholes.jit import FUSED_GREEKS, _black_76_kernel, _black_scholes_kernel, _run_kernel
+
+# Random book of options
+rng = np.random.default_rng(17)
+n_options = 200
+book_S = rng.uniform(50.0, 150.0, n_options)
+book_K = book_S * rng.uniform(0.8, 1.25, n_options)
+book_T = rng.uniform(0.1, 3.0, n_options)
+book_r = rng.uniform(-0.01, 0.08, n_options)
+book_sigma = rng.uniform(0.1, 0.6, n_options)
+book_q = rng.uniform(0.0, 0.05, n_options)
+book_is_call = rng.random(n_options) < 0.5
+
+
+class TestKernels:
+    # Without numba the kernels run as plain Python, so their formulas are tested either way
+    def test_black_scholes(self):
+        inputs = np.broadcast_arrays(book_S, book_K, book_T, book_r, book_sigma, book_q, book_is_call)
+        greeks = _run_kernel(_black_scholes_kernel, tuple(inputs), FUSED_GREEKS)
+        expected = BlackScholesVectorized(*inputs[:6], is_call=book_is_call)
+        for name in FUSED_GREEKS:
+            np.testing.assert_allclose(greeks[name], getattr(expected, name)(), rtol=1e-12, atol=1e-12)
+        price = _run_kernel(_black_scholes_kernel, tuple(inputs), ("price",))["price"]
+        np.testing.assert_array_equal(price, greeks["price"])
+
+    def test_black_76(self):
+        inputs = np.broadcast_arrays(book_S, book_K, book_T, book_r, book_sigma, book_is_call)
+        greeks = _run_kernel(_black_76_kernel, tuple(inputs), FUSED_GREEKS)
+        expected = Black76Vectorized(*inputs[:5], is_call=book_is_call)
+        for name in FUSED_GREEKS:
+            np.testing.assert_allclose(greeks[name], getattr(expected, name)(), rtol=1e-12, atol=1e-12)
+
+
+    def test_far_out_of_the_money(self):
+        # Tiny prices where the two terms of the formula cancel take the same Mills ratio path as the NumPy engine
+        K = np.concatenate([100.0 * np.exp(np.linspace(0.5, 3.0, 50)), 100.0 * np.exp(-np.linspace(0.5, 3.0, 50))])
+        is_call = K > 100.0
+        inputs = np.broadcast_arrays(100.0, K, 0.5, 0.03, 0.15, 0.01, is_call)
+        price = _run_kernel(_black_scholes_kernel, tuple(inputs), ("price",))["price"]
+        expected = BlackScholesVectorized(*inputs[:6], is_call=is_call).price()
+        assert (expected > 0.0).all() and expected.min() < 1e-100
+        np.testing.assert_allclose(price, expected, rtol=1e-12)
+
+        inputs = np.broadcast_arrays(100.0, K, 0.5, 0.03, 0.15, is_call)
+        greeks = _run_kernel(_black_76_kernel, tuple(inputs), FUSED_GREEKS)
+        expected = Black76Vectorized(*inputs[:5], is_call=is_call)
+        for name in ("price", "theta", "rho"):
+            np.testing.assert_allclose(greeks[name], getattr(expected, name)(), rtol=1e-12)
+
+
+class TestNumbaEngines:
+    def test_matches_numpy(self):
+        options = BlackScholesNumba(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=book_is_call)
+        expected = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=book_is_call)
+        np.testing.assert_allclose(options.price(), expected.price(), rtol=1e-12)
+        for name, value in options.get_core_greeks().items():
+            np.testing.assert_allclose(value, getattr(expected, name)(), rtol=1e-12, atol=1e-12)
+        # Greeks outside the fused kernel come from the NumPy engine
+        greeks = options.get_greeks(["price", "vanna"])
+        np.testing.assert_allclose(greeks["vanna"], expected.vanna(), rtol=1e-12)
+
+        futures = Black76Numba(book_S, book_K, book_T, book_r, book_sigma, is_call=book_is_call)
+        expected = Black76Vectorized(book_S, book_K, book_T, book_r, book_sigma, is_call=book_is_call)
+        for name, value in futures.get_greeks(["price", "theta", "rho"]).items():
+            np.testing.assert_allclose(value, getattr(expected, name)(), rtol=1e-12, atol=1e-12)
+
+    def test_broadcasting_and_invalid(self):
+        strikes = np.array([40.0, 50.0, -60.0])
+        vols = np.array([[0.1], [0.2]])
+        options = BlackScholesNumba(S=55.0, K=strikes, T=1.0, r=0.0025, sigma=vols, invalid="nan")
+        price = options.price()
+        assert price.shape == (2, 3)
+        assert np.isnan(price[:, 2]).all()
+        np.testing.assert_allclose(price[:, :2], BlackScholesVectorized(55.0, strikes[:2], 1.0, 0.0025, vols).price(), rtol=1e-12)
+        with pytest.raises(ValueError):
+            BlackScholesNumba(S=55.0, K=strikes, T=1.0, r=0.0025, sigma=vols)
+        # The kernels have no fast, less accurate normal CDF
+        with pytest.raises(ValueError):
+            BlackScholesNumba(S=55.0, K=50.0, T=1.0, r=0.0025, sigma=0.2, accuracy="fast")
+        with pytest.raises(ValueError):
+            Black76Numba(F=55.0, K=50.0, T=1.0, r=0.0025, sigma=0.2, accuracy="fast")
+
+    def test_float32(self):
+        options = BlackScholesNumba(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=book_is_call, dtype=np.float32)
+        expected = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=book_is_call)
+        for name, value in options.get_greeks(["price", "delta"]).items():
+            assert value.dtype == np.float32
+            assert np.all(np.abs(value - getattr(expected, name)()) <= 1e-6 * book_S)
+
+    def test_price_chunked(self):
+        outputs = {"price": np.empty(n_options), "vega": np.empty(n_options)}
+        price_chunked(BlackScholesNumba, dict(S=book_S, K=book_K, T=book_T, r=0.01, sigma=book_sigma), outputs, chunk_size=64)
+        np.testing.assert_allclose(outputs["vega"], BlackScholesVectorized(book_S, book_K, book_T, 0.01, book_sigma).vega(), rtol=1e-12)
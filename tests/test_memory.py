@@ -0,0 +1,111 @@
+import gc
+import pickle
+import sys
+import tracemalloc
+
+import pytest
+
+from blackscholes import (
+    BinaryCall,
+    Black76Put,
+    BlackScholesCall,
+    BlackScholesIronCondorLong,
+    BlackScholesPut,
+    BlackScholesStructure,
+    BlackScholesStraddleLong,
+)
+
+# Test parameters
+test_S = 55.0  # Asset price of 55
+test_K = 50.0  # Strike price of 50
+test_T = 1.0  # 1 year to maturity
+test_r = 0.0025  # 0.25% risk-free rate
+test_sigma = 0.15  # 15% vol
+
+
+def bytes_per_object(make_object, n: int = 5_000) -> float:
+    """Memory allocated per object, including its own (unique) asset price."""
+    # Python sizes new instances after the intermediates that earlier instances cached,
+    # so measure the steady state of a process that has priced options before
+    make_object(test_S).get_core_greeks()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = [make_object(test_S + i * 1e-3) for i in range(n)]
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == n
+    return allocated / n
+
+
+class _Plain:
+    """Object that keeps all its attributes in its __dict__, like the options before they had slots."""
+
+
+def dict_layout_bytes(names, unique_floats: int) -> int:
+    """
+    Size of an object that keeps the attributes `names` in its __dict__, on this Python version,
+    with `unique_floats` of its attribute values allocated per object.
+    """
+    return sys.getsizeof(_Plain()) + sys.getsizeof(dict.fromkeys(names, 0.0)) + unique_floats * sys.getsizeof(0.0)
+
+
+option_inputs = ("S", "K", "T", "r", "sigma", "q")
+
+
+class TestMemory:
+    @pytest.mark.parametrize(
+        "make_option",
+        [
+            lambda S: BlackScholesCall(S, test_K, test_T, test_r, test_sigma),
+            lambda S: BlackScholesPut(S, test_K, test_T, test_r, test_sigma),
+            lambda S: Black76Put(S, test_K, test_T, test_r, test_sigma),
+            lambda S: BinaryCall(S, test_K, test_T, test_r, test_sigma),
+        ],
+    )
+    def test_option_memory(self, make_option):
+        # Inputs live in slots, and the __dict__ stays empty until an intermediate is cached
+        option = make_option(test_S)
+        assert vars(option) == {}
+        # Well below an object with its inputs in a __dict__
+        assert bytes_per_object(make_option) < 0.75 * dict_layout_bytes(option_inputs, unique_floats=1)
+
+    def test_priced_option_memory(self):
+        def priced_call(S):
+            call = BlackScholesCall(S, test_K, test_T, test_r, test_sigma)
+            call.price()
+            return call
+
+        # Only the cached intermediates are in the __dict__
+        cached = set(vars(priced_call(test_S)))
+        assert cached and not cached & set(option_inputs)
+        assert bytes_per_object(priced_call) < dict_layout_bytes(option_inputs + tuple(cached), unique_floats=1 + len(cached))
+
+    def test_structure_memory(self):
+        def iron_condor(S):
+            return BlackScholesIronCondorLong(S, 20.0, 25.0, 45.0, 50.0, test_T, test_r, test_sigma)
+
+        # Below 4 of its legs held by a structure that keeps its attributes in a __dict__.
+        # Legs are measured on their own, without the asset price and intermediates they share.
+        leg = bytes_per_object(lambda S: iron_condor(S).call1, n=1_000)
+        lists = 2 * sys.getsizeof([0.0] * 4) + 4 * sys.getsizeof(0.0)
+        reference = 4 * leg + dict_layout_bytes(BlackScholesStructure.__slots__, unique_floats=0) + lists
+        assert bytes_per_object(iron_condor, n=1_000) < reference
+
+    def test_slots(self):
+        call = BlackScholesCall(test_S, test_K, test_T, test_r, test_sigma)
+        straddle = BlackScholesStraddleLong(test_S, test_K, test_T, test_r, test_sigma)
+        assert not hasattr(straddle, "__dict__")
+        with pytest.raises(AttributeError):
+            straddle.spot = test_S
+        # Cached intermediates still work and are discarded when an input changes
+        price = call.price()
+        call.S = 60.0
+        assert call.price() == BlackScholesCall(60.0, test_K, test_T, test_r, test_sigma).price() != price
+
+    def test_pickle(self):
+        call = BlackScholesCall(test_S, test_K, test_T, test_r, test_sigma)
+        assert pickle.loads(pickle.dumps(call)).price() == call.price()
+        iron_condor = BlackScholesIronCondorLong(test_S, 20.0, 25.0, 45.0, 50.0, test_T, test_r, test_sigma)
+        assert pickle.loads(pickle.dumps(iron_condor)).get_all_greeks() == iron_condor.get_all_greeks()
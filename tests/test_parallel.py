@@ -0,0 +1,104 @@
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+import pytest
+
+from blackscholes import (
+    Black76Vectorized,
+    BlackScholesCall,
+    BlackScholesVectorized,
+    ParallelPricer,
+    price_parallel,
+)
+
+# Random book of options
+rng = np.random.default_rng(13)
+n_options = 10_001
+book_S = rng.uniform(50.0, 150.0, n_options)
+book_K = book_S * rng.uniform(0.8, 1.25, n_options)
+book_T = rng.uniform(0.1, 3.0, n_options)
+book_sigma = rng.uniform(0.1, 0.6, n_options)
+book_is_call = rng.random(n_options) < 0.5
+names = ["price", "delta", "gamma", "vega"]
+
+
+@pytest.fixture(scope="module")
+def pricer():
+    with ParallelPricer(workers=3, chunk_size=1_000) as pricer:
+        yield pricer
+
+
+class TestParallelPricer:
+    def test_matches_vectorized(self, pricer):
+        inputs = dict(S=book_S, K=book_K, T=book_T, r=0.01, sigma=book_sigma, q=0.02, is_call=book_is_call)
+        greeks = pricer.price(BlackScholesVectorized, inputs, names)
+        expected = BlackScholesVectorized(**inputs).get_greeks(names)
+        for name in names:
+            np.testing.assert_array_equal(greeks[name], expected[name])
+        greeks = pricer.price(Black76Vectorized, dict(F=book_S, K=book_K, T=book_T, r=0.01, sigma=book_sigma), ["theta"])
+        np.testing.assert_allclose(greeks["theta"], Black76Vectorized(book_S, book_K, book_T, 0.01, book_sigma).theta(), rtol=1e-12)
+
+    def test_scalars(self, pricer):
+        price = pricer.price(BlackScholesVectorized, dict(S=55.0, K=50.0, T=1.0, r=0.0025, sigma=0.15))["price"]
+        np.testing.assert_array_equal(price, BlackScholesVectorized(55.0, 50.0, 1.0, 0.0025, 0.15).price().reshape(1))
+
+    def test_invalid(self, pricer):
+        K = book_K.copy()
+        K[7_000] = 0.0
+        inputs = dict(S=book_S, K=K, T=book_T, r=0.01, sigma=book_sigma)
+        with pytest.raises(ValueError):
+            pricer.price(BlackScholesVectorized, inputs)
+        price = pricer.price(BlackScholesVectorized, inputs, invalid="nan")["price"]
+        np.testing.assert_array_equal(np.flatnonzero(np.isnan(price)), [7_000])
+        # The pool is still usable after a failed call
+        assert pricer.price(BlackScholesVectorized, dict(inputs, K=book_K))["price"].shape == (n_options,)
+
+    def test_float32(self, pricer):
+        inputs = dict(S=book_S, K=book_K, T=book_T, r=0.01, sigma=book_sigma, is_call=book_is_call)
+        engine = partial(BlackScholesVectorized, dtype=np.float32)
+        expected = BlackScholesVectorized(dtype=np.float32, **inputs).get_greeks(names)
+        for greeks in (pricer.price(engine, inputs, names), price_parallel(engine, inputs, names, workers=2, backend="thread")):
+            for name in names:
+                assert greeks[name].dtype == np.float32
+                np.testing.assert_array_equal(greeks[name], expected[name])
+
+    def test_price_parallel(self):
+        price = price_parallel(BlackScholesVectorized, dict(S=book_S, K=book_K, T=1.0, r=0.01, sigma=0.2), workers=2)["price"]
+        np.testing.assert_array_equal(price, BlackScholesVectorized(book_S, book_K, 1.0, 0.01, 0.2).price())
+
+    def test_spawn(self):
+        with ParallelPricer(workers=2, mp_context=multiprocessing.get_context("spawn")) as pricer:
+            delta = pricer.price(BlackScholesVectorized, dict(S=book_S, K=book_K, T=1.0, r=0.01, sigma=0.2), ["delta"])["delta"]
+        np.testing.assert_array_equal(delta, BlackScholesVectorized(book_S, book_K, 1.0, 0.01, 0.2).delta())
+
+    def test_thread_backend(self):
+        inputs = dict(S=book_S, K=book_K, T=book_T, r=0.01, sigma=book_sigma, is_call=book_is_call)
+        with ParallelPricer(workers=4, chunk_size=1_000, backend="thread") as pricer:
+            greeks = pricer.price(BlackScholesVectorized, inputs, names)
+            expected = BlackScholesVectorized(**inputs).get_greeks(names)
+            for name in names:
+                np.testing.assert_array_equal(greeks[name], expected[name])
+            K = book_K.copy()
+            K[3] = -1.0
+            with pytest.raises(ValueError):
+                pricer.price(BlackScholesVectorized, dict(inputs, K=K))
+        price = price_parallel(Black76Vectorized, dict(F=55.0, K=50.0, T=1.0, r=0.01, sigma=0.2), backend="thread")["price"]
+        np.testing.assert_array_equal(price, Black76Vectorized(55.0, 50.0, 1.0, 0.01, 0.2).price().reshape(1))
+
+    def test_scalar_options_in_threads(self):
+        # Option objects keep their cached intermediates per instance, so threads can share them
+        options = [BlackScholesCall(S, K, T, 0.01, sigma) for S, K, T, sigma in zip(book_S[:400], book_K, book_T, book_sigma)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            greeks = list(executor.map(lambda option: option.get_core_greeks(), options * 4))
+        expected = [BlackScholesCall(o.S, o.K, o.T, o.r, o.sigma).get_core_greeks() for o in options]
+        assert greeks == expected * 4
+
+    def test_arg_assert(self, pricer):
+        with pytest.raises(AssertionError):
+            pricer.price(BlackScholesVectorized, dict(S=book_S, K=book_K[:10], T=1.0, r=0.01, sigma=0.2))
+        with pytest.raises(AssertionError):
+            ParallelPricer(workers=0)
+        with pytest.raises(AssertionError):
+            ParallelPricer(backend="gpu")
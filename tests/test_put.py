@@ -1,5 +1,7 @@
 import numpy as np
+from scipy.stats import norm
 
+from blackscholes.base import BlackScholesGreeks
 from blackscholes import Black76Call, Black76Put, BlackScholesCall, BlackScholesPut, BinaryPut, BinaryCall
 
 # Test parameters
@@ -17,6 +19,18 @@ class TestBlackScholesPut:
         put_price = self.put.price()
         np.testing.assert_almost_equal(put_price, 1.214564, decimal=4)
 
+    def test_price_far_out_of_the_money(self):
+        # Reference prices evaluated with 50 digit arithmetic. With T = 0.0001 the price itself
+        # is sensitive enough to its inputs that rounding in d1 and d2 costs about 1e-12.
+        for K, T, sigma, q, expected in [
+            (20.0, 1.0, 0.15, 0.0, 4.8342776212146423e-12),
+            (40.0, 0.01, 0.15, 0.0, 7.9914384185568425e-102),
+            (54.5, 0.0001, 0.1, 0.01, 1.9750244142524173e-22),
+            (5.0, 1.0, 0.2, 0.01, 8.5809742458916825e-34),
+        ]:
+            price = BlackScholesPut(S=test_S, K=K, T=T, r=test_r, sigma=sigma, q=q).price()
+            np.testing.assert_allclose(price, expected, rtol=1e-11)
+
     def test_delta(self):
         put_delta = self.put.delta()
         np.testing.assert_almost_equal(put_delta, -0.233592191490538, decimal=6)
@@ -110,6 +124,15 @@ class TestBlackScholesPut:
         assert 0.0 < itm_prob < 1.0
         np.testing.assert_almost_equal(itm_prob, 0.2819468056232066, decimal=6)
 
+    def test_all_greeks_fused(self):
+        # The single-pass kernel should agree with the individual Greek methods
+        for q in [0.0, 0.03]:
+            put = BlackScholesPut(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=q)
+            greeks = put.all_greeks()
+            assert isinstance(greeks, BlackScholesGreeks)
+            for name, value in greeks._asdict().items():
+                np.testing.assert_allclose(value, getattr(put, name)(), rtol=1e-12)
+
     def test_all_greeks(self):
         all_greeks = self.put.get_all_greeks()
         expected_result = {
@@ -148,6 +171,11 @@ class TestBlack76Put:
         price = self.put.price()
         np.testing.assert_almost_equal(price, 1.2470010007171901, decimal=6)
 
+    def test_price_far_out_of_the_money(self):
+        for K, T, expected in [(20.0, 1.0, 5.4285616951288668e-12), (40.0, 0.01, 8.2804671113196635e-102)]:
+            price = Black76Put(F=test_S, K=K, T=T, r=test_r, sigma=test_sigma).price()
+            np.testing.assert_allclose(price, expected, rtol=1e-12)
+
     def test_delta(self):
         delta = self.put.delta()
         np.testing.assert_almost_equal(delta, -0.23813161620464113, decimal=5)
@@ -196,6 +224,12 @@ class TestBlack76Put:
             "vanna": -1.1551661594303946,
             "vomma": 45.13472833935059,
             "alpha": 33.94806810170172,
+            "charm": 0.08604213291676799,
+            "veta": 11.84553461141271,
+            "speed": -0.0039086768888237445,
+            "zomma": -0.15038648548195166,
+            "color": -0.011372682771581731,
+            "ultima": -799.9099735048536,
         }
 
         assert set(all_greeks.keys()) == set(expected_result.keys())
@@ -204,6 +238,12 @@ class TestBlack76Put:
                 all_greeks[key], expected_result[key], decimal=5
             )
 
+    def test_all_greeks_fused(self):
+        greeks = self.put.all_greeks()
+        for name, value in greeks._asdict().items():
+            np.testing.assert_allclose(value, getattr(self.put, name)(), rtol=1e-12)
+
+
 class TestBinaryPut:
     put = BinaryPut(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
     call = BinaryCall(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
@@ -212,42 +252,67 @@ class TestBinaryPut:
         price = self.put.price()
         np.testing.assert_almost_equal(price, 0.2812428189591384, decimal=6)
 
+    def test_price_far_out_of_the_money(self):
+        # 1 - CDF(d2) would cancel to 0
+        put = BinaryPut(S=test_S, K=20.0, T=test_T, r=test_r, sigma=test_sigma)
+        expected = np.exp(-test_r * test_T) * norm.cdf(-put._d2)
+        assert expected < 1e-10
+        np.testing.assert_allclose(put.price(), expected, rtol=1e-14)
+        np.testing.assert_allclose(put.forward(), norm.cdf(-put._d2), rtol=1e-14)
+
     def test_forward(self):
         forward = self.put.forward()
         np.testing.assert_almost_equal(forward, 0.2819468056232066, decimal=6)
 
     def test_delta(self):
         delta = self.put.delta()
-        np.testing.assert_almost_equal(delta, -0.3055162306516324, decimal=6)
+        np.testing.assert_almost_equal(delta, -0.04083746356834601, decimal=6)
 
     def test_gamma(self):
         gamma = self.put.gamma()
         call_gamma = self.call.gamma()
-        np.testing.assert_almost_equal(gamma, call_gamma, decimal=16)
-        np.testing.assert_almost_equal(gamma, 0.0032595297589864043, decimal=6)
+        np.testing.assert_almost_equal(gamma, -call_gamma, decimal=16)
+        np.testing.assert_almost_equal(gamma, 0.003598982722841523, decimal=6)
 
     def test_vega(self):
         vega = self.put.vega()
         call_vega = self.call.vega()
         np.testing.assert_almost_equal(vega, -call_vega, decimal=16)
-        np.testing.assert_almost_equal(vega, -81.65192052446703, decimal=6)
+        np.testing.assert_almost_equal(vega, 1.6330384104893412, decimal=6)
 
     def test_theta(self):
         theta = self.put.theta()
-        np.testing.assert_almost_equal(theta, -1.2985643815155963, decimal=6)
+        np.testing.assert_almost_equal(theta, -0.11615962249865515, decimal=6)
 
     def test_rho(self):
         rho = self.put.rho()
-        np.testing.assert_almost_equal(rho, -14.062140947956921, decimal=6)
+        np.testing.assert_almost_equal(rho, -2.5273033152181688, decimal=6)
+
+    def test_finite_differences(self):
+        # Greeks with a dividend yield against central finite differences of the price and delta
+        h = 1e-4
+        params = dict(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=0.03)
+        option = BinaryPut(**params)
+
+        def bump(greek: str, name: str) -> float:
+            up = BinaryPut(**{**params, name: params[name] + h})
+            down = BinaryPut(**{**params, name: params[name] - h})
+            return (getattr(up, greek)() - getattr(down, greek)()) / (2 * h)
+
+        np.testing.assert_allclose(option.delta(), bump("price", "S"), rtol=1e-6)
+        np.testing.assert_allclose(option.gamma(), bump("delta", "S"), rtol=1e-6)
+        np.testing.assert_allclose(option.vega(), bump("price", "sigma"), rtol=1e-6)
+        np.testing.assert_allclose(option.theta(), -bump("price", "T"), rtol=1e-6)
+        np.testing.assert_allclose(option.rho(), bump("price", "r"), rtol=1e-6)
 
     def test_get_core_greeks(self):
         core_greeks = self.put.get_core_greeks()
         expected_result = {
-            "delta": -0.3055162306516324,
-            "gamma": 0.0032595297589864043,
-            "vega": -81.65192052446703,
-            "theta": -1.2985643815155963,
-            "rho": -14.062140947956921,
+            "delta": -0.04083746356834601,
+            "gamma": 0.003598982722841523,
+            "vega": 1.6330384104893412,
+            "theta": -0.11615962249865515,
+            "rho": -2.5273033152181688,
         }
 
         assert set(core_greeks.keys()) == set(expected_result.keys())
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from blackscholes import (
+    BlackScholesCall,
+    BlackScholesIronCondorLong,
+    BlackScholesStraddleLong,
+    BlackScholesStructure,
+    MIN_SHOCKED_SIGMA,
+    InstrumentType,
+    OptionBook,
+    ScenarioGrid,
+)
+
+# Random book with every instrument type
+rng = np.random.default_rng(11)
+n_positions = 120
+book_kind = rng.integers(0, len(InstrumentType), n_positions)
+book_S = rng.uniform(50.0, 150.0, n_positions)
+book_K = book_S * rng.uniform(0.8, 1.25, n_positions)
+book_T = rng.uniform(0.1, 3.0, n_positions)
+book_r = rng.uniform(-0.01, 0.08, n_positions)
+book_sigma = rng.uniform(0.1, 0.6, n_positions)
+book_q = rng.uniform(0.0, 0.05, n_positions)
+book_quantity = rng.integers(-10, 11, n_positions).astype(float)
+
+
+def make_book() -> OptionBook:
+    return OptionBook(book_kind, book_S, book_K, book_T, book_r, book_sigma, book_q, book_quantity)
+
+
+def make_grid() -> ScenarioGrid:
+    return ScenarioGrid(np.linspace(-0.1, 0.1, 5), [-0.05, 0.0, 0.05], [0.0, 1 / 365, 7 / 365])
+
+
+class TestScenarioGrid:
+    def test_matches_book(self):
+        book = make_book()
+        grid = make_grid()
+        values = grid.values(book)
+        assert values.shape == (n_positions, 45) and len(grid) == 45 and grid.shape == (5, 3, 3)
+        # Reprice the book once per scenario
+        scenarios = grid.scenarios()
+        for j, (spot, vol, time) in enumerate(zip(scenarios["spot"], scenarios["vol"], scenarios["time"])):
+            shocked = OptionBook(book_kind, book_S * (1.0 + spot), book_K, book_T - time, book_r, book_sigma + vol, book_q)
+            np.testing.assert_allclose(values[:, j], shocked.price(), rtol=1e-12, atol=1e-12)
+        # Spot changes slowest and time fastest
+        cube = values.reshape(n_positions, *grid.shape)
+        np.testing.assert_array_equal(cube[:, 4, 0, 2], values[:, 4 * 9 + 2])
+
+    def test_pnl(self):
+        book = make_book()
+        grid = make_grid()
+        pnl = grid.pnl(book)
+        np.testing.assert_allclose(pnl, book_quantity[:, None] * (grid.values(book) - book.price()[:, None]), atol=1e-10)
+        # The unshocked scenario has no P&L
+        np.testing.assert_array_equal(pnl[:, 2 * 9 + 3], 0.0)
+        option = BlackScholesCall(S=55.0, K=50.0, T=1.0, r=0.0025, sigma=0.15)
+        single = OptionBook(InstrumentType.BLACK_SCHOLES_CALL, 55.0, 50.0, 1.0, 0.0025, 0.15, quantity=-2.0)
+        expected = -2.0 * (BlackScholesCall(S=49.5, K=50.0, T=1.0 - 1 / 365, r=0.0025, sigma=0.2).price() - option.price())
+        np.testing.assert_allclose(make_grid().pnl(single)[0, 0 * 9 + 2 * 3 + 1], expected, rtol=1e-12)
+
+    def test_expiry(self):
+        book = OptionBook(
+            [InstrumentType.BLACK_SCHOLES_CALL, InstrumentType.BLACK_76_PUT, InstrumentType.BINARY_CALL],
+            100.0, [90.0, 110.0, 90.0], 1 / 365, 0.01, 0.2,
+        )
+        values = ScenarioGrid([-0.2, 0.2], time_steps=[1 / 365, 2 / 365]).values(book)
+        # Positions that expire within a time step are valued at their payoff
+        np.testing.assert_array_equal(values, [[0.0, 0.0, 30.0, 30.0], [30.0, 30.0, 0.0, 0.0], [0.0, 0.0, 1.0, 1.0]])
+
+    def test_fast_accuracy(self):
+        book = make_book()
+        grid = make_grid()
+        fast = ScenarioGrid(grid.spot_shocks, grid.vol_shocks, grid.time_steps, accuracy="fast")
+        # Spot shocks reach +10%
+        bound = (1.1 * book_S + book_K)[:, None] * 7.5e-8
+        assert np.all(np.abs(fast.values(book) - grid.values(book)) <= bound)
+
+    def test_structures(self):
+        grid = make_grid()
+        legs = 20
+        structures = [
+            BlackScholesStraddleLong(S=50.0, K=50.0, T=0.5, r=0.01, sigma=0.2),
+            BlackScholesIronCondorLong(S=50.0, K1=20.0, K2=25.0, K3=45.0, K4=50.0, T=1.0, r=0.01, sigma=0.2),
+            BlackScholesStructure(
+                S=50.0, quantity=np.ones(legs), K=np.linspace(30.0, 70.0, legs), T=1.0, r=0.01, sigma=0.2,
+                is_call=np.arange(legs) % 2 == 0,
+            ),
+        ]
+        pnl = grid.structure_pnl(structures)
+        assert pnl.shape == (3, len(grid))
+        scenarios = grid.scenarios()
+        for structure, T, row in zip(structures, [0.5, 1.0, 1.0], pnl):
+            current = structure.price()
+            for j in range(0, len(grid), 7):
+                structure.update(S=50.0 * (1.0 + scenarios["spot"][j]), sigma=0.2 + scenarios["vol"][j], T=T - scenarios["time"][j])
+                np.testing.assert_allclose(row[j], structure.price() - current, rtol=1e-10, atol=1e-12)
+        np.testing.assert_array_equal(structures[0].to_book()["quantity"], [1.0, 1.0])
+        assert grid.structure_pnl([]).shape == (0, len(grid))
+
+    def test_invalid_nan(self):
+        S = book_S.copy()
+        S[10] = np.nan
+        book = OptionBook(book_kind, S, book_K, book_T, book_r, book_sigma, book_q, book_quantity, invalid="nan")
+        values = make_grid().values(book)
+        assert np.isnan(values[10]).all()
+        np.testing.assert_array_equal(np.delete(values, 10, axis=0), np.delete(make_grid().values(make_book()), 10, axis=0))
+
+    def test_vol_floor(self):
+        # A volatility shock larger than the volatility of a position floors it, without failing the other positions
+        book = make_book()
+        values = ScenarioGrid(vol_shocks=[-0.5, 0.0]).values(book)
+        assert np.isfinite(values).all()
+        floored = OptionBook(book_kind, book_S, book_K, book_T, book_r, np.maximum(book_sigma - 0.5, MIN_SHOCKED_SIGMA), book_q)
+        np.testing.assert_allclose(values[:, 0], floored.price(), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(values[:, 1], book.price(), rtol=1e-12, atol=1e-12)
+
+    def test_arg_assert(self):
+        with pytest.raises(ValueError):
+            ScenarioGrid([-1.0])
+        with pytest.raises(ValueError):
+            ScenarioGrid(time_steps=[-1 / 365])
+        with pytest.raises(ValueError):
+            ScenarioGrid(accuracy="exact")
+        with pytest.raises(ValueError):
+            ScenarioGrid(vol_shocks=[[0.01]])
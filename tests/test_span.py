@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+
+from blackscholes import (
+    MIN_SHOCKED_SIGMA,
+    SPAN_SCENARIOS,
+    Black76Put,
+    BlackScholesCall,
+    InstrumentType,
+    OptionBook,
+    SpanMargin,
+    span_risk_arrays,
+)
+
+# Random book of Black-Scholes and Black-76 options on 5 underlyings
+rng = np.random.default_rng(5)
+n_positions = 200
+book_kind = rng.integers(0, 4, n_positions)
+book_S = rng.uniform(50.0, 150.0, n_positions)
+book_K = book_S * rng.uniform(0.8, 1.25, n_positions)
+book_T = rng.uniform(0.05, 2.0, n_positions)
+book_sigma = rng.uniform(0.1, 0.6, n_positions)
+book_quantity = rng.integers(-10, 11, n_positions).astype(float)
+book_underlying = rng.choice(["ES", "NQ", "CL", "GC", "ZN"], n_positions)
+price_scan = {"ES": 0.06, "NQ": 0.08, "CL": 0.12, "GC": 0.05, "ZN": 0.02}
+vol_scan = {"ES": 0.04, "NQ": 0.05, "CL": 0.08, "GC": 0.03, "ZN": 0.01}
+
+
+def make_book() -> OptionBook:
+    return OptionBook(book_kind, book_S, book_K, book_T, 0.01, book_sigma, 0.02, book_quantity)
+
+
+class TestSpanRiskArrays:
+    def test_matches_scalar(self):
+        book = OptionBook(
+            [InstrumentType.BLACK_SCHOLES_CALL, InstrumentType.BLACK_76_PUT], 100.0, [105.0, 95.0], 0.5, 0.01, 0.2,
+            q=0.02, quantity=[-3.0, 2.0],
+        )
+        risk_arrays = span_risk_arrays(book, price_scan=0.06, vol_scan=0.04, time_step=1 / 365)
+        assert risk_arrays.shape == (2, 16) and len(SPAN_SCENARIOS) == 16
+        call = BlackScholesCall(S=100.0, K=105.0, T=0.5, r=0.01, sigma=0.2, q=0.02)
+        put = Black76Put(F=100.0, K=95.0, T=0.5, r=0.01, sigma=0.2)
+        for j, (price_move, vol_move) in enumerate(SPAN_SCENARIOS):
+            # Only 35% of the loss of the extreme moves counts
+            cover = 0.35 if abs(price_move) == 3.0 else 1.0
+            S, sigma, T = 100.0 * (1.0 + 0.06 * price_move), 0.2 + 0.04 * vol_move, 0.5 - 1 / 365
+            expected_call = 3.0 * cover * (BlackScholesCall(S=S, K=105.0, T=T, r=0.01, sigma=sigma, q=0.02).price() - call.price())
+            expected_put = -2.0 * cover * (Black76Put(F=S, K=95.0, T=T, r=0.01, sigma=sigma).price() - put.price())
+            np.testing.assert_allclose(risk_arrays[:, j], [expected_call, expected_put], rtol=1e-12, atol=1e-12)
+
+    def test_scenarios(self):
+        np.testing.assert_allclose(SPAN_SCENARIOS[2], (1 / 3, 1.0))
+        assert SPAN_SCENARIOS[13] == (-1.0, -1.0) and SPAN_SCENARIOS[14] == (3.0, 0.0) and SPAN_SCENARIOS[15] == (-3.0, 0.0)
+        # Long options only lose when the volatility falls, if the price does not move
+        risk_arrays = span_risk_arrays(OptionBook(InstrumentType.BLACK_SCHOLES_CALL, 100.0, 100.0, 0.5, 0.01, 0.2), 0.06, 0.04)
+        assert risk_arrays[0, 0] < 0.0 < risk_arrays[0, 1]
+
+    def test_per_position_scans(self):
+        book = make_book()
+        scans = np.array([price_scan[name] for name in book_underlying])
+        vols = np.array([vol_scan[name] for name in book_underlying])
+        risk_arrays = span_risk_arrays(book, scans, vols, extreme_cover=0.3)
+        for name in price_scan:
+            rows = book_underlying == name
+            np.testing.assert_allclose(
+                risk_arrays[rows], span_risk_arrays(book.filter(rows), price_scan[name], vol_scan[name], 0.3), rtol=1e-12, atol=1e-12
+            )
+
+    def test_vol_scan_above_sigma(self):
+        # Down moves of the volatility are floored for positions with a volatility below the scan range
+        book = OptionBook([InstrumentType.BLACK_76_CALL, InstrumentType.BLACK_SCHOLES_PUT], 100.0, 95.0, 0.25, 0.01, [0.03, 0.2])
+        risk_arrays = span_risk_arrays(book, 0.05, 0.04)
+        assert np.isfinite(risk_arrays).all()
+        current = book.price()
+        floored = OptionBook([InstrumentType.BLACK_76_CALL, InstrumentType.BLACK_SCHOLES_PUT], 100.0, 95.0, 0.25, 0.01, [MIN_SHOCKED_SIGMA, 0.16])
+        np.testing.assert_allclose(risk_arrays[:, 1], -(floored.price() - current), rtol=1e-12, atol=1e-12)
+        margin = SpanMargin({"ES": 0.05}, {"ES": 0.04})
+        margin.add(book, "ES")
+        assert np.isfinite(margin.total())
+
+    def test_arg_assert(self):
+        book = make_book()
+        with pytest.raises(ValueError):
+            span_risk_arrays(book, 0.4, 0.04)
+        with pytest.raises(ValueError):
+            span_risk_arrays(book, 0.06, -0.04)
+        with pytest.raises(ValueError):
+            span_risk_arrays(book, 0.06, 0.04, extreme_cover=1.5)
+
+
+class TestSpanMargin:
+    def test_scanning_risk(self):
+        book = make_book()
+        margin = SpanMargin(price_scan, vol_scan)
+        margin.add(book, book_underlying)
+        scanning_risk = margin.scanning_risk()
+        assert set(scanning_risk) == set(price_scan)
+        for name in price_scan:
+            rows = book_underlying == name
+            # Positions on the same underlying offset each other
+            expected = span_risk_arrays(book.filter(rows), price_scan[name], vol_scan[name]).sum(axis=0)
+            np.testing.assert_allclose(margin.risk_arrays[name], expected, rtol=1e-12, atol=1e-10)
+            np.testing.assert_allclose(scanning_risk[name], max(expected.max(), 0.0), rtol=1e-12)
+        np.testing.assert_allclose(margin.total(), sum(scanning_risk.values()))
+
+    def test_check(self):
+        book = make_book()
+        margin = SpanMargin(price_scan, vol_scan)
+        margin.add(book[:150], book_underlying[:150])
+        before = margin.scanning_risk()
+        checked = margin.check(book[150:], book_underlying[150:])
+        # Checking does not add the positions
+        assert margin.scanning_risk() == before
+        margin.add(book[150:], book_underlying[150:])
+        for name, value in margin.scanning_risk().items():
+            np.testing.assert_allclose(checked[name], value, rtol=1e-12)
+        # A short call on a new underlying only adds its own scanning risk
+        margin = SpanMargin({"ES": 0.06, "CL": 0.1}, {"ES": 0.04, "CL": 0.05})
+        order = OptionBook(InstrumentType.BLACK_76_CALL, 80.0, 80.0, 0.25, 0.01, 0.3, quantity=-1.0)
+        checked = margin.check(order, "CL")
+        assert list(checked) == ["CL"] and checked["CL"] > 0.0
+
+    def test_invalid_nan(self):
+        S = book_S.copy()
+        S[10] = np.nan
+        book = OptionBook(book_kind, S, book_K, book_T, 0.01, book_sigma, 0.02, book_quantity, invalid="nan")
+        margin = SpanMargin(price_scan, vol_scan)
+        margin.add(book, book_underlying)
+        valid = np.arange(n_positions) != 10
+        expected = SpanMargin(price_scan, vol_scan)
+        expected.add(make_book().filter(valid), book_underlying[valid])
+        for name, value in expected.scanning_risk().items():
+            np.testing.assert_allclose(margin.scanning_risk()[name], value, rtol=1e-12)
+
+    def test_arg_assert(self):
+        with pytest.raises(ValueError):
+            SpanMargin({"ES": 0.06}, {"CL": 0.04})
+        with pytest.raises(ValueError):
+            SpanMargin({"ES": 0.06}, {"ES": 0.04}).add(make_book(), "CL")
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from blackscholes import (
+    BlackScholesCall,
+    BlackScholesPut,
+    ImpliedVolatilityStatus,
+    InputError,
+    Quote,
+    astream_quotes,
+    implied_volatility,
+    price_quotes,
+    stream_quotes,
+)
+
+# Random quotes with a spread around the mid price
+rng = np.random.default_rng(5)
+n_quotes = 300
+quotes_S = rng.uniform(50.0, 150.0, n_quotes)
+quotes_K = quotes_S * rng.uniform(0.8, 1.25, n_quotes)
+quotes_T = rng.uniform(0.1, 3.0, n_quotes)
+quotes_sigma = rng.uniform(0.1, 0.6, n_quotes)
+quotes_is_call = rng.random(n_quotes) < 0.5
+
+
+def make_quotes() -> list:
+    quotes = []
+    for S, K, T, sigma, is_call in zip(quotes_S, quotes_K, quotes_T, quotes_sigma, quotes_is_call):
+        price = (BlackScholesCall if is_call else BlackScholesPut)(S, K, T, 0.01, sigma, 0.02).price()
+        quotes.append(Quote(S, K, T, 0.01, price - 0.05, price + 0.05, bool(is_call), 0.02))
+    return quotes
+
+
+class TestStreamQuotes:
+    def test_matches_scalar(self):
+        quotes = make_quotes()
+        for quote, priced in zip(quotes, stream_quotes(quotes, ["delta", "vega"], batch_size=64)):
+            assert priced.quote is quote
+            expected = implied_volatility(priced.mid, quote.S, quote.K, quote.T, quote.r, quote.q, quote.is_call)
+            assert priced.status == expected.status == ImpliedVolatilityStatus.CONVERGED
+            np.testing.assert_allclose(priced.sigma, expected.sigma, rtol=1e-6)
+            option = (BlackScholesCall if quote.is_call else BlackScholesPut)(quote.S, quote.K, quote.T, quote.r, priced.sigma, quote.q)
+            np.testing.assert_allclose(priced.greeks["delta"], option.delta(), rtol=1e-10)
+            assert list(priced.greeks) == ["delta", "vega"]
+
+    def test_invalid_quotes(self):
+        quotes = [
+            Quote(55.0, 50.0, 1.0, 0.0025, 7.0, 7.1),
+            Quote(55.0, 50.0, 0.0, 0.0025, 7.0, 7.1),
+            # Mid price below the intrinsic value
+            Quote(55.0, 50.0, 1.0, 0.0025, 1.0, 1.1),
+        ]
+        valid, expired, below = price_quotes(quotes, ["delta"])
+        assert valid.status == ImpliedVolatilityStatus.CONVERGED and valid.errors == 0
+        assert expired.errors == InputError.NON_POSITIVE_T
+        assert below.status == ImpliedVolatilityStatus.BELOW_INTRINSIC
+        assert np.isnan([expired.sigma, expired.greeks["delta"], below.greeks["delta"]]).all()
+        assert price_quotes([]) == []
+
+    def test_max_latency(self):
+        def feed():
+            yield from make_quotes()[:3]
+            time.sleep(0.05)
+            yield from make_quotes()[3:5]
+
+        # The batch is flushed by the first quote after the latency has passed, so it holds 4 quotes
+        arrivals = []
+        for priced in stream_quotes(feed(), batch_size=100, max_latency=0.01):
+            arrivals.append(time.monotonic())
+        assert len(arrivals) == 5
+        assert arrivals[3] - arrivals[2] < 0.01
+
+    def test_async(self):
+        quotes = make_quotes()
+
+        async def feed():
+            for i, quote in enumerate(quotes[:6]):
+                if i == 3:
+                    await asyncio.sleep(0.2)
+                yield quote
+
+        async def collect(**kwargs):
+            start = time.monotonic()
+            return [(time.monotonic() - start, priced) async for priced in astream_quotes(feed(), **kwargs)]
+
+        # The first batch is flushed while the feed is quiet
+        results = asyncio.run(collect(batch_size=100, max_latency=0.02))
+        assert [priced.quote for _, priced in results] == quotes[:6]
+        assert results[2][0] < 0.15 and results[3][0] >= 0.2
+        # Without a latency limit the partial batch waits for the end of the feed
+        results = asyncio.run(collect(batch_size=100))
+        assert results[0][0] >= 0.2
+        expected = list(stream_quotes(quotes[:6]))
+        assert [priced.sigma for _, priced in results] == [priced.sigma for priced in expected]
+
+    def test_arg_assert(self):
+        with pytest.raises(AssertionError):
+            list(stream_quotes(make_quotes(), batch_size=0))
@@ -0,0 +1,159 @@
+import numpy as np
+import pytest
+
+from blackscholes import (
+    BlackScholesCall,
+    BlackScholesIronCondorLong,
+    BlackScholesPut,
+    BlackScholesStructure,
+    BlackScholesVectorized,
+)
+
+# Test parameters
+test_S = 55.0  # Asset price of 55
+test_T = 1.0  # 1 year to maturity
+test_r = 0.0025  # 0.25% risk-free rate
+test_sigma = 0.15  # 15% vol
+
+# Random structure with many legs
+rng = np.random.default_rng(3)
+n_legs = 1_000
+legs_quantity = rng.integers(-5, 6, n_legs)
+legs_K = rng.uniform(40.0, 70.0, n_legs)
+legs_T = rng.choice([0.25, 0.5, 1.0, 2.0], n_legs)
+legs_is_call = rng.random(n_legs) < 0.5
+
+
+class TestBlackScholesStructure:
+    def test_matches_preset(self):
+        structure = BlackScholesStructure(
+            S=test_S,
+            quantity=[-1, 1, 1, -1],
+            K=[20.0, 25.0, 45.0, 50.0],
+            T=test_T,
+            r=test_r,
+            sigma=test_sigma,
+            is_call=[False, False, True, True],
+        )
+        iron_condor = BlackScholesIronCondorLong(test_S, 20.0, 25.0, 45.0, 50.0, test_T, test_r, test_sigma)
+        assert structure.price() == iron_condor.price()
+        assert structure.get_all_greeks() == iron_condor.get_all_greeks()
+
+    def test_many_legs(self):
+        structure = BlackScholesStructure(
+            test_S, legs_quantity, legs_K, legs_T, test_r, test_sigma, q=0.01, is_call=legs_is_call
+        )
+        assert len(structure) == n_legs
+        legs = BlackScholesVectorized(test_S, legs_K, legs_T, test_r, test_sigma, 0.01, is_call=legs_is_call)
+        for method in ["price", "delta", "gamma", "vega", "theta", "vanna", "color"]:
+            np.testing.assert_allclose(
+                getattr(structure, method)(), np.sum(legs_quantity * getattr(legs, method)()), rtol=1e-10
+            )
+        expected = sum(
+            quantity * structure.leg(i).price() for i, quantity in enumerate(legs_quantity[:50])
+        )
+        head = BlackScholesStructure(
+            test_S, legs_quantity[:50], legs_K[:50], legs_T[:50], test_r, test_sigma, q=0.01, is_call=legs_is_call[:50]
+        )
+        np.testing.assert_allclose(head.price(), expected, rtol=1e-10)
+
+    def test_shared_intermediates(self):
+        structure = BlackScholesStructure(
+            test_S, [1, 1, -1], [50.0, 50.0, 60.0], [1.0, 1.0, 1.0], test_r, test_sigma, is_call=[True, False, True]
+        )
+        call, put, call_60 = structure._options
+        # Same strike and expiry share d1, the 3rd leg only shares the expiry terms
+        assert put._d1 is call._d1
+        assert call_60._discount_r is call._discount_r
+        assert call_60._d1 != call._d1
+        expected = sum(quantity * structure.leg(i).price() for i, quantity in enumerate([1, 1, -1]))
+        assert structure.price() == expected
+
+    def test_update(self):
+        iron_condor = BlackScholesIronCondorLong(test_S, 20.0, 25.0, 45.0, 50.0, test_T, test_r, test_sigma)
+        iron_condor.price()
+        iron_condor.update(S=50.0, sigma=0.2)
+        bumped = BlackScholesIronCondorLong(50.0, 20.0, 25.0, 45.0, 50.0, test_T, test_r, 0.2)
+        assert iron_condor.get_all_greeks() == bumped.get_all_greeks()
+        assert iron_condor.call1.S == 50.0
+
+        structure = BlackScholesStructure(test_S, [1, 1], 50.0, test_T, test_r, test_sigma, is_call=[True, False])
+        structure.update(T=[0.5, 0.25])
+        expected = BlackScholesStructure(test_S, [1, 1], 50.0, [0.5, 0.25], test_r, test_sigma, is_call=[True, False])
+        assert structure.price() == expected.price()
+
+        structure = BlackScholesStructure(test_S, legs_quantity, legs_K, legs_T, test_r, test_sigma, is_call=legs_is_call)
+        structure.price()
+        structure.update(S=60.0, T=legs_T / 2)
+        expected = BlackScholesStructure(60.0, legs_quantity, legs_K, legs_T / 2, test_r, test_sigma, is_call=legs_is_call)
+        np.testing.assert_allclose(structure.get_all_greeks()["delta"], expected.delta(), rtol=1e-12)
+
+        with pytest.raises(ValueError):
+            structure.update(K=50.0)
+        with pytest.raises(AssertionError):
+            structure.update(sigma=[0.1, 0.2])
+
+    def test_get_all_greeks(self):
+        structure = BlackScholesStructure(test_S, legs_quantity, legs_K, legs_T, test_r, test_sigma, is_call=legs_is_call)
+        all_greeks = structure.get_all_greeks()
+        assert list(all_greeks.keys()) == list(BlackScholesCall(test_S, 50.0, test_T, test_r, test_sigma).get_all_greeks())
+        for name, value in all_greeks.items():
+            assert isinstance(value, float)
+            np.testing.assert_allclose(value, getattr(structure, name)(), rtol=1e-10)
+        for name, value in structure.get_core_greeks().items():
+            np.testing.assert_allclose(value, all_greeks[name], rtol=1e-10)
+
+    def test_leg(self):
+        structure = BlackScholesStructure(test_S, [1, -2], [50.0, 60.0], [1.0, 0.5], test_r, test_sigma, is_call=[True, False])
+        call, put = structure.leg(0), structure.leg(1)
+        assert isinstance(call, BlackScholesCall)
+        assert isinstance(put, BlackScholesPut)
+        assert (put.K, put.T) == (60.0, 0.5)
+
+    def test_preset_legs_are_live(self):
+        iron_condor = BlackScholesIronCondorLong(test_S, 20.0, 25.0, 45.0, 50.0, test_T, test_r, test_sigma)
+        iron_condor.price()
+        assert iron_condor.call1 is iron_condor.call1
+        # Changing a leg changes the structure, and only that leg's intermediates are computed again
+        iron_condor.call1.update(S=60.0, sigma=0.3)
+        assert iron_condor.call1.S == 60.0
+        expected = (
+            -BlackScholesPut(test_S, 20.0, test_T, test_r, test_sigma).price()
+            + BlackScholesPut(test_S, 25.0, test_T, test_r, test_sigma).price()
+            + BlackScholesCall(60.0, 45.0, test_T, test_r, 0.3).price()
+            - BlackScholesCall(test_S, 50.0, test_T, test_r, test_sigma).price()
+        )
+        np.testing.assert_allclose(iron_condor.price(), expected, rtol=1e-12)
+        iron_condor.put2.sigma = 0.2
+        assert iron_condor.put2.price() == BlackScholesPut(test_S, 25.0, test_T, test_r, 0.2).price()
+        # Structure updates reach the legs as well
+        iron_condor.update(S=50.0)
+        assert iron_condor.call1.S == 50.0 and iron_condor.put1.S == 50.0
+        # leg() returns a copy
+        structure = BlackScholesStructure(test_S, [1, 1], 50.0, test_T, test_r, test_sigma, is_call=[True, False])
+        structure.leg(0).update(S=60.0)
+        assert structure.leg(0).S == test_S
+
+    def test_broadcasting(self):
+        # A single quantity, strike or expiry applies to every leg
+        structure = BlackScholesStructure(test_S, 1.0, 50.0, test_T, test_r, test_sigma, is_call=[True, False])
+        assert len(structure) == 2
+        structure = BlackScholesStructure(test_S, [1.0, 1.0], 50.0, test_T, test_r, test_sigma)
+        assert len(structure) == 2
+        np.testing.assert_allclose(structure.price(), 2 * BlackScholesCall(test_S, 50.0, test_T, test_r, test_sigma).price())
+
+    def test_arg_assert(self):
+        with pytest.raises(AssertionError):
+            BlackScholesStructure(test_S, [1.0, 1.0], [50.0, -1.0], test_T, test_r, test_sigma)
+        with pytest.raises(AssertionError):
+            BlackScholesStructure(test_S, [[1.0, 1.0]], 50.0, test_T, test_r, test_sigma)
+        # Structures with more than 16 legs raise a ValueError, also under python -O
+        with pytest.raises(ValueError):
+            BlackScholesStructure(test_S, legs_quantity, np.where(legs_is_call, legs_K, -1.0), legs_T, test_r, test_sigma)
+        structure = BlackScholesStructure(test_S, legs_quantity, legs_K, legs_T, test_r, test_sigma, is_call=legs_is_call)
+        assert structure._legs.valid.all()
+        with pytest.raises(ValueError):
+            structure.update(sigma=-0.1)
+        with pytest.raises(ValueError):
+            structure.update(T=np.where(legs_is_call, legs_T, np.nan))
+        np.testing.assert_allclose(structure.price(), np.dot(legs_quantity, structure._legs.price()), rtol=1e-12)
@@ -0,0 +1,444 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import blackscholes
+from blackscholes import (
+    BinaryCall,
+    BinaryCallVectorized,
+    BinaryPut,
+    BinaryPutVectorized,
+    BinaryVectorized,
+    Black76Call,
+    Black76CallVectorized,
+    Black76Put,
+    Black76PutVectorized,
+    Black76Vectorized,
+    BlackScholesCall,
+    BlackScholesCallVectorized,
+    BlackScholesPut,
+    BlackScholesPutVectorized,
+    BlackScholesVectorized,
+    InputError,
+    validate_inputs,
+)
+from blackscholes.vectorized import VectorizedStandardNormalMixin
+
+# Test parameters
+test_S = 55.0  # Asset price of 55
+test_K = 50.0  # Strike price of 50
+test_T = 1.0  # 1 year to maturity
+test_r = 0.0025  # 0.25% risk-free rate
+test_sigma = 0.15  # 15% vol
+
+# Random book of options to compare against the scalar classes
+rng = np.random.default_rng(42)
+n_options = 500
+book_S = rng.uniform(50.0, 150.0, n_options)
+book_K = book_S * rng.uniform(0.8, 1.25, n_options)
+book_T = rng.uniform(0.1, 3.0, n_options)
+book_r = rng.uniform(-0.01, 0.08, n_options)
+book_sigma = rng.uniform(0.1, 0.6, n_options)
+book_q = rng.uniform(0.0, 0.05, n_options)
+
+methods = ["price", "in_the_money"] + list(
+    BlackScholesCall(test_S, test_K, test_T, test_r, test_sigma).get_all_greeks().keys()
+)
+
+
+def scalar_values(option_cls, method: str) -> np.ndarray:
+    return np.array(
+        [
+            getattr(option_cls(S=S, K=K, T=T, r=r, sigma=sigma, q=q), method)()
+            for S, K, T, r, sigma, q in zip(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        ]
+    )
+
+
+class TestVectorizedStandardNormalMixin:
+    def test_cdf(self):
+        from scipy.stats import norm
+
+        x = np.linspace(-30.0, 10.0, 10_001)
+        np.testing.assert_allclose(VectorizedStandardNormalMixin._cdf(x), norm.cdf(x), rtol=1e-12)
+        np.testing.assert_allclose(VectorizedStandardNormalMixin._pdf(x), norm.pdf(x), rtol=1e-12)
+
+    def test_cdf_small_arrays(self):
+        from scipy.stats import norm
+
+        # Small arrays take the per-element path
+        x = np.array([[-35.0, -6.3, -0.5], [0.0, 1.2, 8.0]])
+        np.testing.assert_allclose(VectorizedStandardNormalMixin._cdf(x), norm.cdf(x), rtol=1e-12)
+        assert VectorizedStandardNormalMixin._cdf(0.5).shape == ()
+
+    def test_cdf_edge_cases(self):
+        cdf = VectorizedStandardNormalMixin._cdf(np.array([-np.inf, 0.0, np.inf, np.nan]))
+        np.testing.assert_array_equal(cdf[:3], [0.0, 0.5, 1.0])
+        assert np.isnan(cdf[3])
+
+    def test_cdf_fast_edge_cases(self):
+        cdf = VectorizedStandardNormalMixin._cdf(np.array([-np.inf, 0.0, np.inf, np.nan]), accuracy="fast")
+        np.testing.assert_allclose(cdf[:3], [0.0, 0.5, 1.0], atol=1e-8)
+        assert np.isnan(cdf[3])
+        assert VectorizedStandardNormalMixin._cdf(0.5, accuracy="fast").shape == ()
+
+
+class TestBlackScholesVectorized:
+    @pytest.mark.parametrize("method", methods)
+    def test_call_matches_scalar(self, method):
+        call = BlackScholesCallVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        np.testing.assert_allclose(
+            getattr(call, method)(), scalar_values(BlackScholesCall, method), rtol=1e-12, atol=1e-12
+        )
+
+    @pytest.mark.parametrize("method", methods)
+    def test_put_matches_scalar(self, method):
+        put = BlackScholesPutVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        np.testing.assert_allclose(
+            getattr(put, method)(), scalar_values(BlackScholesPut, method), rtol=1e-12, atol=1e-12
+        )
+
+    def test_mixed_flags(self):
+        is_call = np.arange(n_options) % 2 == 0
+        mixed = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=is_call)
+        call = BlackScholesCallVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        put = BlackScholesPutVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        for method in methods:
+            expected = np.where(is_call, getattr(call, method)(), getattr(put, method)())
+            np.testing.assert_array_equal(getattr(mixed, method)(), expected)
+
+    def test_broadcasting(self):
+        strikes = np.array([40.0, 50.0, 60.0])
+        vols = np.array([[0.1], [0.2]])
+        call = BlackScholesCallVectorized(S=test_S, K=strikes, T=test_T, r=test_r, sigma=vols)
+        assert call.price().shape == (2, 3)
+        assert call.gamma().shape == (2, 3)
+        np.testing.assert_allclose(
+            call.price()[1, 2],
+            BlackScholesCall(S=test_S, K=60.0, T=test_T, r=test_r, sigma=0.2).price(),
+            rtol=1e-12,
+        )
+
+    def test_arg_assert(self):
+        with pytest.raises(ValueError):
+            BlackScholesCallVectorized(S=[test_S, 0.0], K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        with pytest.raises(ValueError):
+            BlackScholesPutVectorized(S=test_S, K=test_K, T=test_T, r=test_r, sigma=[test_sigma, -0.1])
+
+    def test_update(self):
+        book = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=book_K > book_S)
+        book.price()
+        discount_r = book._discount_r
+        new_S = book_S * 1.01
+        book.update(S=new_S, sigma=0.2)
+        assert vars(book)["_discount_r"] is discount_r
+        expected = BlackScholesVectorized(new_S, book_K, book_T, book_r, 0.2, book_q, is_call=book_K > book_S)
+        np.testing.assert_array_equal(book.price(), expected.price())
+        assert book.sigma.shape == (n_options,)
+        with pytest.raises(ValueError):
+            book.update(S=-new_S)
+
+    def test_price_far_out_of_the_money(self):
+        # Reference prices evaluated with 50 digit arithmetic, see test_call.py and test_put.py
+        K = np.array([150.0, 80.0, 500.0, 20.0, 40.0, 5.0, test_K])
+        T = np.array([1.0, 0.01, 1.0, 1.0, 0.01, 1.0, test_T])
+        sigma = np.array([0.15, 0.15, 0.2, 0.15, 0.15, 0.2, test_sigma])
+        q = np.array([0.0, 0.0, 0.01, 0.0, 0.0, 0.01, 0.0])
+        is_call = np.array([True, True, True, False, False, False, True])
+        expected = [
+            2.4619000708521091e-11, 2.110445942614683e-139, 2.4485043473003019e-28,
+            4.8342776212146423e-12, 7.9914384185568425e-102, 8.5809742458916825e-34,
+            BlackScholesCall(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma).price(),
+        ]
+        book = BlackScholesVectorized(test_S, K, T, test_r, sigma, q, is_call=is_call)
+        np.testing.assert_allclose(book.price(), expected, rtol=1e-12)
+        assert np.ndim(BlackScholesCallVectorized(test_S, 150.0, test_T, test_r, test_sigma).price()) == 0
+
+    def test_accuracy_fast(self):
+        is_call = book_K > book_S
+        full = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=is_call)
+        fast = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=is_call, accuracy="fast")
+        assert full.accuracy == "full"
+        # Errors of both CDFs are scaled by S and K in the price
+        assert np.all(np.abs(fast.price() - full.price()) <= (book_S + book_K) * 7.5e-8)
+        np.testing.assert_allclose(fast.delta(), full.delta(), atol=7.5e-8)
+        np.testing.assert_array_equal(fast.gamma(), full.gamma())
+        # Cached CDF values depend on the accuracy, so it cannot change after construction
+        with pytest.raises(AttributeError):
+            full.accuracy = "fast"
+        assert full.accuracy == "full"
+        np.testing.assert_array_equal(full.price(), BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=is_call).price())
+        with pytest.raises(AssertionError):
+            BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, accuracy="exact")
+
+    def test_invalid_nan(self):
+        S = book_S.copy()
+        S[[3, 7]] = [0.0, np.nan]
+        sigma = book_sigma.copy()
+        sigma[7] = -0.2
+        book = BlackScholesVectorized(S, book_K, book_T, book_r, sigma, book_q, is_call=book_K > book_S, invalid="nan")
+        assert book.errors[3] == InputError.NON_POSITIVE_S
+        assert book.errors[7] == InputError.NOT_FINITE | InputError.NON_POSITIVE_SIGMA
+        np.testing.assert_array_equal(np.flatnonzero(~book.valid), [3, 7])
+        expected = BlackScholesVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=book_K > book_S)
+        for name, value in book.get_all_greeks().items():
+            assert np.isnan(value[[3, 7]]).all()
+            np.testing.assert_allclose(value[book.valid], getattr(expected, name)()[book.valid], rtol=1e-12)
+        # Updating with valid inputs makes the options valid again
+        book.update(S=book_S, sigma=book_sigma)
+        assert book.valid.all()
+        np.testing.assert_array_equal(book.price(), expected.price())
+        book.update(T=np.where(np.arange(n_options) == 5, -1.0, book_T))
+        np.testing.assert_array_equal(np.flatnonzero(~book.valid), [5])
+        with pytest.raises(AssertionError):
+            BlackScholesVectorized(S, book_K, book_T, book_r, book_sigma, invalid="ignore")
+
+    def test_invalid_raise_optimized(self):
+        # Invalid inputs raise a ValueError that names the first invalid option, also under python -O
+        code = (
+            "from blackscholes import BlackScholesVectorized, InstrumentType, OptionBook\n"
+            "for build in (lambda: BlackScholesVectorized([55.0, -5.0], 50.0, 1.0, 0.01, 0.2),\n"
+            "              lambda: OptionBook(InstrumentType.BINARY_PUT, 55.0, [50.0, 0.0], 1.0, 0.01, 0.2)):\n"
+            "    try:\n"
+            "        build()\n"
+            "    except ValueError as error:\n"
+            "        print(error)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(blackscholes.__file__)))
+        result = subprocess.run([sys.executable, "-O", "-c", code], capture_output=True, text=True, check=True, env=env)
+        lines = result.stdout.splitlines()
+        assert len(lines) == 2
+        assert "index 1: NON_POSITIVE_S" in lines[0]
+        assert "index 1: NON_POSITIVE_K" in lines[1]
+
+    def test_validate_inputs(self):
+        errors = validate_inputs(
+            S=[55.0, -1.0, np.inf, 55.0], K=test_K, T=[1.0, 1.0, 1.0, 0.0], r=[0.0, 0.0, 0.0, np.nan], sigma=0.2, q=[0.0, 0.0, -0.01, 0.0]
+        )
+        assert errors.dtype == np.uint8
+        np.testing.assert_array_equal(
+            errors,
+            [
+                InputError.NONE,
+                InputError.NON_POSITIVE_S,
+                InputError.NOT_FINITE | InputError.NEGATIVE_Q,
+                InputError.NON_POSITIVE_T | InputError.NOT_FINITE,
+            ],
+        )
+
+    def test_get_all_greeks(self):
+        call = BlackScholesCallVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        all_greeks = call.get_all_greeks()
+        assert set(all_greeks.keys()) == set(methods) - {"price", "in_the_money"}
+        assert all(value.shape == (n_options,) for value in all_greeks.values())
+
+    def test_all_greeks_fused(self):
+        put = BlackScholesPutVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        greeks = put.all_greeks()
+        for name, value in greeks._asdict().items():
+            np.testing.assert_allclose(value, getattr(put, name)(), rtol=1e-12)
+        # Far out of the money, lambda uses the tail-safe price as well
+        K = test_S * np.exp(np.linspace(-3.0, 3.0, 13))
+        options = BlackScholesVectorized(test_S, K, 0.5, test_r, test_sigma, is_call=K > test_S)
+        assert options.price().min() < 1e-100
+        np.testing.assert_allclose(options.all_greeks().lambda_greek, options.lambda_greek(), rtol=1e-12)
+
+    def test_get_greeks(self):
+        call = BlackScholesCallVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        greeks = call.get_greeks(["delta", "gamma", "vanna", "charm"])
+        assert list(greeks.keys()) == ["delta", "gamma", "vanna", "charm"]
+        for name, value in greeks.items():
+            np.testing.assert_allclose(value, scalar_values(BlackScholesCall, name), rtol=1e-12, atol=1e-12)
+        with pytest.raises(ValueError):
+            call.get_greeks(["forward"])
+
+
+black_76_methods = ["price"] + list(Black76Call(test_S, test_K, test_T, test_r, test_sigma).get_all_greeks().keys())
+
+
+def scalar_black_76_values(option_cls, method: str) -> np.ndarray:
+    return np.array(
+        [
+            getattr(option_cls(F=F, K=K, T=T, r=r, sigma=sigma), method)()
+            for F, K, T, r, sigma in zip(book_S, book_K, book_T, book_r, book_sigma)
+        ]
+    )
+
+
+class TestBlack76Vectorized:
+    def test_price_far_out_of_the_money(self):
+        # Reference prices evaluated with 50 digit arithmetic, see test_call.py and test_put.py
+        book = Black76Vectorized(
+            test_S, [150.0, 80.0, 20.0, 40.0], [1.0, 0.01, 1.0, 0.01], test_r, test_sigma, is_call=[True, True, False, False]
+        )
+        expected = [2.1894406134192217e-11, 2.024095114054087e-139, 5.4285616951288668e-12, 8.2804671113196635e-102]
+        np.testing.assert_allclose(book.price(), expected, rtol=1e-12)
+
+    @pytest.mark.parametrize("method", black_76_methods)
+    def test_call_matches_scalar(self, method):
+        call = Black76CallVectorized(book_S, book_K, book_T, book_r, book_sigma)
+        np.testing.assert_allclose(
+            getattr(call, method)(), scalar_black_76_values(Black76Call, method), rtol=1e-12, atol=1e-12
+        )
+
+    @pytest.mark.parametrize("method", black_76_methods)
+    def test_put_matches_scalar(self, method):
+        put = Black76PutVectorized(book_S, book_K, book_T, book_r, book_sigma)
+        np.testing.assert_allclose(
+            getattr(put, method)(), scalar_black_76_values(Black76Put, method), rtol=1e-12, atol=1e-12
+        )
+
+    def test_mixed_flags(self):
+        is_call = np.arange(n_options) % 2 == 0
+        mixed = Black76Vectorized(book_S, book_K, book_T, book_r, book_sigma, is_call=is_call)
+        call = Black76CallVectorized(book_S, book_K, book_T, book_r, book_sigma)
+        put = Black76PutVectorized(book_S, book_K, book_T, book_r, book_sigma)
+        for method in black_76_methods:
+            expected = np.where(is_call, getattr(call, method)(), getattr(put, method)())
+            np.testing.assert_array_equal(getattr(mixed, method)(), expected)
+
+    def test_broadcasting(self):
+        strikes = np.array([40.0, 50.0, 60.0])
+        vols = np.array([[0.1], [0.2]])
+        put = Black76PutVectorized(F=test_S, K=strikes, T=test_T, r=test_r, sigma=vols)
+        assert put.price().shape == (2, 3)
+        assert put.color().shape == (2, 3)
+
+    def test_arg_assert(self):
+        with pytest.raises(ValueError):
+            Black76CallVectorized(F=[test_S, 0.0], K=test_K, T=test_T, r=test_r, sigma=test_sigma)
+        put = Black76PutVectorized(F=[test_S, 0.0], K=test_K, T=test_T, r=test_r, sigma=test_sigma, invalid="nan")
+        np.testing.assert_array_equal(put.errors, [InputError.NONE, InputError.NON_POSITIVE_S])
+        assert np.isnan(put.price()[1]) and put.price()[0] > 0.0
+
+    def test_all_greeks_fused(self):
+        is_call = np.arange(n_options) % 3 == 0
+        book = Black76Vectorized(book_S, book_K, book_T, book_r, book_sigma, is_call=is_call)
+        greeks = book.all_greeks()
+        for name, value in greeks._asdict().items():
+            np.testing.assert_allclose(value, getattr(book, name)(), rtol=1e-12)
+        K = test_S * np.exp(np.linspace(-3.0, 3.0, 13))
+        futures = Black76Vectorized(test_S, K, 0.5, test_r, test_sigma, is_call=K > test_S)
+        greeks = futures.all_greeks()
+        for name in ("theta", "rho"):
+            np.testing.assert_allclose(getattr(greeks, name), getattr(futures, name)(), rtol=1e-12)
+        greeks = book.get_greeks(["delta", "speed", "ultima"])
+        assert list(greeks.keys()) == ["delta", "speed", "ultima"]
+
+
+binary_methods = ["price", "forward", "delta", "gamma", "vega", "theta", "rho"]
+
+
+class TestBinaryVectorized:
+    @pytest.mark.parametrize("method", binary_methods)
+    def test_call_matches_scalar(self, method):
+        call = BinaryCallVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        np.testing.assert_allclose(
+            getattr(call, method)(), scalar_values(BinaryCall, method), rtol=1e-12, atol=1e-12
+        )
+
+    @pytest.mark.parametrize("method", binary_methods)
+    def test_put_matches_scalar(self, method):
+        put = BinaryPutVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        np.testing.assert_allclose(
+            getattr(put, method)(), scalar_values(BinaryPut, method), rtol=1e-12, atol=1e-12
+        )
+
+    def test_mixed_flags(self):
+        is_call = np.arange(n_options) % 2 == 0
+        mixed = BinaryVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=is_call)
+        call = BinaryCallVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        put = BinaryPutVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q)
+        for method in binary_methods:
+            expected = np.where(is_call, getattr(call, method)(), getattr(put, method)())
+            np.testing.assert_array_equal(getattr(mixed, method)(), expected)
+        # A binary call and put on the same strike pay out 1 together
+        np.testing.assert_allclose(call.forward() + put.forward(), 1.0, rtol=1e-15)
+
+    def test_finite_differences(self):
+        # Greeks of mixed calls and puts with dividend yields against central finite differences
+        h = 1e-5
+        is_call = np.arange(n_options) % 2 == 0
+        params = dict(S=book_S, K=book_K, T=book_T, r=book_r, sigma=book_sigma, q=book_q + 0.01, is_call=is_call)
+        book = BinaryVectorized(**params)
+
+        def bump(greek: str, name: str, step: np.ndarray) -> np.ndarray:
+            up = BinaryVectorized(**{**params, name: params[name] + step})
+            down = BinaryVectorized(**{**params, name: params[name] - step})
+            return (getattr(up, greek)() - getattr(down, greek)()) / (2 * step)
+
+        np.testing.assert_allclose(book.delta(), bump("price", "S", h * book_S), rtol=1e-5, atol=1e-9)
+        np.testing.assert_allclose(book.gamma(), bump("delta", "S", h * book_S), rtol=1e-5, atol=1e-9)
+        np.testing.assert_allclose(book.vega(), bump("price", "sigma", h), rtol=1e-5, atol=1e-9)
+        np.testing.assert_allclose(book.theta(), -bump("price", "T", h), rtol=1e-5, atol=1e-9)
+        np.testing.assert_allclose(book.rho(), bump("price", "r", h), rtol=1e-5, atol=1e-9)
+
+    def test_dividend_yield(self):
+        call = BinaryCallVectorized(test_S, test_K, test_T, test_r, test_sigma, q=[0.0, 0.05])
+        price = call.price()
+        np.testing.assert_allclose(price[0], BinaryCall(test_S, test_K, test_T, test_r, test_sigma).price(), rtol=1e-12)
+        assert price[1] < price[0]
+
+    def test_arg_assert(self):
+        with pytest.raises(ValueError):
+            BinaryCallVectorized(S=test_S, K=[test_K, -1.0], T=test_T, r=test_r, sigma=test_sigma)
+        with pytest.raises(ValueError):
+            BinaryPutVectorized(S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=-0.01)
+
+    def test_get_greeks(self):
+        book = BinaryVectorized(book_S, book_K, book_T, book_r, book_sigma, book_q, is_call=book_K > book_S)
+        greeks = book.get_greeks(["price", "delta"])
+        np.testing.assert_array_equal(greeks["delta"], book.delta())
+        with pytest.raises(ValueError):
+            book.get_greeks(["vanna"])
+
+
+class TestFloat32:
+    # Wide book: short and long expiries, low and high volatilities, far from the money
+    rng = np.random.default_rng(3)
+    n = 100_000
+    S = rng.uniform(1.0, 1_000.0, n)
+    K = S * np.exp(rng.uniform(-1.0, 1.0, n))
+    T = rng.uniform(1.0 / 365.0, 5.0, n)
+    r = rng.uniform(-0.01, 0.1, n)
+    sigma = rng.uniform(0.05, 1.5, n)
+    q = rng.uniform(0.0, 0.05, n)
+    is_call = rng.random(n) < 0.5
+    names = ["price", "delta", "gamma", "vega", "theta", "rho"]
+
+    def error_bounds(self):
+        """Documented absolute errors of float32 results, see docs/9.vectorized.md."""
+        sqrt_T = np.sqrt(self.T)
+        return {
+            "price": 1e-6 * self.S,
+            "delta": 5e-6,
+            "gamma": 5e-6 / (self.S * self.sigma * sqrt_T),
+            "vega": 5e-6 * self.S * sqrt_T,
+            "theta": 5e-6 * self.S * self.sigma / sqrt_T,
+            "rho": 5e-6 * (self.S + self.K) * self.T,
+        }
+
+    @pytest.mark.parametrize("engine", [BlackScholesVectorized, Black76Vectorized])
+    def test_error_bounds(self, engine):
+        inputs = (self.S, self.K, self.T, self.r, self.sigma) + ((self.q,) if engine is BlackScholesVectorized else ())
+        expected = engine(*inputs, is_call=self.is_call).get_greeks(self.names)
+        options = engine(*inputs, is_call=self.is_call, dtype=np.float32)
+        assert all(value.dtype == np.float32 for value in (options.K, options.T, options.sigma))
+        for name, value in options.get_greeks(self.names).items():
+            assert value.dtype == np.float32
+            assert np.all(np.abs(value - expected[name]) <= self.error_bounds()[name]), name
+
+    def test_dtype_preserved(self):
+        options = BlackScholesVectorized([55.0, 0.0], test_K, test_T, test_r, test_sigma, is_call=[True, False], invalid="nan", dtype=np.float32)
+        assert np.isnan(options.price()[1])
+        options.update(S=[56.0, 57.0])
+        assert options.S.dtype == np.float32
+        for value in options.get_all_greeks().values():
+            assert value.dtype == np.float32
+        assert BlackScholesCallVectorized(test_S, test_K, test_T, test_r, test_sigma, dtype="float32").price().dtype == np.float32
+        assert BinaryVectorized(test_S, test_K, test_T, test_r, test_sigma, dtype=np.float32).price().dtype == np.float32
+        with pytest.raises(AssertionError):
+            BlackScholesVectorized(test_S, test_K, test_T, test_r, test_sigma, dtype=np.float16)